@@ -130,12 +130,14 @@ class AnalysisManager:
                 self._stop_watchdog()
                 
                 if project_path in database:
-                    database[project_path]["categories"] = cats
-                    database[project_path]["tags"] = tags
-                    database[project_path]["analyzed"] = True
-                    database[project_path]["analyzed_model"] = (
-                        self.ollama.active_models.get("text_quality", "fallback"))
-                    self.db_manager.save_database()
+                    self.db_manager.update_project(
+                        project_path,
+                        categories=cats,
+                        tags=tags,
+                        analyzed=True,
+                        analyzed_model=self.ollama.active_models.get("text_quality", "fallback"),
+                    )
+                    self.db_manager.commit()
                 
                 if self.on_complete:
                     self.on_complete(1, 0)
@@ -224,17 +226,19 @@ class AnalysisManager:
                         # Determina modelo usado
                         role = "text_fast" if batch_size > FAST_MODEL_THRESHOLD else "text_quality"
                         
-                        database[project_path]["categories"] = cats
-                        database[project_path]["tags"] = tags
-                        database[project_path]["analyzed"] = True
-                        database[project_path]["analyzed_model"] = \
-                            self.ollama.active_models.get(role, "fallback")
+                        self.db_manager.update_project(
+                            project_path,
+                            categories=cats,
+                            tags=tags,
+                            analyzed=True,
+                            analyzed_model=self.ollama.active_models.get(role, "fallback"),
+                        )
                     
                     done += 1
                     
-                    # Auto-save a cada 10 projetos
+                    # Auto-save a cada 10 projetos (journal incremental)
                     if done % 10 == 0:
-                        self.db_manager.save_database()
+                        self.db_manager.commit()
                         self.logger.info("Auto-save: %d/%d projetos", done, total)
                 
                 except Exception as e:
@@ -246,7 +250,7 @@ class AnalysisManager:
             self._stop_watchdog()
             
             # Save final
-            self.db_manager.save_database()
+            self.db_manager.commit()
             
             # Notifica conclusão
             if self.on_complete:
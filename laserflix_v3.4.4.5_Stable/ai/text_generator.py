@@ -7,6 +7,7 @@ HOT-11: FIX CRÍTICO - Prompt exige 10+ categorias (não 3-5)
 import os
 import re
 from config.settings import FAST_MODEL_THRESHOLD
+from core.cover_resolver import find_first_image
 from utils.logging_setup import LOGGER
 
 
@@ -29,6 +30,10 @@ class TextGenerator:
         self.scanner = project_scanner
         self.fallback = fallback_generator
         self.logger = LOGGER
+        # core.cover_resolver.CoverResolver (opcional) — capa cacheada no registro
+        self.cover_resolver = None
+        # core.structure_resolver.StructureResolver (opcional) — estrutura cacheada no registro
+        self.structure_resolver = None
 
     def _choose_model_role(self, batch_size=1):
         """
@@ -58,7 +63,7 @@ class TextGenerator:
         """
         try:
             name = os.path.basename(project_path)
-            structure = self.scanner.analyze_project_structure(project_path)
+            structure = self._get_structure(project_path, {})
 
             # Prepara contexto de tipos de arquivo
             file_types_str = ", ".join(
@@ -384,22 +389,20 @@ Tags: [tag1], [tag2], [tag3], [tag4], [tag5], [tag6], [tag7], [tag8], [tag9], [t
 
     def _get_structure(self, project_path, project_data):
         """Retorna estrutura do projeto (do cache ou analisa ao vivo)."""
+        if self.structure_resolver:
+            structure = self.structure_resolver.resolve(project_path)
+            if structure:
+                return structure
         return (
             project_data.get("structure")
             or self.scanner.analyze_project_structure(project_path)
         )
 
     def _find_first_image(self, project_path):
-        """Encontra primeira imagem no projeto."""
-        from config.constants import FILE_EXTENSIONS
-        valid_extensions = FILE_EXTENSIONS["images"]
-        try:
-            for item in os.listdir(project_path):
-                if item.lower().endswith(valid_extensions):
-                    return os.path.join(project_path, item)
-        except Exception:
-            pass
-        return None
+        """Encontra a capa do projeto (mesma regra dos thumbnails/modal)."""
+        if self.cover_resolver:
+            return self.cover_resolver.resolve(project_path)
+        return find_first_image(project_path)
 
     def _clean_name(self, raw_name):
         """Limpa nome do projeto removendo extensões e códigos."""
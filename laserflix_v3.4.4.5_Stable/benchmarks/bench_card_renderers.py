@@ -0,0 +1,123 @@
+"""
+benchmarks/bench_card_renderers.py — Tempo de render de uma página de cards.
+
+Compara, para páginas de 36 projetos sintéticos:
+    widgets (novos)   → ProjectCard criado do zero por card (build_card)
+    widgets (pool)    → ProjectCard reciclado: só update(path, data)
+    canvas            → CanvasCardGrid.render() (itens no canvas)
+
+Cada medida inclui update_idletasks() (geometry management + redraw).
+Precisa de display (Tk real); em máquina sem X use xvfb-run.
+
+Uso:
+    python benchmarks/bench_card_renderers.py [paginas]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import tkinter as tk
+
+from config.card_layout import COLS, CARD_PAD
+from bench_sqlite_store import make_database
+from ui.canvas_card_grid import CanvasCardGrid
+from ui.project_card import ProjectCard, build_card
+
+PAGE = 36
+
+
+def noop(*_args, **_kwargs):
+    return None
+
+
+def make_callbacks() -> dict:
+    cb = {key: noop for key in (
+        "on_open_modal", "on_toggle_favorite", "on_toggle_done", "on_toggle_good",
+        "on_toggle_bad", "on_analyze_single", "on_open_folder", "on_set_category",
+        "on_set_tag", "on_set_origin", "on_set_collection", "on_toggle_select",
+        "on_add_to_collection", "on_remove_from_collection", "on_new_collection_with",
+    )}
+    cb.update({
+        "selection_mode": False,
+        "selected_paths": set(),
+        "get_collections": lambda: ["Natal", "Casamento"],
+        "get_project_collections": lambda p: ["Natal"] if hash(p) % 3 == 0 else [],
+    })
+    return cb
+
+
+def timed(root, fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    root.update_idletasks()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"Sem display para o Tk ({e}); rode com xvfb-run.")
+    root.geometry("1700x1000")
+    canvas = tk.Canvas(root, bg="#141414", highlightthickness=0)
+    canvas.pack(fill="both", expand=True)
+    frame = tk.Frame(canvas)
+    canvas.create_window((0, 0), window=frame, anchor="nw")
+    root.update()
+
+    database = make_database(PAGE * pages)
+    items = list(database.items())
+    page_items = [items[i * PAGE:(i + 1) * PAGE] for i in range(pages)]
+    cb = make_callbacks()
+
+    def widgets_fresh(page):
+        for w in frame.winfo_children():
+            w.destroy()
+        for i, (path, data) in enumerate(page):
+            build_card(frame, path, data, cb, i // COLS, i % COLS)
+
+    pool = []
+
+    def widgets_pool(page):
+        for i, (path, data) in enumerate(page):
+            if i == len(pool):
+                pool.append(ProjectCard(frame, cb))
+            pool[i].update(path, data)
+            pool[i].frame.grid(row=i // COLS, column=i % COLS, padx=CARD_PAD, pady=CARD_PAD, sticky="n")
+
+    grid = CanvasCardGrid(canvas)
+
+    results = {}
+    for label, fn, before in (
+        ("widgets (novos)", widgets_fresh, None),
+        ("widgets (pool)", widgets_pool, None),
+        ("canvas", lambda page: grid.render(page, cb, 0),
+         lambda: [w.destroy() for w in frame.winfo_children()]),
+    ):
+        if before:
+            before()
+        times = [timed(root, lambda p=page: fn(p)) for page in page_items]
+        results[label] = times
+        if label == "canvas":
+            items_per_page = len(canvas.find_withtag("gridcard"))
+    widgets_per_page = sum(1 for _ in _walk(pool[0].frame)) * PAGE if pool else 0
+
+    print(f"{pages} páginas de {PAGE} cards, ms por página (1ª página / média das demais)")
+    for label, times in results.items():
+        rest = times[1:] or times
+        print(f"{label:18}{times[0]:10.1f}{sum(rest) / len(rest):10.1f}")
+    print(f"widgets por página: ~{widgets_per_page}   itens de canvas por página: {items_per_page}")
+    root.destroy()
+
+
+def _walk(widget):
+    yield widget
+    for child in widget.winfo_children():
+        yield from _walk(child)
+
+
+if __name__ == "__main__":
+    main()
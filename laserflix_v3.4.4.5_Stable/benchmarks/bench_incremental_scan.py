@@ -0,0 +1,124 @@
+"""
+benchmarks/bench_incremental_scan.py — Scan completo vs rescan incremental.
+
+Gera uma árvore sintética (origem/categoria/produto, ~50k pastas por
+padrão) e mede o RecursiveScanner (modo híbrido):
+    - scan completo sem snapshot
+    - 1º scan com snapshot (lista tudo e grava a referência)
+    - rescan sem mudanças (produtos não são abertos; só pastas intermediárias)
+    - rescan após adicionar/remover alguns produtos (delta)
+
+Os mtimes da árvore são recuados 1 min para não caírem na janela de
+SCAN_SNAPSHOT_RACY_S (pastas "recentes demais" são sempre relistadas).
+
+Em disco local o tempo é dominado por Python (montar a lista de produtos);
+o ganho real é em listagens de pasta, cada uma várias idas e voltas num
+NAS/SMB. --nas-ms=N simula essa latência por listagem (modelo Windows/SMB,
+onde o stat do DirEntry vem junto com a listagem).
+
+Uso:
+    python benchmarks/bench_incremental_scan.py [50000] [--nas-ms=2]
+"""
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from utils.logging_setup import LOGGER
+from utils.recursive_scanner import RecursiveScanner
+from utils.scan_snapshot import ScanSnapshot
+
+ORIGINS = 10
+CATEGORIES = 50  # por origem
+
+
+def make_tree(base: str, products: int) -> None:
+    per_category = max(1, products // (ORIGINS * CATEGORIES))
+    past = time.time() - 60
+    for o in range(ORIGINS):
+        origin = os.path.join(base, f"origem_{o:02d}")
+        for c in range(CATEGORIES):
+            category = os.path.join(origin, f"categoria_{c:03d}")
+            for p in range(per_category):
+                product = os.path.join(category, f"produto_{p:04d}")
+                os.makedirs(product)
+                marker = "folder.jpg" if p % 3 else "modelo.svg"
+                open(os.path.join(product, marker), "wb").close()
+                os.utime(product, (past, past))
+            os.utime(category, (past, past))
+        os.utime(origin, (past, past))
+    os.utime(base, (past, past))
+
+
+_listings = [0]
+_latency_s = [0.0]
+_scandir = os.scandir
+
+
+def _counting_scandir(path):
+    _listings[0] += 1
+    if _latency_s[0]:
+        time.sleep(_latency_s[0])
+    return _scandir(path)
+
+
+def timed(fn):
+    """(ms, resultado, listagens de pasta feitas)."""
+    _listings[0] = 0
+    t0 = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - t0) * 1000, result, _listings[0]
+
+
+def run(products: int) -> None:
+    tmp = tempfile.mkdtemp(prefix="laserflix_bench_scan_")
+    try:
+        base = os.path.join(tmp, "biblioteca")
+        t0 = time.perf_counter()
+        make_tree(base, products)
+        print(f"Árvore: {products} produtos criados em {time.perf_counter() - t0:.1f}s")
+
+        plain = RecursiveScanner()
+        full_ms, full, full_ls = timed(lambda: plain.scan_folders_hybrid(base))
+        print(f"  scan completo (sem snapshot) : {full_ms:9.1f} ms  {full_ls:6d} listagens  "
+              f"({len(full)} produtos, {plain.get_stats()['total_scanned']} pastas)")
+
+        scanner = RecursiveScanner(snapshot=ScanSnapshot(os.path.join(tmp, "snapshot.json")))
+        first_ms, _, first_ls = timed(lambda: scanner.scan_folders_hybrid(base))
+        print(f"  1º scan com snapshot         : {first_ms:9.1f} ms  {first_ls:6d} listagens")
+
+        again_ms, again, again_ls = timed(lambda: scanner.scan_folders_hybrid(base))
+        assert again == full, "rescan divergiu do scan completo"
+        print(f"  rescan sem mudanças          : {again_ms:9.1f} ms  {again_ls:6d} listagens  "
+              f"({scanner.get_stats()['reused_products']} produtos sem abrir, "
+              f"{full_ms / again_ms:.1f}x mais rápido)")
+
+        category = os.path.join(base, "origem_03", "categoria_007")
+        for i in range(5):
+            novo = os.path.join(category, f"novo_{i}")
+            os.makedirs(novo)
+            open(os.path.join(novo, "folder.jpg"), "wb").close()
+        shutil.rmtree(os.path.join(base, "origem_05", "categoria_010", "produto_0000"))
+        delta_ms, after, delta_ls = timed(lambda: scanner.scan_folders_hybrid(base))
+        delta = scanner.last_delta
+        assert after == RecursiveScanner().scan_folders_hybrid(base), "delta divergiu do scan completo"
+        print(f"  rescan após +5/-1 produtos   : {delta_ms:9.1f} ms  {delta_ls:6d} listagens  "
+              f"(+{len(delta['added'])} / -{len(delta['removed'])} / ~{len(delta['changed'])})")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    LOGGER.setLevel(logging.WARNING)
+    os.scandir = _counting_scandir  # conta listagens (custo dominante em NAS)
+    args = sys.argv[1:]
+    for arg in args:
+        if arg.startswith("--nas-ms="):
+            _latency_s[0] = float(arg.split("=", 1)[1]) / 1000
+    counts = [int(a) for a in args if not a.startswith("--")] or [50000]
+    for n in counts:
+        run(n)
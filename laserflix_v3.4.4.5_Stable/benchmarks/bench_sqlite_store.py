@@ -0,0 +1,108 @@
+"""
+benchmarks/bench_sqlite_store.py — JSON dict vs SQLite (carga e filtro).
+
+Gera bancos sintéticos de 10k/50k/100k projetos e mede:
+    - carga: json.load() do arquivo inteiro vs abertura do SQLite
+    - filtro: varredura Python (DisplayController) vs query_paths() (SQL)
+
+Uso:
+    python benchmarks/bench_sqlite_store.py [10000 50000 100000]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.sqlite_store import SQLiteProjectDict, SQLiteProjectStore, migrate_json_to_sqlite
+from ui.controllers.display_controller import DisplayController
+
+ORIGINS = ["Creative Fabrica", "Etsy", "Diversos", "CGTrader", "Design Bundles"]
+CATEGORIES = ["Natal", "Páscoa", "Casamento", "Infantil", "Decoração", "Cozinha", "Pets"]
+TAGS = ["mdf", "3mm", "caixa", "luminária", "porta-retrato", "topo de bolo", "chaveiro"]
+
+
+def make_database(n: int) -> dict:
+    rnd = random.Random(42)
+    db = {}
+    for i in range(n):
+        path = f"D:/Projetos/{rnd.choice(ORIGINS)}/projeto_{i:06d}"
+        db[path] = {
+            "name": f"Project {i:06d} {rnd.choice(TAGS)}",
+            "origin": rnd.choice(ORIGINS),
+            "favorite": rnd.random() < 0.1,
+            "done": rnd.random() < 0.2,
+            "good": rnd.random() < 0.1,
+            "bad": rnd.random() < 0.05,
+            "categories": rnd.sample(CATEGORIES, 2),
+            "tags": rnd.sample(TAGS, 3),
+            "analyzed": rnd.random() < 0.6,
+            "analysis_type": rnd.choice(["ai", "fallback"]),
+            "added_date": f"2025-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}T10:00:00",
+        }
+    return db
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Menor tempo (ms) entre `repeat` execuções."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def configure(ctrl: DisplayController) -> None:
+    ctrl.current_filter = "favorite"
+    ctrl.active_filters = [
+        {"type": "category", "value": "Natal"},
+        {"type": "origin", "value": "Etsy"},
+    ]
+    ctrl.current_sort = "name_asc"
+
+
+def run(n: int, workdir: str) -> None:
+    json_path = os.path.join(workdir, f"db_{n}.json")
+    sqlite_path = os.path.join(workdir, f"db_{n}.sqlite3")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(make_database(n), f, ensure_ascii=False)
+    t0 = time.perf_counter()
+    migrate_json_to_sqlite(json_path, sqlite_path)
+    migrate_ms = (time.perf_counter() - t0) * 1000
+
+    def load_json():
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    load_json_ms = timed(load_json, repeat=3)
+    load_sqlite_ms = timed(lambda: SQLiteProjectStore(sqlite_path).close(), repeat=3)
+
+    json_ctrl = DisplayController(load_json())
+    configure(json_ctrl)
+    store = SQLiteProjectStore(sqlite_path)
+    sql_ctrl = DisplayController(SQLiteProjectDict(store))
+    configure(sql_ctrl)
+
+    assert json_ctrl.get_sorted_paths() == sql_ctrl.get_sorted_paths()
+    filter_json_ms = timed(json_ctrl.get_sorted_paths)
+    filter_sql_ms = timed(sql_ctrl.get_sorted_paths)
+    store.close()
+
+    print(f"{n:>7} | migrar {migrate_ms:8.0f} ms | "
+          f"carga json {load_json_ms:7.1f} ms  sqlite {load_sqlite_ms:6.1f} ms | "
+          f"filtro python {filter_json_ms:7.1f} ms  sql {filter_sql_ms:6.1f} ms")
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 50_000, 100_000]
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            run(n, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+benchmarks/bench_thumbnail_decode.py — Latência por thumbnail (decode + resize).
+
+Gera uma pasta sintética de capas mistas (JPEG/PNG/WebP, até 4000px) e
+compara, por formato:
+    antigo  → Image.open() + thumbnail(THUMBNAIL_SIZE, LANCZOS)
+    novo    → decode_thumbnail() com cada filtro (draft / reduce + resample)
+    disco   → hit no ThumbnailDiskCache (thumb já redimensionada)
+
+Uso:
+    python benchmarks/bench_thumbnail_decode.py [covers_por_formato]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PIL import Image, ImageDraw
+
+from config.settings import THUMBNAIL_SIZE, THUMBNAIL_REDUCING_GAP
+from core.thumbnail_disk_cache import ThumbnailDiskCache
+from utils.image_decode import decode_thumbnail
+
+SIZES = [(4000, 3000), (3000, 3000), (2400, 1600), (1200, 900)]
+FORMATS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+
+
+def make_cover(size, seed: int) -> Image.Image:
+    """Capa com textura suave e formas (comprime como foto de mockup)."""
+    rnd = random.Random(seed)
+    small = (size[0] // 16, size[1] // 16)
+    img = Image.effect_noise(small, 60).convert("RGB").resize(size, Image.Resampling.BILINEAR)
+    draw = ImageDraw.Draw(img)
+    for _ in range(25):
+        x0, y0 = rnd.randrange(size[0]), rnd.randrange(size[1])
+        x1, y1 = x0 + rnd.randrange(size[0] // 2), y0 + rnd.randrange(size[1] // 2)
+        draw.ellipse((x0, y0, x1, y1), fill=tuple(rnd.randrange(256) for _ in range(3)))
+    return img
+
+
+def make_covers(folder: str, per_format: int) -> dict:
+    covers = {fmt: [] for fmt in FORMATS}
+    for fmt, ext in FORMATS.items():
+        for i in range(per_format):
+            path = os.path.join(folder, f"cover_{i:03d}{ext}")
+            make_cover(SIZES[i % len(SIZES)], i).save(path, fmt)
+            covers[fmt].append(path)
+    return covers
+
+
+def legacy(path: str):
+    img = Image.open(path)
+    img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    return img
+
+
+def per_thumb_ms(fn, paths, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for p in paths:
+            fn(p)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(paths) * 1000
+
+
+def main():
+    per_format = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    with tempfile.TemporaryDirectory() as folder:
+        covers = make_covers(folder, per_format)
+        variants = [("antigo (LANCZOS)", legacy)] + [
+            (f"novo {name}", lambda p, n=name: decode_thumbnail(
+                p, THUMBNAIL_SIZE, n, THUMBNAIL_REDUCING_GAP))
+            for name in ("bilinear", "bicubic", "lanczos")
+        ]
+        disk = ThumbnailDiskCache(os.path.join(folder, "thumbs"), 1 << 30, THUMBNAIL_SIZE)
+        for paths in covers.values():
+            for p in paths:
+                disk.store(p, decode_thumbnail(p, THUMBNAIL_SIZE))
+        variants.append(("disco (hit)", disk.load))
+
+        print(f"{per_format} capas por formato, alvo {THUMBNAIL_SIZE}, ms por thumb")
+        print(f"{'':18}" + "".join(f"{fmt:>10}" for fmt in FORMATS))
+        for label, fn in variants:
+            row = "".join(f"{per_thumb_ms(fn, covers[fmt]):10.1f}" for fmt in FORMATS)
+            print(f"{label:18}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,19 @@ DB_FILE = "laserflix_database.json"
 BACKUP_FOLDER = "laserflix_backups"
 LOG_FILE = "laserflix.log"
 
+# ============================================================================
+# JOURNAL DO DATABASE (WRITE-AHEAD LOG)
+# ============================================================================
+DB_JOURNAL_ENABLED = True
+DB_JOURNAL_FILE = "laserflix_database.journal"
+DB_JOURNAL_COMPACT_THRESHOLD = 500  # registros antes de regravar o snapshot
+
+# ============================================================================
+# BACKEND DO DATABASE
+# ============================================================================
+DB_BACKEND = "json"  # "json" (padrão) | "sqlite" (índices, carga sob demanda)
+SQLITE_DB_FILE = "laserflix_database.sqlite3"
+
 # ============================================================================
 # CONFIGURAÇÃO OLLAMA
 # ============================================================================
@@ -49,6 +62,70 @@ TIMEOUTS = {
 THUMBNAIL_CACHE_LIMIT = 300
 THUMBNAIL_SIZE = (220, 200)
 
+# Cache em disco de thumbnails pré-redimensionadas (sobrevive a reinícios)
+THUMBNAIL_DISK_CACHE_ENABLED = True
+THUMBNAIL_DISK_CACHE_DIR = "laserflix_thumbs"
+THUMBNAIL_DISK_CACHE_MAX_MB = 512
+THUMBNAIL_DISK_CACHE_FORMAT = "WEBP"  # JPEG se o Pillow não tiver suporte a WebP
+
+# Decodificação reduzida (JPEG draft / reduce) + filtro de resample final
+# Filtros: "nearest" | "bilinear" | "bicubic" | "lanczos"
+THUMBNAIL_RESAMPLE = "bilinear"   # grid (220px: bilinear é visualmente igual)
+MODAL_RESAMPLE = "lanczos"        # capa grande do modal
+THUMBNAIL_REDUCING_GAP = 1.5      # folga da decodificação reduzida (1.0 = mais rápido)
+
+# Capa do modal: decodificada 1x (worker) e redimensionada da cópia em RAM
+MODAL_COVER_DECODE_MAX = (2048, 2048)  # teto da imagem base em memória
+MODAL_COVER_CACHE_IMAGES = 5           # imagens base mantidas (LRU, ~12 MB cada)
+MODAL_COVER_CACHE_VARIANTS = 12        # tamanhos já redimensionados (LRU)
+MODAL_COVER_PREVIEW_RESAMPLE = "bilinear"  # 1ª passada, rápida
+MODAL_COVER_DEBOUNCE_MS = 120          # espera o resize do modal assentar
+
+# Batcher da thread principal: PhotoImages criadas em lote a cada frame
+THUMBNAIL_FRAME_MS = 16           # intervalo entre drenagens (~60 fps)
+THUMBNAIL_FRAME_BUDGET_MS = 8     # tempo máximo de conversão por frame
+
+# Agendador de UI (ui/managers/ui_scheduler.py): callbacks de threads em frames
+UI_FRAME_MS = 16                  # intervalo entre frames com trabalho pendente
+UI_FRAME_BUDGET_MS = 8            # tempo máximo de trabalho de UI por frame
+UI_IDLE_POLL_MS = 50              # verificação da fila sem trabalho pendente
+
+# Prefetch preditivo (páginas vizinhas + vizinhos do modal) em tempo ocioso
+THUMBNAIL_PREFETCH_ENABLED = True
+THUMBNAIL_PREFETCH_IDLE_MS = 400      # sem interação por este tempo = ocioso
+THUMBNAIL_PREFETCH_SLICE = 4          # pedidos enviados por rodada
+THUMBNAIL_PREFETCH_MAX_QUEUED = 8     # não enfileira mais se a fila passar disso
+
+# ============================================================================
+# GRID PRINCIPAL
+# ============================================================================
+INFINITE_SCROLL_DEFAULT = False  # True = lista inteira rolável (sem paginação)
+CARD_RENDERER = "widgets"        # "widgets" (ProjectCard) | "canvas" (itens no content_canvas)
+DISPLAY_RESULT_CACHE_SIZE = 8    # resultados filtro+ordenação recentes (LRU no DisplayController)
+SIDEBAR_FACETS_IN_FILTER = False # sidebar conta só os projetos do filtro atual (n/total)
+
+# ============================================================================
+# IMPORTAÇÃO / SCAN DE PASTAS
+# ============================================================================
+SCAN_MAX_WORKERS = 8             # threads do RecursiveScanner (I/O: NAS gosta de paralelo)
+
+# Rescan incremental: pastas com mtime igual ao do último scan não são relistadas
+SCAN_SNAPSHOT_FILE = "laserflix_scan_snapshot.json"
+SCAN_SNAPSHOT_RACY_S = 2.0       # mtime tão recente quanto o scan anterior = relista
+                                 # (FAT/SMB têm granularidade de 2s)
+
+# Importação em streaming: scan → dedup → inserção → thumbnails → fila de análise
+IMPORT_STREAMING = True          # False = fluxo antigo (scan completo + preview antes de importar)
+IMPORT_BATCH_SIZE = 50           # produtos inseridos por lote (commit + aviso à UI)
+IMPORT_UI_REFRESH_MS = 500       # intervalo mínimo entre refreshes do grid durante a importação
+IMPORT_WARMUP_MAX = 60           # capas dos primeiros importados aquecidas no cache
+STRUCTURE_MAX_WORKERS = 4        # threads que resumem a estrutura dos projetos importados
+
+# Monitoramento em segundo plano (polling de mtime — sem dependências extras)
+WATCH_ENABLED = False            # mantém o banco em sincronia com config["folders"]
+WATCH_POLL_S = 5.0               # intervalo entre rodadas (um stat por pasta vigiada)
+WATCH_DEBOUNCE_S = 2.0           # pasta precisa ficar estável esse tempo antes de relistar
+
 # ============================================================================
 # QUALIDADE DE IMAGEM (FILTRO PARA VISÃO)
 # ============================================================================
@@ -0,0 +1,144 @@
+"""
+core/change_tracker.py — Revisão monotônica + conjuntos sujos por campo.
+
+O DatabaseManager chama record() em toda mutação (set/put/del/reload).
+A UI decide em O(1) se precisa redesenhar, sem varrer o banco:
+
+    tracker.revision            → contador global (sobe a cada mutação)
+    tracker.field_revision(f)   → revisão da última mudança do campo f
+    cursor = tracker.cursor()   → acumula o que mudou desde o último take()
+    changes = cursor.take()     → ChangeSet(paths, fields, structural, reset)
+
+Cada consumidor (grid, sidebar, caches) tem seu próprio cursor e decide
+o que é relevante: changes.touches("tags", "categories").
+
+STRUCTURE: pseudo-campo das mutações que mudam o conjunto de projetos
+(put/del/reload). Um "put" substitui o registro inteiro: conta como
+mudança de todos os campos daquele path.
+"""
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+STRUCTURE = "__structure__"
+
+
+class ChangeSet:
+    """
+    Mudanças acumuladas por um cursor entre dois take().
+    """
+
+    __slots__ = ("revision", "paths", "fields", "structural", "reset")
+
+    def __init__(self, revision: int, paths: FrozenSet[str] = frozenset(),
+                 fields: FrozenSet[str] = frozenset(), structural: bool = False,
+                 reset: bool = False):
+        self.revision = revision
+        self.paths = paths            # projetos alterados
+        self.fields = fields          # campos alterados via update_project()
+        self.structural = structural  # projetos adicionados/removidos/substituídos
+        self.reset = reset            # reload do banco: tudo pode ter mudado
+
+    def __bool__(self) -> bool:
+        return bool(self.paths or self.fields or self.structural or self.reset)
+
+    def touches(self, *fields: str) -> bool:
+        """True se alguma mudança pode afetar os campos dados."""
+        return self.structural or self.reset or not self.fields.isdisjoint(fields)
+
+    def __repr__(self) -> str:
+        return (f"ChangeSet(rev={self.revision}, paths={len(self.paths)}, "
+                f"fields={sorted(self.fields)}, structural={self.structural}, reset={self.reset})")
+
+
+class ChangeCursor:
+    """
+    Visão de um consumidor: conjuntos sujos desde o último take().
+    """
+
+    def __init__(self, tracker: "ChangeTracker"):
+        self._tracker = tracker
+        self._paths: Set[str] = set()
+        self._fields: Set[str] = set()
+        self._structural = False
+        self._reset = False
+
+    @property
+    def pending(self) -> bool:
+        with self._tracker._lock:
+            return bool(self._paths or self._fields or self._structural or self._reset)
+
+    def take(self) -> ChangeSet:
+        """Retorna e zera as mudanças acumuladas."""
+        with self._tracker._lock:
+            changes = ChangeSet(self._tracker.revision, frozenset(self._paths),
+                                frozenset(self._fields), self._structural, self._reset)
+            self._paths.clear()
+            self._fields.clear()
+            self._structural = self._reset = False
+        return changes
+
+    def close(self) -> None:
+        self._tracker._drop(self)
+
+    def _add(self, op: str, path: Optional[str], fields: Optional[Iterable[str]]) -> None:
+        if op == "reload":
+            self._reset = True
+            self._paths.clear()
+            self._fields.clear()
+            return
+        if path is not None:
+            self._paths.add(path)
+        if op == "set" and fields is not None:
+            self._fields.update(fields)
+        else:
+            self._structural = True
+
+
+class ChangeTracker:
+    """
+    Contador de revisão + revisão por campo, alimentado pelo DatabaseManager.
+    Thread-safe (análise/importação mutam o banco fora da thread do Tk).
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self._field_revisions: Dict[str, int] = {}
+        self._cursors: List[ChangeCursor] = []
+        self._lock = threading.Lock()
+
+    def record(self, op: str, path: Optional[str] = None, fields: Optional[Iterable[str]] = None) -> int:
+        """Registra uma mutação; retorna a nova revisão."""
+        with self._lock:
+            self.revision += 1
+            if op == "set" and fields is not None:
+                fields = tuple(fields)
+                for field in fields:
+                    self._field_revisions[field] = self.revision
+            else:
+                self._field_revisions[STRUCTURE] = self.revision
+            for cursor in self._cursors:
+                cursor._add(op, path, fields)
+            return self.revision
+
+    def field_revision(self, *fields: str) -> int:
+        """
+        Maior revisão em que algum dos campos (ou a estrutura) mudou —
+        serve de chave de cache para dados derivados desses campos.
+        """
+        with self._lock:
+            rev = self._field_revisions.get(STRUCTURE, 0)
+            for field in fields:
+                rev = max(rev, self._field_revisions.get(field, 0))
+            return rev
+
+    def cursor(self) -> ChangeCursor:
+        """Novo consumidor; começa limpo (só vê mutações futuras)."""
+        cursor = ChangeCursor(self)
+        with self._lock:
+            self._cursors.append(cursor)
+        return cursor
+
+    def _drop(self, cursor: ChangeCursor) -> None:
+        with self._lock:
+            if cursor in self._cursors:
+                self._cursors.remove(cursor)
@@ -11,7 +11,7 @@ Arquitetura Kent Beck:
 """
 import json
 import os
-from typing import Dict, List, Set
+from typing import Callable, Dict, List, Set
 from config.settings import DB_FILE
 from utils.logging_setup import LOGGER
 
@@ -36,6 +36,8 @@ class CollectionsManager:
     def __init__(self):
         self.collections: Dict[str, List[str]] = {}
         self.logger = LOGGER
+        # Listeners chamados após salvar (backend SQLite, índice de filtros)
+        self._listeners: List[Callable[[Dict[str, List[str]]], None]] = []
         self.load()
     
     def load(self):
@@ -82,6 +84,8 @@ class CollectionsManager:
             
             os.replace(tmp_file, COLLECTIONS_FILE)
             self.logger.debug("💾 Collections salvo: %d coleções", len(self.collections))
+            for callback in self._listeners:
+                callback(self.collections)
         
         except Exception as e:
             self.logger.error(
@@ -94,6 +98,12 @@ class CollectionsManager:
                 except OSError:
                     pass
     
+    def add_change_listener(self, callback: Callable[[Dict[str, List[str]]], None]) -> None:
+        """
+        Registra callback chamado com as coleções após cada save().
+        """
+        self._listeners.append(callback)
+    
     # === CRUD de Coleções ===
     
     def add_collection(self, name: str) -> bool:
@@ -246,6 +256,24 @@ class CollectionsManager:
         )
         return True
     
+    def rename_project(self, old_path: str, new_path: str) -> int:
+        """
+        Atualiza o caminho de um projeto renomeado/movido em todas as coleções.
+        
+        Returns:
+            Número de coleções atualizadas
+        """
+        count = 0
+        for paths in self.collections.values():
+            if old_path in paths:
+                paths[paths.index(old_path)] = new_path
+                count += 1
+        if count:
+            self.save()
+            self.logger.info("✏️ Projeto renomeado em %d coleção(ões): %s",
+                             count, os.path.basename(new_path))
+        return count
+    
     def get_projects(self, collection_name: str) -> List[str]:
         """
         Retorna lista de paths de projetos na coleção.
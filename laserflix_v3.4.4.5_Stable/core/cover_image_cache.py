@@ -0,0 +1,145 @@
+"""
+core/cover_image_cache.py — Capas grandes (modal) decodificadas uma vez, em RAM.
+
+Antes o modal fazia Image.open() + resize LANCZOS na thread do Tk a cada
+<Configure> — redimensionar a janela congelava a UI.
+
+CAMADAS (LRU, thread-safe):
+    base      → capa decodificada 1x (reduzida até MODAL_COVER_DECODE_MAX)
+    variantes → (capa, tamanho, filtro) já redimensionadas
+
+Todo trabalho pesado roda no executor próprio (2 workers); quem está na
+thread do Tk só chama submit()/prefetch() e recebe PIL Images prontas
+(a PhotoImage continua sendo criada na thread principal).
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from PIL import Image
+
+from config.settings import (
+    MODAL_COVER_DECODE_MAX, MODAL_COVER_CACHE_IMAGES, MODAL_COVER_CACHE_VARIANTS,
+)
+from utils.image_decode import decode_thumbnail, resize_fit
+from utils.logging_setup import LOGGER
+
+
+class CoverImageCache:
+    """
+    Cache compartilhado de capas do modal + executor de decode/resize.
+    """
+
+    def __init__(self, max_images: int = MODAL_COVER_CACHE_IMAGES,
+                 max_variants: int = MODAL_COVER_CACHE_VARIANTS,
+                 decode_max: Tuple[int, int] = MODAL_COVER_DECODE_MAX,
+                 max_workers: int = 2):
+        self.max_images = max_images
+        self.max_variants = max_variants
+        self.decode_max = decode_max
+        self.logger = LOGGER
+        self._lock = threading.Lock()
+        self._images: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._variants: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._loading: Dict[str, Future] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ModalCover")
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Consulta (qualquer thread)
+    # ------------------------------------------------------------------
+
+    def peek(self, cover_path: str, box: Tuple[int, int], resample: str) -> Optional[Image.Image]:
+        """Variante já pronta (sem bloquear), ou None."""
+        with self._lock:
+            img = self._variants.get((cover_path, box, resample))
+            if img is not None:
+                self._variants.move_to_end((cover_path, box, resample))
+            return img
+
+    def load(self, cover_path: str) -> Image.Image:
+        """
+        Imagem base (decodifica 1x; chamadas concorrentes esperam a mesma).
+        Bloqueia — usar nos workers.
+        """
+        with self._lock:
+            img = self._images.get(cover_path)
+            if img is not None:
+                self._images.move_to_end(cover_path)
+                self.hits += 1
+                return img
+            pending = self._loading.get(cover_path)
+            owner = pending is None
+            if owner:
+                pending = self._loading[cover_path] = Future()
+                self.misses += 1
+        if not owner:
+            return pending.result()
+
+        try:
+            img = decode_thumbnail(cover_path, self.decode_max, "lanczos", 2.0).convert("RGB")
+        except Exception as e:
+            with self._lock:
+                self._loading.pop(cover_path, None)
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            self._images[cover_path] = img
+            while len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+            self._loading.pop(cover_path, None)
+        pending.set_result(img)
+        return img
+
+    def scaled(self, cover_path: str, box: Tuple[int, int], resample: str) -> Image.Image:
+        """Variante encaixada em `box` (cacheada). Bloqueia — usar nos workers."""
+        img = self.peek(cover_path, box, resample)
+        if img is not None:
+            return img
+        img = resize_fit(self.load(cover_path), box, resample)
+        with self._lock:
+            self._variants[(cover_path, box, resample)] = img
+            while len(self._variants) > self.max_variants:
+                self._variants.popitem(last=False)
+        return img
+
+    # ------------------------------------------------------------------
+    # Agendamento
+    # ------------------------------------------------------------------
+
+    def submit(self, fn: Callable, *args) -> Future:
+        return self.executor.submit(fn, *args)
+
+    def prefetch(self, cover_paths: Iterable[Optional[str]],
+                 box: Optional[Tuple[int, int]] = None, resample: str = "lanczos") -> None:
+        """
+        Pré-decodifica capas (ex.: projetos ◄ ► do modal); com `box`, já
+        deixa a variante final pronta para a navegação ser instantânea.
+        """
+        for cover_path in cover_paths:
+            if not cover_path:
+                continue
+            if box is not None:
+                if self.peek(cover_path, box, resample) is None:
+                    self.executor.submit(self._quiet, self.scaled, cover_path, box, resample)
+            else:
+                with self._lock:
+                    cached = cover_path in self._images or cover_path in self._loading
+                if not cached:
+                    self.executor.submit(self._quiet, self.load, cover_path)
+
+    def _quiet(self, fn: Callable, *args) -> None:
+        try:
+            fn(*args)
+        except Exception as e:
+            self.logger.debug("Prefetch de capa falhou (%s): %s", args[0], e)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"images": len(self._images), "variants": len(self._variants),
+                    "hits": self.hits, "misses": self.misses}
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
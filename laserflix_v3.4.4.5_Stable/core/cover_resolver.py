@@ -0,0 +1,101 @@
+"""
+core/cover_resolver.py — Resolução cacheada da imagem de capa do projeto.
+
+A capa é "a primeira imagem (ordem alfabética) na raiz da pasta". Descobrir
+isso exige sorted(os.listdir()) — caro em compartilhamentos de rede e antes
+repetido várias vezes por card (cache, thumbnail, modal, IA).
+
+CACHE NO REGISTRO DO PROJETO:
+    "cover_path":      caminho da capa ("" = pasta sem imagem)
+    "cover_dir_mtime": st_mtime_ns da pasta quando a capa foi resolvida
+
+Adicionar/remover/renomear arquivos muda o mtime da pasta → revalida.
+Caso contrário basta um os.stat() da pasta, sem listar o conteúdo.
+Gravado na importação e atualizado via DatabaseManager.update_project()
+(persistido no próximo commit). resolve() roda nos workers de thumbnail:
+com scheduler (UIScheduler) a gravação vai para a thread principal, e
+até lá a capa recém-resolvida fica no memo em RAM.
+"""
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from config.constants import FILE_EXTENSIONS
+from utils.logging_setup import LOGGER
+
+
+def find_first_image(project_path: str) -> Optional[str]:
+    """
+    Primeira imagem válida (ordem alfabética) na raiz da pasta, ou None.
+    """
+    valid_extensions = FILE_EXTENSIONS["images"]
+    try:
+        for item in sorted(os.listdir(project_path)):
+            if item.lower().endswith(valid_extensions):
+                full_path = os.path.join(project_path, item)
+                if os.path.isfile(full_path):
+                    return full_path
+    except OSError:
+        pass
+    return None
+
+
+def cover_fields(project_path: str) -> dict:
+    """
+    Campos de cache da capa para gravar no registro (importação/scan).
+    """
+    try:
+        mtime = os.stat(project_path).st_mtime_ns
+    except OSError:
+        return {}
+    return {"cover_path": find_first_image(project_path) or "", "cover_dir_mtime": mtime}
+
+
+class CoverResolver:
+    """
+    Resolve a capa usando o cache do registro; só lista a pasta quando
+    o mtime dela mudou. Projetos fora do banco usam memo em RAM.
+    """
+
+    def __init__(self, db_manager=None, scheduler=None):
+        self.db_manager = db_manager
+        self.scheduler = scheduler  # UIScheduler: update_project na thread principal
+        self.logger = LOGGER
+        self._memo: Dict[str, Tuple[int, Optional[str]]] = {}
+        self._memo_lock = threading.Lock()
+
+    def resolve(self, project_path: str) -> Optional[str]:
+        try:
+            mtime = os.stat(project_path).st_mtime_ns
+        except OSError:
+            return None
+
+        data = self.db_manager.database.get(project_path) if self.db_manager else None
+        if data is not None and data.get("cover_dir_mtime") == mtime and "cover_path" in data:
+            return data["cover_path"] or None
+
+        with self._memo_lock:
+            memo = self._memo.get(project_path)
+        if memo and memo[0] == mtime:
+            return memo[1]
+        cover = find_first_image(project_path)
+        with self._memo_lock:
+            self._memo[project_path] = (mtime, cover)
+        if data is not None:
+            self._persist(project_path, cover or "", mtime)
+        return cover
+
+    def _persist(self, project_path: str, cover: str, mtime: int) -> None:
+        if self.scheduler and threading.current_thread() is not threading.main_thread():
+            self.scheduler.post(self._save, project_path, cover, mtime,
+                                key=("cover", project_path))
+        else:
+            self._save(project_path, cover, mtime)
+
+    def _save(self, project_path: str, cover: str, mtime: int) -> None:
+        """Thread principal (com scheduler): grava o cache no registro."""
+        if project_path in self.db_manager.database:
+            self.db_manager.update_project(
+                project_path, cover_path=cover, cover_dir_mtime=mtime)
+        with self._memo_lock:
+            self._memo.pop(project_path, None)
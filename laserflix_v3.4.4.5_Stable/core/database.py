@@ -1,17 +1,47 @@
 """
 Gerenciamento de banco de dados JSON
+
+JOURNAL: mutações pontuais (toggle, edição, análise) são anexadas a um
+write-ahead log via update_project()/commit() em vez de regravar o JSON
+inteiro. O snapshot é compactado por limite de registros ou em close().
+
+BACKEND SQLITE (DB_BACKEND = "sqlite"): self.database vira um
+SQLiteProjectDict (mesma interface de dict); commit() grava só os registros
+alterados numa transação. O JSON existente é migrado automaticamente.
 """
 import json
 import os
 import shutil
+import sqlite3
+import threading
 from datetime import datetime
-from config.settings import DB_FILE, CONFIG_FILE, BACKUP_FOLDER, MAX_AUTO_BACKUPS
+from typing import Callable, List, Optional, Tuple
+from config.settings import (
+    DB_FILE, CONFIG_FILE, BACKUP_FOLDER, MAX_AUTO_BACKUPS,
+    DB_JOURNAL_ENABLED, DB_JOURNAL_FILE, DB_JOURNAL_COMPACT_THRESHOLD,
+    DB_BACKEND, SQLITE_DB_FILE,
+)
+from core.change_tracker import ChangeTracker
+from core.database_journal import DatabaseJournal
+from core.sqlite_store import SQLiteProjectStore, SQLiteProjectDict
 from utils.logging_setup import LOGGER
 
 
 class DatabaseManager:
     """
     Gerencia persistência de dados em JSON com backups automáticos.
+    
+    Mutações incrementais:
+        update_project(path, **fields) / add_project(path, data) / remove_project(path)
+        commit()  → grava mutações pendentes no journal (ou snapshot se desabilitado)
+        close()   → compacta journal no snapshot (chamar ao sair)
+    
+    Listeners (índices derivados):
+        add_change_listener(cb) → cb(op, path, fields) com op em
+        "set" / "put" / "del" / "reload" (path/fields None no reload)
+    
+    Versões (UI decide em O(1) se redesenha):
+        changes.revision / changes.field_revision(campo) / changes.cursor()
     """
     
     def __init__(self):
@@ -19,6 +49,18 @@ class DatabaseManager:
         self.config = {"folders": [], "models": {}}
         self.logger = LOGGER
         
+        # Backend SQLite (opcional) — transacional, dispensa o journal
+        self.store: Optional[SQLiteProjectStore] = None
+        self.use_sqlite = DB_BACKEND == "sqlite"
+        
+        # Journal (write-ahead log) de mutações pendentes
+        self.journal = (DatabaseJournal(DB_JOURNAL_FILE)
+                        if DB_JOURNAL_ENABLED and not self.use_sqlite else None)
+        self._pending = []
+        self._lock = threading.RLock()
+        self._listeners: List[Callable[[str, Optional[str], Optional[dict]], None]] = []
+        self.changes = ChangeTracker()
+        
         # Garante existência da pasta de backups
         os.makedirs(BACKUP_FOLDER, exist_ok=True)
     
@@ -70,9 +112,18 @@ class DatabaseManager:
     def load_database(self):
         """
         Carrega banco de dados. Migra campo 'category' → 'categories' se necessário.
+        Reaplica o journal pendente (recuperação após queda).
         """
+        if self.use_sqlite:
+            self._load_sqlite()
+        else:
+            self._load_json()
+        self._notify("reload", None, None)
+    
+    def _load_json(self):
         if not os.path.exists(DB_FILE):
             self.logger.info("⚠️ Database não encontrado, iniciando vazio")
+            self._recover_from_journal()
             return
         
         try:
@@ -87,6 +138,7 @@ class DatabaseManager:
                     del data["category"]
             
             self.logger.info("✅ Database carregado: %d projetos", len(self.database))
+            self._recover_from_journal()
             
         except json.JSONDecodeError as e:
             self.logger.error(
@@ -115,9 +167,227 @@ class DatabaseManager:
     
     def save_database(self):
         """
-        Salva banco de dados de forma atômica.
+        Salva banco de dados de forma atômica (snapshot completo).
+        Após sucesso, o journal é descartado (já está refletido no snapshot).
         """
-        self._save_json_atomic(DB_FILE, self.database, make_backup=True)
+        with self._lock:
+            if self.store:
+                self.database.flush(all_cached=True)
+                return
+            self._save_json_atomic(DB_FILE, self.database, make_backup=True)
+            self._pending.clear()
+            if self.journal:
+                self.journal.reset()
+    
+    # ------------------------------------------------------------------
+    # Mutações incrementais (journal)
+    # ------------------------------------------------------------------
+    
+    def update_project(self, path: str, **fields) -> bool:
+        """
+        Atualiza campos de um projeto e registra a mutação no journal pendente.
+        Retorna False se o projeto não existir.
+        """
+        with self._lock:
+            data = self.database.get(path)
+            if data is None:
+                return False
+            data.update(fields)
+            if self.store:
+                self.database[path] = data  # marca registro sujo no SQLite
+            self._pending.append({"op": "set", "path": path, "fields": fields})
+        self._notify("set", path, fields)
+        return True
+    
+    def add_project(self, path: str, data: dict) -> None:
+        """
+        Adiciona (ou substitui) um projeto e registra a mutação.
+        """
+        with self._lock:
+            self.database[path] = data
+            self._pending.append({"op": "put", "path": path, "data": data})
+        self._notify("put", path, None)
+    
+    def remove_project(self, path: str) -> Optional[dict]:
+        """
+        Remove um projeto e registra a mutação. Retorna os dados removidos (ou None).
+        """
+        with self._lock:
+            data = self.database.pop(path, None)
+            if data is not None:
+                self._pending.append({"op": "del", "path": path})
+        if data is not None:
+            self._notify("del", path, None)
+        return data
+    
+    def commit(self) -> None:
+        """
+        Persiste mutações pendentes.
+        
+        - Journal habilitado: anexa registros pequenos ao journal e compacta
+          quando atingir DB_JOURNAL_COMPACT_THRESHOLD registros.
+        - Journal desabilitado: salva snapshot completo (comportamento antigo).
+        """
+        with self._lock:
+            if self.store:
+                self._pending.clear()
+                self.database.flush()
+                return
+            if not self.journal:
+                self.save_database()
+                return
+            if not self._pending:
+                return
+            try:
+                self.journal.append(self._pending)
+                self._pending.clear()
+            except (IOError, OSError) as e:
+                self.logger.error(
+                    "Falha ao gravar journal (%s). Salvando snapshot completo.",
+                    e, exc_info=True
+                )
+                self.save_database()
+                return
+            if self.journal.record_count >= DB_JOURNAL_COMPACT_THRESHOLD:
+                self.compact()
+    
+    def compact(self) -> None:
+        """
+        Compacta o journal no snapshot (regrava JSON completo uma única vez).
+        """
+        with self._lock:
+            if self.store:
+                # Persiste também mutações in-place feitas fora de update_project()
+                self.database.flush(all_cached=True)
+                return
+            if self._pending or (self.journal and self.journal.record_count):
+                count = self.journal.record_count if self.journal else 0
+                self.save_database()
+                self.logger.info("🗜️ Journal compactado (%d registros)", count)
+    
+    def close(self) -> None:
+        """
+        Compacta pendências no snapshot. Chamar ao encerrar o app.
+        """
+        try:
+            self.compact()
+            if self.store:
+                self.store.close()
+                self.store = None
+        except Exception as e:
+            self.logger.error("Falha ao compactar database no encerramento: %s", e, exc_info=True)
+    
+    def discard_journal(self) -> None:
+        """
+        Descarta journal e mutações pendentes (ex: antes de importar outro banco).
+        """
+        with self._lock:
+            self._pending.clear()
+            if self.journal:
+                self.journal.reset()
+    
+    def snapshot(self) -> List[Tuple[str, dict]]:
+        """
+        Cópia [(path, registro)] tirada sob o lock do manager — para
+        reconstruir índices fora da thread principal sem "dictionary
+        changed size during iteration".
+        """
+        with self._lock:
+            return list(self.database.items())
+
+    def add_change_listener(
+        self, callback: Callable[[str, Optional[str], Optional[dict]], None]
+    ) -> None:
+        """
+        Registra listener chamado após cada mutação (fora do lock do manager).
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        self.changes.record(op, path, fields)
+        for callback in self._listeners:
+            try:
+                callback(op, path, fields)
+            except Exception as e:
+                self.logger.error("Erro em listener do database (%s): %s", op, e, exc_info=True)
+    
+    def export_json(self, dest: str) -> None:
+        """
+        Exporta o database como JSON (independente do backend).
+        """
+        with self._lock:
+            if self.store:
+                self._save_json_atomic(dest, dict(self.database.items()), make_backup=False)
+                return
+            self.compact()
+            shutil.copy2(DB_FILE, dest)
+    
+    def import_json(self, src: str) -> None:
+        """
+        Substitui o database pelo conteúdo de um JSON exportado.
+        Mantém a identidade de self.database no backend SQLite.
+        """
+        with self._lock:
+            if self.store:
+                with open(src, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.store.clear()
+                self.store.write(data)
+                self.database.reload()
+                self._notify("reload", None, None)
+                return
+            self.discard_journal()
+            shutil.copy2(src, DB_FILE)
+            self.load_database()
+    
+    def _load_sqlite(self) -> None:
+        """
+        Abre o backend SQLite. Se estiver vazio e existir o JSON antigo,
+        migra uma única vez (reaproveitando a migração category → categories
+        e a recuperação do journal do carregamento JSON).
+        """
+        try:
+            store = SQLiteProjectStore(SQLITE_DB_FILE)
+        except sqlite3.Error as e:
+            self.logger.error(
+                "Falha ao abrir SQLite (%s). Usando JSON.", e, exc_info=True)
+            self.use_sqlite = False
+            self._load_json()
+            return
+        
+        if store.count() == 0 and os.path.exists(DB_FILE):
+            self.journal = DatabaseJournal(DB_JOURNAL_FILE) if DB_JOURNAL_ENABLED else None
+            self._load_json()
+            store.write(self.database)
+            self.journal = None
+            self.logger.info("🗄️ Migração JSON → SQLite: %d projetos", len(self.database))
+        
+        if self.store and isinstance(self.database, SQLiteProjectDict):
+            self.store.close()
+            self.database.store = store
+            self.database.reload()
+        else:
+            self.database = SQLiteProjectDict(store)
+        self.store = store
+        self.logger.info("✅ Database SQLite carregado: %d projetos", store.count())
+    
+    def _recover_from_journal(self) -> None:
+        """
+        Reaplica o journal sobre o snapshot carregado e compacta o resultado.
+        """
+        if not self.journal or not self.journal.record_count:
+            return
+        try:
+            applied = self.journal.replay(self.database)
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.error("Falha ao ler journal: %s", e, exc_info=True)
+            return
+        self.logger.info("♻️ Journal reaplicado: %d mutações recuperadas", applied)
+        try:
+            self.save_database()
+        except (IOError, OSError, TypeError):
+            # Snapshot falhou: journal permanece para próxima tentativa
+            pass
     
     def _save_json_atomic(self, filepath, data, make_backup=True):
         """
@@ -202,7 +472,7 @@ class DatabaseManager:
         Cria backup automático com timestamp.
         Limita a MAX_AUTO_BACKUPS arquivos mais recentes.
         """
-        if not os.path.exists(DB_FILE):
+        if not self.store and not os.path.exists(DB_FILE):
             self.logger.debug("Database não existe, pulando auto-backup")
             return
         
@@ -210,7 +480,7 @@ class DatabaseManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(BACKUP_FOLDER, f"auto_backup_{timestamp}.json")
             
-            shutil.copy2(DB_FILE, backup_file)
+            self.export_json(backup_file)
             
             # Remove backups antigos (mantém apenas os mais recentes)
             try:
@@ -242,7 +512,7 @@ class DatabaseManager:
         Cria backup manual com confirmação.
         Retorna caminho do backup criado ou None.
         """
-        if not os.path.exists(DB_FILE):
+        if not self.store and not os.path.exists(DB_FILE):
             self.logger.warning("Database não existe, nada para fazer backup")
             return None
         
@@ -250,7 +520,7 @@ class DatabaseManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(BACKUP_FOLDER, f"manual_backup_{timestamp}.json")
             
-            shutil.copy2(DB_FILE, backup_file)
+            self.export_json(backup_file)
             self.logger.info("💾 Backup manual: %s", backup_file)
             return backup_file
             
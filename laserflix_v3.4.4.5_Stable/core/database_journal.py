@@ -0,0 +1,116 @@
+"""
+core/database_journal.py — Write-ahead log (journal) do database.
+
+Cada mutação vira UMA linha JSON anexada ao arquivo de journal, em vez de
+reescrever o laserflix_database.json inteiro (vários MB com ~30k projetos).
+O snapshot completo só é regravado na compactação (limite de registros
+ou ao fechar o app).
+
+FORMATO (JSON Lines):
+    {"op": "set", "path": "...", "fields": {"favorite": true}}
+    {"op": "put", "path": "...", "data": {...registro completo...}}
+    {"op": "del", "path": "..."}
+
+RECUPERAÇÃO:
+    load_database() carrega o snapshot e reaplica o journal em ordem.
+    Uma última linha truncada (queda durante escrita) é ignorada.
+"""
+import json
+import os
+from typing import Dict, List
+from utils.logging_setup import LOGGER
+
+
+class DatabaseJournal:
+    """
+    Journal append-only de mutações do database.
+    Não é thread-safe por si só — o DatabaseManager serializa o acesso.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.logger = LOGGER
+        self.record_count = self._count_records()
+
+    def append(self, records: List[dict]) -> None:
+        """
+        Anexa registros ao journal e força gravação em disco (fsync).
+        """
+        if not records:
+            return
+        lines = "".join(
+            json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for r in records
+        )
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self.record_count += len(records)
+
+    def replay(self, database: Dict[str, dict]) -> int:
+        """
+        Reaplica o journal sobre o database (in-place).
+
+        Returns:
+            Número de registros aplicados
+        """
+        if not os.path.exists(self.filepath):
+            return 0
+
+        applied = 0
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(
+                        "Journal: linha %d inválida/truncada ignorada", line_no)
+                    continue
+                if self.apply(database, record):
+                    applied += 1
+        return applied
+
+    @staticmethod
+    def apply(database: Dict[str, dict], record: dict) -> bool:
+        """
+        Aplica um registro ao database. Retorna False se o registro for inválido.
+        """
+        op = record.get("op")
+        path = record.get("path")
+        if not path:
+            return False
+        if op == "set":
+            if path in database:
+                database[path].update(record.get("fields", {}))
+            return True
+        if op == "put":
+            database[path] = record.get("data", {})
+            return True
+        if op == "del":
+            database.pop(path, None)
+            return True
+        return False
+
+    def reset(self) -> None:
+        """
+        Descarta o journal (chamado após snapshot completo gravado com sucesso).
+        """
+        try:
+            if os.path.exists(self.filepath):
+                os.remove(self.filepath)
+        except OSError as e:
+            self.logger.warning("Não foi possível limpar journal %s: %s", self.filepath, e)
+        self.record_count = 0
+
+    def _count_records(self) -> int:
+        if not os.path.exists(self.filepath):
+            return 0
+        try:
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                return sum(1 for line in f if line.strip())
+        except OSError:
+            return 0
@@ -0,0 +1,121 @@
+"""
+core/facet_counts.py — Contadores de facetas da sidebar (origem, categoria, tag).
+
+A sidebar recontava o banco inteiro a cada refresh (fim de análise, edição,
+coleção, remoção). Aqui os contadores são mantidos incrementalmente:
+cada projeto guarda sua contribuição (origem, categorias, tags) e uma
+mutação só subtrai a antiga e soma a nova.
+
+    facets.counts("tag")                 → {tag: n} no banco inteiro
+    facets.counts("tag", scope=paths)    → {tag: n} só nos paths dados
+                                           (ex.: resultado do filtro atual)
+    facets.revision("tag")               → muda quando algum contador muda
+
+ATUALIZAÇÃO:
+    DatabaseManager.add_change_listener(facets.on_database_change)
+    "reload" → rebuild completo
+"""
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+
+from utils.logging_setup import LOGGER
+
+
+FACETS = ("origin", "category", "tag")
+
+# Campos do registro que alteram alguma faceta
+FACET_FIELDS = frozenset(("origin", "categories", "tags"))
+
+
+def project_facets(data: dict) -> Tuple[str, Tuple[str, ...], Tuple[str, ...]]:
+    """Contribuição de um projeto: (origem, categorias, tags) normalizadas."""
+    cats = {c.strip() for c in data.get("categories", []) or []}
+    cats.discard("")
+    cats.discard("Sem Categoria")
+    tags = {t.strip() for t in data.get("tags", []) or []}
+    tags.discard("")
+    return data.get("origin", "Desconhecido"), tuple(sorted(cats)), tuple(sorted(tags))
+
+
+class FacetCounter:
+    """
+    Contadores por faceta, thread-safe, alimentados pelo DatabaseManager.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.logger = LOGGER
+        self._lock = threading.Lock()
+        self._by_path: Dict[str, tuple] = {}
+        self._counts: Dict[str, Counter] = {f: Counter() for f in FACETS}
+        self._revisions: Dict[str, int] = {f: 0 for f in FACETS}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Reconta tudo (carga inicial ou reload do banco)."""
+        items = self.db_manager.snapshot()  # sob o lock do DatabaseManager
+        with self._lock:
+            self._by_path = {p: project_facets(d) for p, d in items}
+            counts = {f: Counter() for f in FACETS}
+            for origin, cats, tags in self._by_path.values():
+                counts["origin"][origin] += 1
+                counts["category"].update(cats)
+                counts["tag"].update(tags)
+            self._counts = counts
+            for facet in FACETS:
+                self._revisions[facet] += 1
+        self.logger.debug("📊 Facetas: %d projetos", len(self._by_path))
+
+    def on_database_change(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        """Listener do DatabaseManager (set/put/del/reload)."""
+        if op == "reload":
+            self.rebuild()
+            return
+        if op == "set" and fields is not None and not (FACET_FIELDS & fields.keys()):
+            return
+        data = self.db_manager.database.get(path) if op != "del" else None
+        new = project_facets(data) if data is not None else None
+        with self._lock:
+            old = self._by_path.pop(path, None)
+            if new is not None:
+                self._by_path[path] = new
+            for pos, facet in enumerate(FACETS):
+                before = () if old is None else _values(old, pos)
+                after = () if new is None else _values(new, pos)
+                if before == after:
+                    continue
+                counter = self._counts[facet]
+                counter.update(after)
+                counter.subtract(before)
+                for value in before:
+                    if counter[value] <= 0:
+                        del counter[value]
+                self._revisions[facet] += 1
+
+    def counts(self, facet: str, scope: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Contagem da faceta no banco inteiro, ou só nos paths de `scope`
+        (O(len(scope)) — contribuições já normalizadas).
+        """
+        with self._lock:
+            if scope is None:
+                return dict(self._counts[facet])
+            by_path = self._by_path
+            counter: Counter = Counter()
+            pos = FACETS.index(facet)
+            for path in scope:
+                contribution = by_path.get(path)
+                if contribution is None:
+                    continue
+                counter.update(_values(contribution, pos))
+            return dict(counter)
+
+    def revision(self, facet: str) -> int:
+        with self._lock:
+            return self._revisions[facet]
+
+
+def _values(contribution: tuple, pos: int) -> Tuple[str, ...]:
+    value = contribution[pos]
+    return (value,) if pos == 0 else value
@@ -0,0 +1,303 @@
+"""
+core/folder_watcher.py — Mantém o banco em sincronia com o disco (segundo plano).
+
+Sem dependências extras (inotify/watchdog): polling de mtime de pastas.
+O mtime de uma pasta muda quando entradas DENTRO dela são criadas,
+removidas ou renomeadas — então basta um os.stat() por pasta vigiada a
+cada WATCH_POLL_S; só pastas que mudaram são relistadas.
+
+PASTAS VIGIADAS:
+    - raízes de config["folders"]: subpasta nova com arquivos de projeto
+      = projeto novo; sem arquivos de projeto = pasta contêiner (ignorada)
+    - pasta-pai de cada projeto do banco: detecta sumiço/renomeação
+
+NUNCA REMOVE REGISTROS: projeto cuja pasta sumiu é marcado
+"missing": True (favoritos, tags e descrição ficam intactos). A remoção
+continua sendo do OrphanManager.clean_orphans (com dupla confirmação).
+Se a pasta voltar, a marca é retirada.
+
+DEBOUNCE / LOTE:
+    - pasta com mtime novo só é relistada depois de ficar estável por
+      WATCH_DEBOUNCE_S (uma cópia grande vira UMA atualização)
+    - subpasta nova ainda sendo copiada (mtime recente) adia a pasta
+    - todas as mudanças de uma rodada → um commit e um on_changes()
+    - I/O (listagens, capa, registro novo) na thread do watcher; só as
+      mutações do banco vão para a thread principal (via scheduler)
+
+RENOMEAÇÃO / MOVIMENTO: sumido + adicionado com o mesmo inode na mesma
+rodada → o registro é movido para o novo caminho (favoritos, análise e
+descrição preservados). Vale entre pastas vigiadas e para projetos
+movidos para dentro de uma pasta contêiner nova (raiz/Natal/Projeto).
+
+SEGURANÇA: pasta vigiada inacessível (NAS desmontado) não gera mudanças.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from config.settings import WATCH_POLL_S, WATCH_DEBOUNCE_S
+from core.cover_resolver import cover_fields
+from utils.logging_setup import LOGGER
+from utils.recursive_scanner import VALID_EXTENSIONS
+
+
+class FolderWatcher:
+    """
+    Watcher por polling. on_changes(changes) é chamado depois de cada lote
+    aplicado — na thread principal quando há scheduler (UIScheduler) — com
+    {'added': [...], 'missing': [...], 'restored': [...], 'renamed': [(antigo, novo)]}.
+    """
+
+    def __init__(self, db_manager, project_scanner, scheduler=None,
+                 poll_s: float = WATCH_POLL_S,
+                 debounce_s: float = WATCH_DEBOUNCE_S):
+        self.db_manager = db_manager
+        self.scheduler = scheduler  # UIScheduler: mutações do banco na thread principal
+        self.project_scanner = project_scanner  # build_record() de projetos novos
+        self.poll_s = poll_s
+        self.debounce_s = debounce_s
+        self.logger = LOGGER
+        self.on_changes: Optional[Callable[[Dict[str, list]], None]] = None
+        self._lock = threading.Lock()
+        self._roots = set()
+        self._dirs: Dict[str, Optional[list]] = {}  # pasta → [mtime_ns, {nome: inode}] (None = sem referência)
+        self._dirty: Dict[str, list] = {}           # pasta → [mtime_ns visto, desde (monotonic)]
+        self._rewatch = True                        # (re)cadastrar pastas-pai do banco
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def start(self, folders: List[str]) -> None:
+        self.set_roots(folders)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="FolderWatcher")
+        self._thread.start()
+        self.logger.info("👁️ Monitoramento de pastas iniciado: %d raiz(es), a cada %.0fs",
+                         len(self._roots), self.poll_s)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def set_roots(self, folders: List[str]) -> None:
+        """Raízes de config["folders"] (subpastas diretas = projetos)."""
+        roots = {self._dir_key(folder) for folder in folders if folder}
+        with self._lock:
+            self._roots = roots
+            for root in roots:
+                self._dirs.setdefault(root, None)
+
+    def on_database_change(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        """Listener do DatabaseManager: vigia a pasta-pai de projetos novos."""
+        if op == "put" and path:
+            self._watch_parent(path)
+        elif op == "reload":
+            self._rewatch = True
+
+    def poll(self) -> Optional[Dict[str, list]]:
+        """
+        Uma rodada: relista pastas cujo mtime mudou (e estabilizou) e aplica
+        as mudanças no banco em lote. Sem scheduler, retorna as mudanças
+        aplicadas; com scheduler, a aplicação é postada na thread principal.
+        """
+        if self._rewatch:
+            self._rewatch = False
+            for path in list(self.db_manager.database):
+                self._watch_parent(path)
+
+        now = time.monotonic()
+        with self._lock:
+            dirs = list(self._dirs.items())
+            roots = set(self._roots)
+
+        added, removed, listed = {}, {}, {}
+        for folder, state in dirs:
+            if self._stop.is_set():
+                break
+            try:
+                mtime = os.stat(folder).st_mtime_ns
+            except OSError:
+                continue  # pasta sumiu ou NAS offline: não remove nada
+            if state is not None and mtime == state[0]:
+                self._dirty.pop(folder, None)
+                continue
+            if state is not None and not self._settled(folder, mtime, now):
+                continue
+            listing = self._list(folder)
+            if listing is None:
+                continue
+            if state is None:  # primeira vez: só referência
+                self._store(folder, mtime, listing)
+                continue
+            old = state[1]
+            new_names = [n for n in listing if n not in old]
+            if self._copying(folder, new_names):
+                self._dirty[folder] = [mtime, now]
+                continue
+            for name in new_names:
+                added[os.path.join(folder, name)] = (listing[name], folder in roots)
+            for name in old:
+                if name not in listing:
+                    removed[os.path.join(folder, name)] = old[name]
+            listed[folder] = (mtime, listing)
+
+        ops = self._plan(added, removed) if added or removed else []
+        for folder, (mtime, listing) in listed.items():
+            self._store(folder, mtime, listing)
+            self._dirty.pop(folder, None)
+        if not ops:
+            return None
+        if self.scheduler:
+            self.scheduler.post(self._apply, ops)
+            return None
+        return self._apply(ops)
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        self._poll_once()  # referência inicial (nenhum evento)
+        while not self._stop.wait(self.poll_s):
+            self._poll_once()
+
+    def _poll_once(self) -> None:
+        try:
+            self.poll()
+        except Exception as e:
+            self.logger.error("❌ Erro no monitoramento de pastas: %s", e, exc_info=True)
+
+    def _plan(self, added: Dict[str, tuple], removed: Dict[str, int]) -> List[tuple]:
+        """
+        Thread do watcher (toda a I/O): transforma o que sumiu/apareceu em
+        operações. Pares de mesmo inode = renomeação ou movimento; pastas
+        sumidas só são marcadas, nunca removidas.
+        """
+        database = self.db_manager.database
+        ops = []
+
+        # Pastas novas nas raízes sem arquivos de projeto = contêineres:
+        # as subpastas delas podem ser projetos movidos para dentro
+        containers = {
+            path for path, (_inode, in_root) in added.items()
+            if in_root and path not in database and not self._is_project_folder(path)
+        }
+        by_inode = {inode: path for path, (inode, _root) in added.items() if inode}
+        for container in containers:
+            for name, inode in (self._list(container) or {}).items():
+                if inode:
+                    by_inode.setdefault(inode, os.path.join(container, name))
+
+        for old_path, inode in removed.items():
+            if old_path not in database:
+                continue  # pasta que não é projeto
+            new_path = by_inode.pop(inode, None) if inode else None
+            if new_path and new_path not in database:
+                added.pop(new_path, None)
+                ops.append(("rename", old_path, new_path, cover_fields(new_path)))
+            else:
+                ops.append(("missing", old_path, None, None))
+
+        for path, (_inode, in_root) in added.items():
+            if path in database:
+                ops.append(("restore", path, None, None))
+            elif in_root and path not in containers:
+                ops.append(("add", path, None, self.project_scanner.build_record(path)))
+        return ops
+
+    def _apply(self, ops: List[tuple]) -> Dict[str, list]:
+        """
+        Aplica as operações no banco (um commit) e avisa on_changes. Com
+        scheduler roda na thread principal — os listeners do banco (índices,
+        facetas) nunca rodam em paralelo com o render.
+        """
+        database = self.db_manager.database
+        changes = {"added": [], "missing": [], "restored": [], "renamed": []}
+        for op, path, new_path, payload in ops:
+            data = database.get(path)
+            if op == "rename" and data is not None and new_path not in database:
+                record = dict(data)
+                record.pop("missing", None)
+                record["name"] = os.path.basename(new_path)
+                if "path" in record:
+                    record["path"] = new_path
+                record.update(payload)
+                self.db_manager.remove_project(path)
+                self.db_manager.add_project(new_path, record)
+                changes["renamed"].append((path, new_path))
+            elif op in ("rename", "missing") and data is not None and not data.get("missing"):
+                self.db_manager.update_project(path, missing=True)
+                changes["missing"].append(path)
+            elif op == "restore" and data is not None and data.get("missing"):
+                self.db_manager.update_project(path, missing=False)
+                changes["restored"].append(path)
+            elif op == "add" and data is None:
+                self.db_manager.add_project(path, payload)
+                changes["added"].append(path)
+
+        if any(changes.values()):
+            self.db_manager.commit()
+            self.logger.info("👁️ Pastas alteradas: +%d / ausentes %d / voltaram %d / ✏️ %d",
+                             len(changes["added"]), len(changes["missing"]),
+                             len(changes["restored"]), len(changes["renamed"]))
+            if self.on_changes:
+                self.on_changes(changes)
+        return changes
+
+    def _is_project_folder(self, folder: str) -> bool:
+        """Tem arquivo de projeto (VALID_EXTENSIONS) direto na pasta?"""
+        try:
+            with os.scandir(folder) as entries:
+                return any(
+                    e.is_file() and os.path.splitext(e.name)[1].lower() in VALID_EXTENSIONS
+                    for e in entries
+                )
+        except OSError:
+            return False
+
+    def _settled(self, folder: str, mtime: int, now: float) -> bool:
+        """True se o mtime novo está estável há WATCH_DEBOUNCE_S."""
+        seen = self._dirty.get(folder)
+        if seen is None or seen[0] != mtime:
+            self._dirty[folder] = [mtime, now]
+            return self.debounce_s <= 0
+        return now - seen[1] >= self.debounce_s
+
+    def _copying(self, folder: str, names: List[str]) -> bool:
+        """Alguma subpasta nova ainda recebendo arquivos (mtime recente)?"""
+        limit = time.time_ns() - int(self.debounce_s * 1e9)
+        for name in names:
+            try:
+                if os.stat(os.path.join(folder, name)).st_mtime_ns > limit:
+                    return True
+            except OSError:
+                continue
+        return False
+
+    def _list(self, folder: str) -> Optional[Dict[str, int]]:
+        """{nome: inode} das subpastas; None se a pasta não puder ser lida."""
+        try:
+            with os.scandir(folder) as entries:
+                return {e.name: e.inode() for e in entries if e.is_dir()}
+        except OSError as e:
+            self.logger.debug("Pasta vigiada inacessível (%s): %s", folder, e)
+            return None
+
+    def _store(self, folder: str, mtime: int, listing: Dict[str, int]) -> None:
+        with self._lock:
+            if folder in self._dirs:
+                self._dirs[folder] = [mtime, listing]
+
+    def _watch_parent(self, path: str) -> None:
+        parent = os.path.dirname(path)
+        if parent and parent not in self._dirs:
+            with self._lock:
+                self._dirs.setdefault(parent, None)
+
+    @staticmethod
+    def _dir_key(folder: str) -> str:
+        # Mesma forma que os.path.dirname() dos paths do banco (sem separador final)
+        return os.path.dirname(os.path.join(folder, "x"))
@@ -0,0 +1,327 @@
+"""
+core/import_pipeline.py — Pipeline de importação (sem Tk).
+
+Numa thread, um gerador consumindo o outro:
+    scan → dedup → registros em lotes de IMPORT_BATCH_SIZE
+
+O pipeline NUNCA grava no banco: cada lote [(path, registro), ...] vai
+para on_batch(), e quem o conectou (RecursiveImportManager) grava na
+thread principal — os listeners do banco (índices, facetas, ordenação)
+não concorrem com o render. Toda a I/O (scan, listagem da capa) fica aqui.
+
+DEDUP (HOT-10): paths já no banco são descartados; conflitos de nome
+(contra o banco e contra os já vistos nesta importação) ficam retidos
+em `held` e vão ao diálogo de duplicatas no fim.
+  - compara produtos escaneados com o banco existente: Hybrid → Pure →
+    Simple na mesma pasta = SEM duplicatas
+  - HOT-10b: conflitos com normalized_name e name no formato do diálogo
+
+CANCELAMENTO: cancel() interrompe o scan no meio; lotes já entregues
+são mantidos.
+"""
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from config.settings import IMPORT_BATCH_SIZE
+from core.cover_resolver import cover_fields
+from utils.logging_setup import LOGGER
+
+
+class ImportPipeline:
+    """
+    Executa o pipeline em thread própria. Callbacks (chamados na thread
+    do pipeline):
+        on_progress(importados, encontrados, texto)
+        on_batch([(path, registro), ...])
+        on_finished(stats, held, cancelled) — passado em start()/start_products()
+    """
+
+    def __init__(self, scanner, duplicate_detector, batch_size: int = IMPORT_BATCH_SIZE):
+        self.scanner = scanner  # RecursiveScanner
+        self.duplicate_detector = duplicate_detector
+        self.batch_size = max(1, batch_size)
+        self.logger = LOGGER
+        self.on_progress: Optional[Callable] = None
+        self.on_batch: Optional[Callable[[List[tuple]], None]] = None
+        self._cancel = threading.Event()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def start(self, mode: str, base_path: str, existing_paths: List[str],
+              on_finished: Callable) -> None:
+        """Streaming: scan de base_path no modo dado + dedup + registros."""
+        def _products(stats, held):
+            products = self._stage_scan(base_path, mode, stats)
+            return self._stage_dedup(products, existing_paths, held, stats)
+        self._spawn(mode, _products, on_finished)
+
+    def start_products(self, products: List[Dict], existing_paths: List[str],
+                       on_finished: Callable) -> None:
+        """Produtos já escaneados e revisados (fluxo com preview)."""
+        def _products(stats, held):
+            return self._stage_known(products, existing_paths, stats)
+        self._spawn("preview", _products, on_finished)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+        self.scanner.stop()
+
+    def normalized_name(self, path: str) -> str:
+        return self.duplicate_detector.normalize_folder_name(os.path.basename(path))
+
+    def scan_all(self, base_path: str, mode: str) -> List[Dict]:
+        """Fluxo com preview: scan completo (os três modos). Erros sobem."""
+        if mode == "pure":
+            products = self.scanner.scan_folders_pure(base_path)
+        elif mode == "hybrid":
+            products = self.scanner.scan_folders_hybrid(base_path)
+        else:  # 'simple' ─ 1 nível, qualquer subpasta direta
+            products = list(self.iter_simple(base_path))
+
+        stats = self.scanner.get_stats()
+        self.logger.info(
+            "Scan '%s': %d produtos | pastas escaneadas: %d",
+            mode, len(products), stats.get("total_scanned", len(products)),
+        )
+        return products
+
+    def find_conflicts(self, products: List[Dict], database) -> List[dict]:
+        """
+        Fluxo com preview (HOT-10): duplicatas de nome envolvendo produtos
+        NOVOS — contra o banco existente ou entre os novos. Formato do
+        diálogo de duplicatas (HOT-10b).
+        """
+        scanned_db = {p["path"]: {"name": p["name"]} for p in products}
+        combined_db = {**database, **scanned_db}
+        groups = self.duplicate_detector.find_duplicates(combined_db)
+        self.logger.info(
+            f"🔍 Verificação: {len(database)} existentes + "
+            f"{len(scanned_db)} escaneados = {len(combined_db)} total"
+        )
+
+        duplicates = []
+        scanned_paths = set(scanned_db)
+        for norm_name, paths in (groups or {}).items():
+            if len(paths) < 2:
+                continue
+            existing_in_group = [p for p in paths if p in database]
+            new_in_group = [p for p in paths if p in scanned_paths]
+            if existing_in_group:  # novo vs existente
+                first = existing_in_group[0]
+                duplicates.extend(self._conflict(norm_name, first, new)
+                                  for new in new_in_group)
+            elif len(new_in_group) >= 2:  # novos entre si
+                first = new_in_group[0]
+                duplicates.extend(self._conflict(norm_name, first, other, name_of=first)
+                                  for other in new_in_group[1:])
+        return duplicates
+
+    @staticmethod
+    def plan_choices(duplicates: List[dict], choices: Dict[str, str]) -> Tuple[set, List[str]]:
+        """
+        Escolhas do diálogo (HOT-10b: por normalized_name; padrão "skip") →
+        (paths novos a pular, paths existentes a remover). "merge" importa ambos.
+        """
+        skip_paths, replace_paths = set(), []
+        for dup in duplicates:
+            choice = choices.get(dup["normalized_name"], "skip")
+            if choice == "skip":  # Pula novo
+                skip_paths.add(dup["new"]["path"])
+            elif choice == "replace":  # Remove existente + importa novo
+                replace_paths.append(dup["existing"]["path"])
+        return skip_paths, replace_paths
+
+    def iter_simple(self, base_path: str) -> Iterator[Dict]:
+        """Modo Simples em streaming (um produto por subpasta direta)."""
+        try:
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    yield {
+                        "path":             entry.path,
+                        "name":             entry.name,
+                        "unique_id":        self.scanner.generate_unique_id(
+                                                entry.path, base_path),
+                        "has_folder_jpg":   os.path.isfile(
+                                                os.path.join(entry.path, "folder.jpg")),
+                        "detection_method": "simple",
+                    }
+        except PermissionError:
+            self.logger.warning("Sem permissão para acessar: %s", base_path)
+        except Exception as e:
+            self.logger.error("Erro no scan simples: %s", e, exc_info=True)
+
+    def build_record(self, product: Dict) -> Optional[dict]:
+        """Registro inicial do produto (lista a pasta p/ a capa). None em caso de erro."""
+        try:
+            path = product["path"]
+
+            # Detecta origin pelo nome da pasta-pai (compatível com + Pastas)
+            origin = detect_origin(path, product.get("detection_method", ""))
+
+            return {
+                "path":         path,
+                "name":         product["name"],
+                "origin":       origin,
+                "cover_image":  product.get("cover_image", ""),
+                "images":       product.get("images", []),
+                "analyzed":     False,
+                "favorite":     False,
+                "done":         False,
+                "good":         False,
+                "bad":          False,
+                "categories":   [],
+                "tags":         [],
+                "added_date":   datetime.now().isoformat(),
+                **cover_fields(path),
+            }
+        except Exception as e:
+            self.logger.error("Erro ao importar %s: %s",
+                              product.get("name"), e)
+            return None
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _spawn(self, label: str, products: Callable, on_finished: Callable) -> None:
+        self._cancel.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(label, products, on_finished),
+            daemon=True, name="ImportPipeline",
+        )
+        self._thread.start()
+
+    def _run(self, label: str, products: Callable, on_finished: Callable) -> None:
+        stats = {"found": 0, "imported": 0, "existing": 0, "failed": 0}
+        held = []  # (dup, produto): conflitos de nome, resolvidos no fim
+        t0 = time.perf_counter()
+        try:
+            for batch in self._stage_build(products(stats, held), stats):
+                if self.on_batch:
+                    self.on_batch(batch)
+        except Exception as e:
+            self.logger.error("Erro na importação: %s", e, exc_info=True)
+            stats["error"] = str(e)
+        finally:
+            cancelled = self._cancel.is_set()
+            self.logger.info(
+                "📥 Pipeline '%s'%s: %d encontrados | %d importados | %d já existiam | "
+                "%d conflitos de nome | %d falhas | %.1fs",
+                label, " (cancelado)" if cancelled else "", stats["found"],
+                stats["imported"], stats["existing"], len(held), stats["failed"],
+                time.perf_counter() - t0,
+            )
+            on_finished(stats, held, cancelled)
+
+    def _stage_scan(self, base_path: str, mode: str, stats: dict) -> Iterator[Dict]:
+        """Estágio 1: produtos na ordem em que o scan os encontra."""
+        if mode == "simple":
+            source = self.iter_simple(base_path)
+        else:
+            source = self.scanner.iter_scan(base_path, mode)
+        for product in source:
+            if self._cancel.is_set():
+                break
+            stats["found"] += 1
+            if self.on_progress:
+                self.on_progress(stats["imported"], stats["found"],
+                                 f"📥 {product['name']}")
+            yield product
+
+    def _stage_known(self, products: List[Dict], existing_paths: List[str],
+                     stats: dict) -> Iterator[Dict]:
+        """Estágio 1 (fluxo com preview): lista pronta, sem os paths já no banco."""
+        known = set(existing_paths)
+        for product in products:
+            if self._cancel.is_set():
+                break
+            stats["found"] += 1
+            if product["path"] in known:
+                self.logger.debug("Pulando (já existe por path): %s", product["name"])
+                stats["existing"] += 1
+                continue
+            yield product
+
+    def _stage_dedup(self, products: Iterator[Dict], existing_paths: List[str],
+                     held: list, stats: dict) -> Iterator[Dict]:
+        """
+        Estágio 2: descarta paths já no banco e retém conflitos de nome
+        (HOT-10, contra o banco e contra os já vistos nesta importação).
+        """
+        known = set(existing_paths)
+        names = {}
+        for path in existing_paths:
+            names.setdefault(self.normalized_name(path), path)
+
+        for product in products:
+            path = product["path"]
+            if path in known:
+                stats["existing"] += 1
+                continue
+            known.add(path)
+            norm_name = self.normalized_name(path)
+            first = names.get(norm_name)
+            if first is not None:
+                held.append((self._conflict(norm_name, first, path), product))
+                continue
+            names[norm_name] = path
+            yield product
+
+    def _stage_build(self, products: Iterator[Dict], stats: dict) -> Iterator[List[tuple]]:
+        """
+        Estágio 3: monta os registros (I/O da capa fica aqui, fora da thread
+        principal) em lotes de batch_size [(path, registro), ...].
+        """
+        batch = []
+        for product in products:
+            record = self.build_record(product)
+            if record is None:
+                stats["failed"] += 1
+                continue
+            stats["imported"] += 1
+            batch.append((product["path"], record))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _conflict(norm_name: str, existing: str, new: str, name_of: str = None) -> dict:
+        return {
+            "normalized_name": norm_name,
+            "name": os.path.basename(name_of or new),
+            "existing": {"path": existing, "name": os.path.basename(existing)},
+            "new": {"path": new, "name": os.path.basename(new)},
+        }
+
+
+def detect_origin(product_path: str, detection_method: str) -> str:
+    """
+    Detecta a origem pelo nome da pasta-pai — mesma lógica do ProjectScanner.
+    Modo recursivo usa 'Importação Recursiva' como fallback.
+    """
+    try:
+        parent_folder = os.path.basename(os.path.dirname(product_path))
+        upper = parent_folder.upper()
+        if "CREATIVE" in upper or "FABRICA" in upper:
+            return "Creative Fabrica"
+        elif "ETSY" in upper:
+            return "Etsy"
+        elif detection_method == "simple":
+            return parent_folder or "Importação Simples"
+        else:
+            return parent_folder or "Importação Recursiva"
+    except Exception:
+        return "Desconhecido"
@@ -0,0 +1,205 @@
+"""
+core/project_index.py — Índice invertido dos filtros do DisplayController.
+
+Mantém posting lists (sets de paths) por chave de filtro:
+    ("category", nome)      ("tag", nome)         ("origin", nome)
+    ("flag", favorite|done|good|bad)              ("collection", nome)
+    ("analysis", ai|fallback|pending)
+
+Chips AND viram interseção de sets começando pela menor lista, em vez de
+varrer o database inteiro a cada clique.
+
+ATUALIZAÇÃO INCREMENTAL:
+    - DatabaseManager.add_change_listener(index.on_database_change)
+      (toggles, edição, importação, análise → update/add/remove_project)
+    - CollectionsManager.add_change_listener(index.on_collections_change)
+    - "reload" (load/import do banco) → rebuild completo
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.logging_setup import LOGGER
+
+
+IndexKey = Tuple[str, str]
+
+_FLAGS = ("favorite", "done", "good", "bad")
+
+# Campos do registro que alteram alguma chave do índice
+INDEXED_FIELDS = frozenset(
+    ("categories", "tags", "origin", "analyzed", "analysis_type") + _FLAGS)
+
+# Tipo de chip do DisplayController → chave do índice
+_CHIP_KEYS = {
+    "analysis_ai":       ("analysis", "ai"),
+    "analysis_fallback": ("analysis", "fallback"),
+    "analysis_pending":  ("analysis", "pending"),
+}
+
+
+def chip_key(ftype: str, fval: str) -> IndexKey:
+    """Converte um chip (tipo, valor) na chave do índice."""
+    return _CHIP_KEYS.get(ftype, (ftype, fval))
+
+
+def project_keys(data: dict) -> Set[IndexKey]:
+    """Chaves de índice de um registro de projeto."""
+    keys = {("category", c) for c in data.get("categories") or []}
+    keys.update(("tag", t) for t in data.get("tags") or [])
+    if data.get("origin"):
+        keys.add(("origin", data["origin"]))
+    keys.update(("flag", f) for f in _FLAGS if data.get(f))
+    if not data.get("analyzed"):
+        keys.add(("analysis", "pending"))
+    elif data.get("analysis_type") in ("ai", "fallback"):
+        keys.add(("analysis", data["analysis_type"]))
+    return keys
+
+
+class ProjectIndex:
+    """
+    Índice invertido thread-safe sobre o database do DatabaseManager.
+    """
+
+    def __init__(self, db_manager, collections_manager=None):
+        self.db_manager = db_manager
+        self.collections_manager = collections_manager
+        self.logger = LOGGER
+        self._lock = threading.RLock()
+        self._postings: Dict[IndexKey, Set[str]] = {}
+        self._keys_by_path: Dict[str, Set[IndexKey]] = {}
+        self._order: Dict[str, int] = {}  # ordem de inserção (estável p/ sorting)
+        self._collections_by_path: Dict[str, Set[str]] = {}
+        self._next_seq = 0
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Construção / atualização
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Reconstrói o índice inteiro (carga inicial ou reload do banco)."""
+        items = self.db_manager.snapshot()  # sob o lock do DatabaseManager
+        with self._lock:
+            self._postings.clear()
+            self._keys_by_path.clear()
+            self._order.clear()
+            self._next_seq = 0
+            self._rebuild_collections()
+            for path, data in items:
+                self._index(path, data)
+        self.logger.debug("🗂️ Índice de filtros: %d projetos, %d chaves",
+                          len(self._order), len(self._postings))
+
+    def on_database_change(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        """Listener do DatabaseManager (set/put/del/reload)."""
+        if op == "reload":
+            self.rebuild()
+            return
+        with self._lock:
+            if op == "del":
+                self._unindex(path)
+                return
+            if op == "set" and fields is not None and not (INDEXED_FIELDS & fields.keys()):
+                return
+            data = self.db_manager.database.get(path)
+            if data is None:
+                self._unindex(path)
+            else:
+                self._index(path, data)
+
+    def on_collections_change(self, collections: Dict[str, List[str]]) -> None:
+        """Listener do CollectionsManager."""
+        with self._lock:
+            self._rebuild_collections(collections)
+
+    def _index(self, path: str, data: dict) -> None:
+        new_keys = project_keys(data)
+        new_keys.update(("collection", name)
+                        for name in self._collections_by_path.get(path, ()))
+        old_keys = self._keys_by_path.get(path, set())
+        for key in old_keys - new_keys:
+            self._discard(key, path)
+        for key in new_keys - old_keys:
+            self._postings.setdefault(key, set()).add(path)
+        self._keys_by_path[path] = new_keys
+        if path not in self._order:
+            self._order[path] = self._next_seq
+            self._next_seq += 1
+
+    def _unindex(self, path: str) -> None:
+        for key in self._keys_by_path.pop(path, ()):
+            self._discard(key, path)
+        self._order.pop(path, None)
+
+    def _discard(self, key: IndexKey, path: str) -> None:
+        posting = self._postings.get(key)
+        if posting is not None:
+            posting.discard(path)
+            if not posting:
+                del self._postings[key]
+
+    def _rebuild_collections(self, collections: Optional[Dict[str, List[str]]] = None) -> None:
+        if collections is None:
+            collections = (self.collections_manager.collections
+                           if self.collections_manager else {})
+        for key in [k for k in self._postings if k[0] == "collection"]:
+            for path in self._postings.pop(key):
+                self._keys_by_path[path].discard(key)
+        self._collections_by_path = {}
+        for name, paths in collections.items():
+            key = ("collection", name)
+            for p in paths:
+                self._collections_by_path.setdefault(p, set()).add(name)
+                if p in self._keys_by_path:
+                    self._postings.setdefault(key, set()).add(p)
+                    self._keys_by_path[p].add(key)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def lookup(self, key: IndexKey) -> Set[str]:
+        """Posting list de uma chave (cópia)."""
+        with self._lock:
+            return set(self._postings.get(key, ()))
+
+    def count(self, key: IndexKey) -> int:
+        with self._lock:
+            return len(self._postings.get(key, ()))
+
+    def intersect(self, required: Iterable[IndexKey],
+                  any_of: Iterable[IndexKey] = ()) -> Optional[Set[str]]:
+        """
+        Interseção AND das chaves `required` (menor posting list primeiro),
+        opcionalmente restrita à união OR de `any_of`.
+
+        Returns:
+            Set de paths, ou None se não houver nenhuma restrição (= todos).
+        """
+        with self._lock:
+            groups = [self._postings.get(k, set()) for k in set(required)]
+            any_of = list(any_of)
+            if any_of:
+                union = set()
+                for k in any_of:
+                    union |= self._postings.get(k, set())
+                groups.append(union)
+            if not groups:
+                return None
+            groups.sort(key=len)
+            result = set(groups[0])
+            for posting in groups[1:]:
+                if not result:
+                    break
+                result &= posting
+            return result
+
+    def ordered(self, paths: Iterable[str]) -> List[str]:
+        """Ordena paths pela ordem de inserção no database."""
+        order = self._order
+        return sorted(paths, key=lambda p: order.get(p, 0))
+
+    def all_paths(self) -> List[str]:
+        with self._lock:
+            return list(self._order)
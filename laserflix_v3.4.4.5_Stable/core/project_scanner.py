@@ -5,6 +5,7 @@ import os
 import re
 from datetime import datetime
 from config.constants import FILE_EXTENSIONS
+from core.cover_resolver import cover_fields
 from utils.logging_setup import LOGGER
 
 
@@ -42,19 +43,7 @@ class ProjectScanner:
                         continue
                     
                     # Adiciona novo projeto
-                    self.database[project_path] = {
-                        "name": item,
-                        "origin": self.get_origin_from_path(project_path),
-                        "favorite": False,
-                        "done": False,
-                        "good": False,
-                        "bad": False,
-                        "categories": [],
-                        "tags": [],
-                        "analyzed": False,
-                        "ai_description": "",
-                        "added_date": datetime.now().isoformat(),
-                    }
+                    self.database[project_path] = self.build_record(project_path)
                     new_count += 1
             
             except Exception as e:
@@ -65,6 +54,25 @@ class ProjectScanner:
         
         return new_count
     
+    def build_record(self, project_path):
+        """
+        Registro inicial de um projeto novo (scan e FolderWatcher).
+        """
+        return {
+            "name": os.path.basename(project_path),
+            "origin": self.get_origin_from_path(project_path),
+            "favorite": False,
+            "done": False,
+            "good": False,
+            "bad": False,
+            "categories": [],
+            "tags": [],
+            "analyzed": False,
+            "ai_description": "",
+            "added_date": datetime.now().isoformat(),
+            **cover_fields(project_path),
+        }
+    
     def get_origin_from_path(self, project_path):
         """
         Detecta origem do projeto baseado no nome da pasta pai.
@@ -87,50 +95,70 @@ class ProjectScanner:
         """
         Analisa estrutura de arquivos do projeto.
         Retorna dicionário com estatísticas completas.
+        
+        os.scandir em vez de os.walk: tipo e tamanho vêm do DirEntry
+        (no Windows/SMB sem stat extra). Guarda só contagens — o resumo
+        fica cacheado no registro (ver core/structure_resolver.py).
         """
         structure = {
             "total_files": 0,
             "total_subfolders": 0,
+            "total_bytes": 0,
             "file_types": {},
             "subfolders": [],
-            "images": [],
-            "documents": [],
+            "image_count": 0,
+            "document_count": 0,
             "has_svg": False,
             "has_pdf": False,
             "has_dxf": False,
             "has_ai": False,
         }
+        image_exts = set(FILE_EXTENSIONS["images"]) | set(FILE_EXTENSIONS["vectors"])
+        document_exts = set(FILE_EXTENSIONS["documents"])
+        file_types = structure["file_types"]
         
+        stack = [project_path]
         try:
-            for root, dirs, files in os.walk(project_path):
-                structure["total_files"] += len(files)
+            while stack:
+                current = stack.pop()
+                try:
+                    entries = list(os.scandir(current))
+                except OSError:
+                    continue  # pasta ilegível: ignorada, como no os.walk
                 
-                # Captura subpastas apenas do nível raiz
-                if root == project_path:
-                    structure["subfolders"] = dirs
-                    structure["total_subfolders"] = len(dirs)
-                
-                for file in files:
-                    ext = os.path.splitext(file)[1].lower()
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                        # Captura subpastas apenas do nível raiz
+                        if current == project_path:
+                            structure["subfolders"].append(entry.name)
+                        continue
                     
-                    if ext:
-                        structure["file_types"][ext] = structure["file_types"].get(ext, 0) + 1
+                    structure["total_files"] += 1
+                    try:
+                        structure["total_bytes"] += entry.stat().st_size
+                    except OSError:
+                        pass
                     
-                    # Flags de formatos específicos
-                    if ext == ".svg":
-                        structure["has_svg"] = True
-                    elif ext == ".pdf":
-                        structure["has_pdf"] = True
-                    elif ext == ".dxf":
-                        structure["has_dxf"] = True
-                    elif ext == ".ai":
-                        structure["has_ai"] = True
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if not ext:
+                        continue
+                    file_types[ext] = file_types.get(ext, 0) + 1
                     
                     # Classificação de arquivos
-                    if ext in FILE_EXTENSIONS["images"] or ext in FILE_EXTENSIONS["vectors"]:
-                        structure["images"].append(file)
-                    elif ext in FILE_EXTENSIONS["documents"]:
-                        structure["documents"].append(file)
+                    if ext in image_exts:
+                        structure["image_count"] += 1
+                    elif ext in document_exts:
+                        structure["document_count"] += 1
+            
+            structure["total_subfolders"] = len(structure["subfolders"])
+            
+            # Flags de formatos específicos
+            structure["has_svg"] = ".svg" in file_types
+            structure["has_pdf"] = ".pdf" in file_types
+            structure["has_dxf"] = ".dxf" in file_types
+            structure["has_ai"] = ".ai" in file_types
         
         except Exception:
             self.logger.exception("Falha ao analisar estrutura de %s", project_path)
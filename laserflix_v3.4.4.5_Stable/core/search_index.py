@@ -0,0 +1,229 @@
+"""
+core/search_index.py — Índice de busca bilíngue pré-computado.
+
+Substitui a chamada de search_bilingual() por projeto a cada tecla.
+Cada projeto é normalizado UMA vez:
+    nome EN + tradução PT (translate_to_pt) + tags + categorias,
+    tudo em minúsculas e sem acentos.
+
+ESTRUTURA:
+    _docs[id]          → texto normalizado do projeto (campos separados por \\n)
+    _token_docs[tok]   → ids dos projetos que contêm o token
+    _gram_tokens[tri]  → tokens do vocabulário que contêm o trigrama
+
+BUSCA (semântica de substring, igual a search_bilingual):
+    1. Variantes da query: original e translate_to_en(query), sem acentos
+    2. Cada palavra da variante → tokens que a contêm (trigramas do
+       vocabulário; palavras < 3 letras varrem o vocabulário) → ids
+    3. Interseção entre palavras = candidatos; confirma `variante in texto`
+
+O vocabulário é ordens de grandeza menor que o número de projetos, então
+o custo por tecla independe do tamanho do banco. Atualização incremental
+via DatabaseManager.add_change_listener(index.on_database_change).
+"""
+import threading
+from typing import Dict, List, Optional, Set
+
+from utils.logging_setup import LOGGER
+from utils.name_translator import translate_to_en, translate_to_pt
+from utils.text_utils import remove_accents
+
+
+# Campos do registro que alteram o texto indexado
+SEARCH_FIELDS = frozenset(("name", "tags", "categories"))
+
+_WORD_CACHE_LIMIT = 256
+
+
+def normalize(text: str) -> str:
+    """Minúsculas + sem acentos (mesma normalização para query e projetos)."""
+    return remove_accents(text.lower())
+
+
+def _trigrams(word: str) -> Set[str]:
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+def project_search_text(data: dict) -> str:
+    """Texto pesquisável de um projeto (nome EN, nome PT, tags, categorias)."""
+    name = data.get("name", "") or ""
+    parts = [name.lower(), translate_to_pt(name)]
+    parts.extend(data.get("tags") or [])
+    parts.extend(data.get("categories") or [])
+    return "\n".join(normalize(p) for p in parts if p)
+
+
+class SearchIndex:
+    """
+    Índice invertido por token + trigramas do vocabulário. Thread-safe.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.logger = LOGGER
+        self._lock = threading.RLock()
+        self._ids: Dict[str, int] = {}
+        self._paths: List[Optional[str]] = []
+        self._docs: List[Optional[str]] = []
+        self._token_docs: Dict[str, Set[int]] = {}
+        self._gram_tokens: Dict[str, Set[str]] = {}
+        self._word_cache: Dict[str, Set[int]] = {}
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Construção / atualização
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Reconstrói o índice inteiro (carga inicial ou reload do banco)."""
+        items = self.db_manager.snapshot()  # sob o lock do DatabaseManager
+        with self._lock:
+            self._ids.clear()
+            self._paths.clear()
+            self._docs.clear()
+            self._token_docs.clear()
+            self._gram_tokens.clear()
+            self._word_cache.clear()
+            for path, data in items:
+                self._index(path, data)
+        self.logger.debug("🔎 Índice de busca: %d projetos, %d tokens",
+                          len(self._ids), len(self._token_docs))
+
+    def on_database_change(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        """Listener do DatabaseManager (set/put/del/reload)."""
+        if op == "reload":
+            self.rebuild()
+            return
+        with self._lock:
+            if op == "set" and fields is not None and not (SEARCH_FIELDS & fields.keys()):
+                return
+            data = None if op == "del" else self.db_manager.database.get(path)
+            if data is None:
+                self._unindex(path)
+            else:
+                self._index(path, data)
+
+    def _index(self, path: str, data: dict) -> None:
+        text = project_search_text(data)
+        doc_id = self._ids.get(path)
+        if doc_id is not None:
+            if self._docs[doc_id] == text:
+                return
+            self._drop_tokens(doc_id)
+        else:
+            doc_id = len(self._paths)
+            self._ids[path] = doc_id
+            self._paths.append(path)
+            self._docs.append(None)
+        self._docs[doc_id] = text
+        for token in set(text.split()):
+            docs = self._token_docs.get(token)
+            if docs is None:
+                docs = self._token_docs[token] = set()
+                for gram in _trigrams(token):
+                    self._gram_tokens.setdefault(gram, set()).add(token)
+            docs.add(doc_id)
+        self._word_cache.clear()
+
+    def _unindex(self, path: str) -> None:
+        doc_id = self._ids.pop(path, None)
+        if doc_id is None:
+            return
+        self._drop_tokens(doc_id)
+        self._paths[doc_id] = None
+        self._docs[doc_id] = None
+        self._word_cache.clear()
+
+    def _drop_tokens(self, doc_id: int) -> None:
+        for token in set(self._docs[doc_id].split()):
+            docs = self._token_docs.get(token)
+            if docs is None:
+                continue
+            docs.discard(doc_id)
+            if not docs:
+                del self._token_docs[token]
+                for gram in _trigrams(token):
+                    tokens = self._gram_tokens.get(gram)
+                    if tokens is not None:
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._gram_tokens[gram]
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def search(self, query: str) -> "SearchHits":
+        """
+        Projetos cujo nome (EN/PT), tags ou categorias contêm a query.
+        Aceita query em inglês ou português, com ou sem acentos.
+        """
+        variants = {normalize(query).strip(), normalize(translate_to_en(query)).strip()}
+        variants.discard("")
+        with self._lock:
+            ids: Set[int] = set()
+            for variant in variants:
+                ids |= self._search_variant(variant)
+            return SearchHits(self, ids)
+
+    def _search_variant(self, variant: str) -> Set[int]:
+        candidates: Optional[Set[int]] = None
+        for word in sorted(set(variant.split()), key=len, reverse=True):
+            docs = self._docs_for_word(word)
+            candidates = docs if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+        if " " not in variant:
+            return candidates  # palavra única: token que a contém já prova o match
+        docs = self._docs
+        return {i for i in candidates if variant in docs[i]}
+
+    def _docs_for_word(self, word: str) -> Set[int]:
+        """Ids dos projetos com algum token contendo `word` (cacheado)."""
+        cached = self._word_cache.get(word)
+        if cached is not None:
+            return cached
+
+        if len(word) >= 3:
+            tokens = None
+            for gram in sorted(_trigrams(word), key=lambda g: len(self._gram_tokens.get(g, ()))):
+                found = self._gram_tokens.get(gram)
+                if not found:
+                    tokens = set()
+                    break
+                tokens = set(found) if tokens is None else tokens & found
+            result: Set[int] = set()
+            for token in tokens:
+                if word in token:
+                    result |= self._token_docs[token]
+        else:
+            result = set()
+            for token, docs in self._token_docs.items():
+                if word in token:
+                    result |= docs
+
+        if len(self._word_cache) >= _WORD_CACHE_LIMIT:
+            self._word_cache.clear()
+        self._word_cache[word] = result
+        return result
+
+
+class SearchHits:
+    """
+    Resultado de SearchIndex.search(): `path in hits` sem converter
+    milhares de ids em paths (buscas curtas casam com boa parte do banco).
+    """
+
+    def __init__(self, index: SearchIndex, ids: Set[int]):
+        self._index = index
+        self._ids = ids
+
+    def __contains__(self, path) -> bool:
+        return self._index._ids.get(path) in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self):
+        paths = self._index._paths
+        return (paths[i] for i in self._ids if paths[i] is not None)
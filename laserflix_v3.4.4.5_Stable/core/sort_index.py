@@ -0,0 +1,258 @@
+"""
+core/sort_index.py — Ordens pré-ordenadas para os modos de ordenação do grid.
+
+Em vez de sorted() com lambdas a cada exibição (O(N log N)), mantém listas
+já ordenadas de (chave, seq, path) por critério:
+    "date"    → added_date              (date_asc / date_desc)
+    "name"    → name.lower()            (name_asc / name_desc;
+                                          analyzed / not_analyzed = partição
+                                          estável da ordem por nome)
+    "origin"  → (origin, name.lower())  (origin)
+
+seq = ordem de inserção no database: empates saem na mesma ordem do
+sorted() estável sobre database.items() (apply_sorting).
+
+VISÃO FILTRADA:
+    sorted_view(sort, members) percorre a ordem pré-ordenada testando
+    `path in members` e materializa sob demanda (SortedPaths): a 1ª página
+    só percorre até achar os primeiros itens (top-k sem ordenar o resto).
+    Filtros pequenos (members ≪ N) ordenam só o subconjunto.
+
+ATUALIZAÇÃO INCREMENTAL:
+    DatabaseManager.add_change_listener(index.on_database_change) marca
+    paths sujos; aplicados com bisect na próxima consulta (importação em
+    massa → rebuild único).
+"""
+import bisect
+import itertools
+import threading
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from utils.logging_setup import LOGGER
+
+
+# Campos do registro que alteram alguma ordem
+SORT_FIELDS = frozenset(("name", "added_date", "origin", "analyzed"))
+
+# Modo do DisplayController → (ordem base, decrescente)
+SORT_MODES = {
+    "date_asc":     ("date", False),
+    "date_desc":    ("date", True),
+    "name_asc":     ("name", False),
+    "name_desc":    ("name", True),
+    "origin":       ("origin", False),
+    "analyzed":     ("name", False),
+    "not_analyzed": ("name", False),
+}
+
+# Subconjunto pequeno (members * fator < N): ordenar direto sai mais barato
+_SUBSET_SORT_FACTOR = 16
+
+# Sujos acima desta fração do índice → rebuild em vez de bisect um a um
+_REBUILD_FRACTION = 0.1
+
+
+def _name_key(data: dict) -> str:
+    return (data.get("name") or "").lower()
+
+
+_KEYS: Dict[str, Callable[[dict], object]] = {
+    "date":   lambda d: d.get("added_date") or "",
+    "name":   _name_key,
+    "origin": lambda d: (d.get("origin", "zzz") or "", _name_key(d)),
+}
+
+
+class SortedPaths(Sequence):
+    """
+    Lista de paths ordenada materializada sob demanda.
+
+    len() é conhecido de antemão (tamanho do filtro); indexar/fatiar só
+    avança o iterador até a posição pedida.
+    """
+
+    def __init__(self, iterator: Iterator[str], total: int):
+        self._it: Optional[Iterator[str]] = iterator
+        self._items: List[str] = []
+        self._total = total
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, _step = index.indices(self._total)
+            self._fill(max(start + 1, stop))
+            return self._items[index]
+        if index < 0:
+            index += self._total
+        if not 0 <= index < self._total:
+            raise IndexError("SortedPaths index out of range")
+        self._fill(index + 1)
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[str]:
+        i = 0
+        while True:
+            if i >= len(self._items):
+                self._fill(i + 1)
+                if i >= len(self._items):
+                    return
+            yield self._items[i]
+            i += 1
+
+    def materialized(self) -> int:
+        """Quantos itens já foram percorridos (debug/benchmark)."""
+        return len(self._items)
+
+    def _fill(self, count: int) -> None:
+        if self._it is None or len(self._items) >= count:
+            return
+        self._items.extend(itertools.islice(self._it, count - len(self._items)))
+        if len(self._items) < count:
+            self._it = None
+            self._total = len(self._items)  # índice mudou no meio do caminho
+
+
+class SortIndex:
+    """
+    Ordens pré-ordenadas thread-safe sobre o database do DatabaseManager.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+        self.logger = LOGGER
+        self._lock = threading.RLock()
+        self._orders: Dict[str, List[tuple]] = {name: [] for name in _KEYS}
+        self._entries: Dict[str, Dict[str, tuple]] = {name: {} for name in _KEYS}
+        self._seq: Dict[str, int] = {}
+        self._analyzed: Dict[str, bool] = {}
+        self._next_seq = 0
+        self._dirty: Set[str] = set()
+        self.rebuild()
+
+    # ------------------------------------------------------------------
+    # Construção / atualização
+    # ------------------------------------------------------------------
+
+    def rebuild(self) -> None:
+        """Reconstrói todas as ordens (carga inicial, reload, importação em massa)."""
+        database = dict(self.db_manager.snapshot())  # fora do nosso lock
+        with self._lock:
+            self._dirty.clear()
+            known = self._seq
+            self._seq = {}
+            for path in database:
+                seq = known.get(path)
+                if seq is None:
+                    seq = self._next_seq
+                    self._next_seq += 1
+                self._seq[path] = seq
+            for name, key_fn in _KEYS.items():
+                entries = {p: (key_fn(database[p]), seq, p) for p, seq in self._seq.items()}
+                self._entries[name] = entries
+                self._orders[name] = sorted(entries.values())
+            self._analyzed = {p: bool(database[p].get("analyzed")) for p in self._seq}
+        self.logger.debug("🔢 Índice de ordenação: %d projetos", len(self._seq))
+
+    def on_database_change(self, op: str, path: Optional[str], fields: Optional[dict]) -> None:
+        """Listener do DatabaseManager (set/put/del/reload)."""
+        if op == "reload":
+            self.rebuild()
+            return
+        if op == "set" and fields is not None and not (SORT_FIELDS & fields.keys()):
+            return
+        with self._lock:
+            self._dirty.add(path)
+
+    def _apply_dirty(self) -> None:
+        if not self._dirty:
+            return
+        if len(self._dirty) > max(64, len(self._seq) * _REBUILD_FRACTION):
+            self.rebuild()
+            return
+        database = self.db_manager.database
+        for path in self._dirty:
+            data = database.get(path)
+            self._remove(path)
+            if data is None:
+                self._seq.pop(path, None)
+                self._analyzed.pop(path, None)
+                continue
+            seq = self._seq.get(path)
+            if seq is None:
+                seq = self._seq[path] = self._next_seq
+                self._next_seq += 1
+            for name, key_fn in _KEYS.items():
+                entry = (key_fn(data), seq, path)
+                self._entries[name][path] = entry
+                bisect.insort(self._orders[name], entry)
+            self._analyzed[path] = bool(data.get("analyzed"))
+        self._dirty.clear()
+
+    def _remove(self, path: str) -> None:
+        for name, order in self._orders.items():
+            entry = self._entries[name].pop(path, None)
+            if entry is None:
+                continue
+            i = bisect.bisect_left(order, entry)
+            if i < len(order) and order[i] is entry:
+                del order[i]
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def sorted_view(self, sort: str, members: Optional[Iterable[str]] = None) -> Optional[SortedPaths]:
+        """
+        Paths de `members` (None = todos) no modo `sort`, sob demanda.
+
+        Returns:
+            SortedPaths, ou None se o modo não tiver ordem pré-ordenada
+        """
+        mode = SORT_MODES.get(sort)
+        if mode is None:
+            return None
+        name, reverse = mode
+        with self._lock:
+            self._apply_dirty()
+            entries = self._entries[name]
+            if members is not None:
+                members = {p for p in members if p in entries}
+            total = len(entries) if members is None else len(members)
+            if members is not None and len(members) * _SUBSET_SORT_FACTOR < len(entries):
+                # Filtro pequeno: ordena só o subconjunto (chaves já calculadas)
+                snapshot = sorted(entries[p] for p in members)
+                walk_members = None
+            else:
+                snapshot = list(self._orders[name])  # cópia rasa: O(N) memcpy
+                walk_members = members
+            analyzed = dict(self._analyzed) if sort in ("analyzed", "not_analyzed") else None
+        return SortedPaths(_walk(snapshot, reverse, walk_members, analyzed, sort == "analyzed"), total)
+
+
+def _walk_desc(order: List[tuple]) -> Iterator[str]:
+    """Ordem decrescente mantendo empates em ordem de inserção (sorted estável)."""
+    for _key, group in itertools.groupby(reversed(order), key=lambda e: e[0]):
+        group = list(group)
+        for entry in reversed(group):
+            yield entry[2]
+
+
+def _walk(order: List[tuple], reverse: bool, members: Optional[Set[str]],
+          analyzed: Optional[Dict[str, bool]], analyzed_first: bool) -> Iterator[str]:
+    paths = _walk_desc(order) if reverse else (e[2] for e in order)
+    if members is not None:
+        paths = (p for p in paths if p in members)
+    if analyzed is None:
+        yield from paths
+        return
+    # Partição estável da ordem por nome: analisados antes (ou depois)
+    rest = []
+    for path in paths:
+        if analyzed.get(path, False) == analyzed_first:
+            yield path
+        else:
+            rest.append(path)
+    yield from rest
@@ -0,0 +1,433 @@
+"""
+core/sqlite_store.py — Backend SQLite (stdlib sqlite3) para o banco de projetos.
+
+Alternativa ao laserflix_database.json carregado inteiro em memória.
+Ativado por DB_BACKEND = "sqlite" em config/settings.py.
+
+TABELAS (normalizadas):
+    projects(path PK, name, name_lower, origin, favorite, done, good, bad,
+             analyzed, analysis_type, analyzed_model, added_date, data JSON)
+    project_categories(path, category)
+    project_tags(path, tag)
+    collection_projects(collection, path)
+
+ÍNDICES: origin, flags, added_date, analyzed/analysis_type, name,
+         category, tag, collection.
+
+FACADE:
+    SQLiteProjectDict é um MutableMapping {path: dict} compatível com o
+    dict antigo. Registros lidos ficam em cache (mutações in-place continuam
+    funcionando) e são gravados em flush(). query_paths() empurra filtros e
+    ordenação do DisplayController para SQL.
+
+MIGRAÇÃO:
+    migrate_json_to_sqlite(json_path, sqlite_path) — one-shot, chamado
+    automaticamente pelo DatabaseManager quando o SQLite está vazio.
+"""
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterable, List, Optional
+
+from utils.logging_setup import LOGGER
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    path           TEXT PRIMARY KEY,
+    name           TEXT NOT NULL DEFAULT '',
+    name_lower     TEXT NOT NULL DEFAULT '',
+    origin         TEXT,
+    favorite       INTEGER NOT NULL DEFAULT 0,
+    done           INTEGER NOT NULL DEFAULT 0,
+    good           INTEGER NOT NULL DEFAULT 0,
+    bad            INTEGER NOT NULL DEFAULT 0,
+    analyzed       INTEGER NOT NULL DEFAULT 0,
+    analysis_type  TEXT,
+    analyzed_model TEXT,
+    added_date     TEXT NOT NULL DEFAULT '',
+    data           TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS project_categories (
+    path     TEXT NOT NULL REFERENCES projects(path) ON DELETE CASCADE,
+    category TEXT NOT NULL,
+    PRIMARY KEY (path, category)
+);
+CREATE TABLE IF NOT EXISTS project_tags (
+    path TEXT NOT NULL REFERENCES projects(path) ON DELETE CASCADE,
+    tag  TEXT NOT NULL,
+    PRIMARY KEY (path, tag)
+);
+CREATE TABLE IF NOT EXISTS collection_projects (
+    collection TEXT NOT NULL,
+    path       TEXT NOT NULL,
+    PRIMARY KEY (collection, path)
+);
+CREATE INDEX IF NOT EXISTS idx_projects_origin   ON projects(origin);
+CREATE INDEX IF NOT EXISTS idx_projects_flags    ON projects(favorite, done, good, bad);
+CREATE INDEX IF NOT EXISTS idx_projects_added    ON projects(added_date);
+CREATE INDEX IF NOT EXISTS idx_projects_analyzed ON projects(analyzed, analysis_type);
+CREATE INDEX IF NOT EXISTS idx_projects_name     ON projects(name_lower);
+CREATE INDEX IF NOT EXISTS idx_categories_cat    ON project_categories(category);
+CREATE INDEX IF NOT EXISTS idx_tags_tag          ON project_tags(tag);
+CREATE INDEX IF NOT EXISTS idx_collections_path  ON collection_projects(path);
+"""
+
+# ORDER BY por modo de ordenação (espelha DisplayController.apply_sorting)
+_ORDER_BY = {
+    "date_desc":    "p.added_date DESC, p.rowid",
+    "date_asc":     "p.added_date ASC, p.rowid",
+    "name_asc":     "p.name_lower ASC, p.rowid",
+    "name_desc":    "p.name_lower DESC, p.rowid",
+    "origin":       "COALESCE(p.origin, 'zzz'), p.name_lower, p.rowid",
+    "analyzed":     "p.analyzed DESC, p.name_lower, p.rowid",
+    "not_analyzed": "p.analyzed ASC, p.name_lower, p.rowid",
+}
+
+_FLAG_COLUMNS = ("favorite", "done", "good", "bad")
+
+
+class SQLiteProjectStore:
+    """
+    Acesso de baixo nível ao arquivo SQLite.
+    Conexão única compartilhada entre threads (serializada por lock).
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.logger = LOGGER
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self.conn.execute(
+                "SELECT path FROM projects ORDER BY rowid")]
+
+    def contains(self, path: str) -> bool:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT 1 FROM projects WHERE path = ?", (path,)).fetchone() is not None
+
+    def load(self, path: str) -> Optional[dict]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT data FROM projects WHERE path = ?", (path,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_all(self) -> Dict[str, dict]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path, data FROM projects ORDER BY rowid").fetchall()
+        return {path: json.loads(data) for path, data in rows}
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def write(self, upserts: Dict[str, dict], deletes: Iterable[str] = ()) -> None:
+        """
+        Grava upserts e deleções numa única transação.
+        """
+        deletes = list(deletes)
+        if not upserts and not deletes:
+            return
+        with self._lock, self.conn:
+            if deletes:
+                self.conn.executemany(
+                    "DELETE FROM projects WHERE path = ?", [(p,) for p in deletes])
+            for path, data in upserts.items():
+                self._upsert(path, data)
+
+    def _upsert(self, path: str, data: dict) -> None:
+        name = data.get("name", "") or ""
+        self.conn.execute(
+            """INSERT INTO projects (path, name, name_lower, origin, favorite, done,
+                   good, bad, analyzed, analysis_type, analyzed_model, added_date, data)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+               ON CONFLICT(path) DO UPDATE SET
+                   name=excluded.name, name_lower=excluded.name_lower,
+                   origin=excluded.origin, favorite=excluded.favorite,
+                   done=excluded.done, good=excluded.good, bad=excluded.bad,
+                   analyzed=excluded.analyzed, analysis_type=excluded.analysis_type,
+                   analyzed_model=excluded.analyzed_model,
+                   added_date=excluded.added_date, data=excluded.data""",
+            (
+                path, name, name.lower(), data.get("origin"),
+                int(bool(data.get("favorite"))), int(bool(data.get("done"))),
+                int(bool(data.get("good"))), int(bool(data.get("bad"))),
+                int(bool(data.get("analyzed"))), data.get("analysis_type"),
+                data.get("analyzed_model"), data.get("added_date", "") or "",
+                json.dumps(data, ensure_ascii=False),
+            ),
+        )
+        self.conn.execute("DELETE FROM project_categories WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM project_tags WHERE path = ?", (path,))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO project_categories (path, category) VALUES (?, ?)",
+            [(path, c) for c in (data.get("categories") or []) if c])
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO project_tags (path, tag) VALUES (?, ?)",
+            [(path, t) for t in (data.get("tags") or []) if t])
+
+    def replace_collections(self, collections: Dict[str, List[str]]) -> None:
+        """
+        Espelha as coleções do CollectionsManager (fonte da verdade: collections.json).
+        """
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM collection_projects")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO collection_projects (collection, path) VALUES (?, ?)",
+                [(name, p) for name, paths in collections.items() for p in paths])
+
+    def clear(self) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM projects")
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Consultas (pushdown do DisplayController)
+    # ------------------------------------------------------------------
+
+    def query_paths(
+        self,
+        main_filter: str = "all",
+        chips: Iterable[tuple] = (),
+        origin: str = "all",
+        categories: Iterable[str] = (),
+        tag: Optional[str] = None,
+        sort: Optional[str] = None,
+        name_predicate: Optional[Callable[[str], bool]] = None,
+    ) -> List[str]:
+        """
+        Retorna paths que passam pelos filtros, já ordenados.
+
+        Args:
+            main_filter: all/favorite/done/good/bad
+            chips: tuplas (tipo, valor) — chips AND do DisplayController
+            origin/categories/tag: filtros legados
+            sort: modo de ordenação (chaves de _ORDER_BY)
+            name_predicate: filtro Python sobre o nome (busca bilíngue)
+        """
+        where, params = [], []
+
+        if main_filter in _FLAG_COLUMNS:
+            where.append(f"p.{main_filter} = 1")
+
+        for ftype, fval in chips:
+            if ftype == "category":
+                where.append("EXISTS (SELECT 1 FROM project_categories c "
+                             "WHERE c.path = p.path AND c.category = ?)")
+                params.append(fval)
+            elif ftype == "tag":
+                where.append("EXISTS (SELECT 1 FROM project_tags t "
+                             "WHERE t.path = p.path AND t.tag = ?)")
+                params.append(fval)
+            elif ftype == "origin":
+                where.append("p.origin = ?")
+                params.append(fval)
+            elif ftype == "collection":
+                where.append("EXISTS (SELECT 1 FROM collection_projects cp "
+                             "WHERE cp.path = p.path AND cp.collection = ?)")
+                params.append(fval)
+            elif ftype == "analysis_ai":
+                where.append("p.analyzed = 1 AND p.analysis_type = 'ai'")
+            elif ftype == "analysis_fallback":
+                where.append("p.analyzed = 1 AND p.analysis_type = 'fallback'")
+            elif ftype == "analysis_pending":
+                where.append("p.analyzed = 0")
+
+        if origin != "all":
+            where.append("p.origin = ?")
+            params.append(origin)
+        categories = list(categories)
+        if categories:
+            marks = ", ".join("?" for _ in categories)
+            where.append("EXISTS (SELECT 1 FROM project_categories c "
+                         f"WHERE c.path = p.path AND c.category IN ({marks}))")
+            params.extend(categories)
+        if tag:
+            where.append("EXISTS (SELECT 1 FROM project_tags t "
+                         "WHERE t.path = p.path AND t.tag = ?)")
+            params.append(tag)
+
+        sql = "SELECT p.path, p.name FROM projects p"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY " + _ORDER_BY.get(sort, "p.rowid")
+
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        if name_predicate:
+            return [path for path, name in rows if name_predicate(name)]
+        return [path for path, _ in rows]
+
+
+class SQLiteProjectDict(MutableMapping):
+    """
+    Facade dict-compatível {path: dict} sobre SQLiteProjectStore.
+
+    - Registros lidos ficam em cache: `db[path]["favorite"] = True` funciona
+      como antes e é persistido no próximo flush(all_cached=True).
+    - `db[path] = data` / `del db[path]` marcam o registro como sujo.
+    - Cache e marcas de sujo/deletado usam o RLock do store: workers
+      (capa, estrutura) podem gravar enquanto a thread principal faz flush().
+    """
+
+    def __init__(self, store: SQLiteProjectStore):
+        self.store = store
+        self._lock = store._lock
+        self._cache: Dict[str, dict] = {}
+        self._dirty = set()
+        self._deleted = set()
+        self._fully_loaded = False
+
+    # --- MutableMapping ---------------------------------------------------
+
+    def __getitem__(self, path: str) -> dict:
+        data = self._cache.get(path)
+        if data is not None:
+            return data
+        with self._lock:
+            data = self._cache.get(path)
+            if data is not None:
+                return data
+            if path in self._deleted or self._fully_loaded:
+                raise KeyError(path)
+            data = self.store.load(path)
+            if data is None:
+                raise KeyError(path)
+            self._cache[path] = data
+            return data
+
+    def __setitem__(self, path: str, data: dict) -> None:
+        with self._lock:
+            self._cache[path] = data
+            self._dirty.add(path)
+            self._deleted.discard(path)
+
+    def __delitem__(self, path: str) -> None:
+        with self._lock:
+            if path not in self:
+                raise KeyError(path)
+            self._cache.pop(path, None)
+            self._dirty.discard(path)
+            self._deleted.add(path)
+
+    def __contains__(self, path) -> bool:
+        if path in self._cache:
+            return True
+        if path in self._deleted or self._fully_loaded:
+            return False
+        return self.store.contains(path)
+
+    def __iter__(self):
+        self.flush()
+        if self._fully_loaded:
+            return iter(list(self._cache))
+        return iter(self.store.paths())
+
+    def __len__(self) -> int:
+        self.flush()
+        if self._fully_loaded:
+            return len(self._cache)
+        return self.store.count()
+
+    def items(self):
+        self._load_all()
+        return self._cache.items()
+
+    def values(self):
+        self._load_all()
+        return self._cache.values()
+
+    def keys(self):
+        self._load_all()
+        return self._cache.keys()
+
+    # --- Persistência ----------------------------------------------------
+
+    def flush(self, all_cached: bool = False) -> None:
+        """
+        Grava registros sujos (ou todo o cache, se all_cached) e deleções.
+        """
+        with self._lock:
+            targets = dict(self._cache) if all_cached else {
+                p: self._cache[p] for p in self._dirty if p in self._cache}
+            deleted = set(self._deleted)
+            self.store.write(targets, deleted)
+            # Só o que foi gravado deixa de estar pendente
+            self._dirty.difference_update(targets)
+            self._deleted.difference_update(deleted)
+
+    def reload(self) -> None:
+        """Descarta cache local (após migração/import externo)."""
+        with self._lock:
+            self._cache.clear()
+            self._dirty.clear()
+            self._deleted.clear()
+            self._fully_loaded = False
+
+    def query_paths(self, **kwargs) -> List[str]:
+        """Pushdown de filtros/ordenação para SQL (ver SQLiteProjectStore.query_paths)."""
+        self.flush()
+        return self.store.query_paths(**kwargs)
+
+    def _load_all(self) -> None:
+        if self._fully_loaded:
+            return
+        with self._lock:
+            if self._fully_loaded:
+                return
+            self.flush()
+            loaded = self.store.load_all()
+            loaded.update(self._cache)  # mantém identidade dos dicts já entregues
+            self._cache = loaded
+            self._fully_loaded = True
+
+
+def migrate_json_to_sqlite(
+    json_path: str,
+    sqlite_path: str,
+    collections_path: Optional[str] = None,
+) -> int:
+    """
+    Migração one-shot do laserflix_database.json para SQLite.
+
+    Returns:
+        Número de projetos migrados
+    """
+    if not os.path.exists(json_path):
+        return 0
+    with open(json_path, "r", encoding="utf-8") as f:
+        database = json.load(f)
+
+    store = SQLiteProjectStore(sqlite_path)
+    try:
+        store.write(database)
+        if collections_path and os.path.exists(collections_path):
+            with open(collections_path, "r", encoding="utf-8") as f:
+                store.replace_collections(json.load(f))
+    finally:
+        store.close()
+
+    LOGGER.info("🗄️ Migração JSON → SQLite: %d projetos (%s)", len(database), sqlite_path)
+    return len(database)
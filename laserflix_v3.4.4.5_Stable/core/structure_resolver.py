@@ -0,0 +1,124 @@
+"""
+core/structure_resolver.py — Resumo cacheado da estrutura de arquivos do projeto.
+
+A análise IA, as descrições e o modal usam o mesmo resumo (tipos de
+arquivo, formatos SVG/PDF/DXF/AI, subpastas, contagens, bytes) — antes
+cada um refazia o os.walk() do projeto inteiro.
+
+CACHE NO REGISTRO DO PROJETO:
+    "structure":       resumo (ProjectScanner.analyze_project_structure)
+    "structure_mtime": st_mtime_ns da pasta quando o resumo foi calculado
+
+Mesmo validador da capa (core/cover_resolver.py): um os.stat() da pasta.
+Arquivos mudados só dentro de subpastas não alteram o mtime da raiz — o
+resumo é informativo (prompt da IA, painel do modal), e reanalisar o
+projeto não depende dele estar 100% atualizado.
+
+AQUECIMENTO: warm(paths) envia cada path ao pool (STRUCTURE_MAX_WORKERS
+threads — trabalho de I/O) sem criar thread por chamada; chamado pela
+importação a cada lote. Um único commit quando a fila de aquecimento
+esvazia (vários lotes seguidos = um commit no fim).
+
+THREADS: como na capa, com scheduler (UIScheduler) update_project/commit
+vão para a thread principal; até lá o resumo novo fica no memo em RAM.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+
+from config.settings import STRUCTURE_MAX_WORKERS
+from utils.logging_setup import LOGGER
+
+
+class StructureResolver:
+    """
+    Resolve o resumo usando o cache do registro; só percorre a pasta
+    quando o mtime dela mudou. Projetos fora do banco usam memo em RAM.
+    """
+
+    def __init__(self, db_manager, project_scanner, max_workers: int = STRUCTURE_MAX_WORKERS,
+                 scheduler=None):
+        self.db_manager = db_manager
+        self.project_scanner = project_scanner
+        self.scheduler = scheduler  # UIScheduler: update_project na thread principal
+        self.logger = LOGGER
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                            thread_name_prefix="Structure")
+        self._memo: Dict[str, Tuple[int, dict]] = {}
+        self._memo_lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        self._warming = 0  # paths enviados ao pool e ainda não resolvidos
+        self._warmed = 0   # resolvidos desde que a fila esvaziou pela última vez
+
+    def resolve(self, project_path: str) -> Optional[dict]:
+        try:
+            mtime = os.stat(project_path).st_mtime_ns
+        except OSError:
+            return None
+
+        data = self.db_manager.database.get(project_path) if self.db_manager else None
+        if data is not None and data.get("structure_mtime") == mtime and data.get("structure"):
+            return data["structure"]
+
+        with self._memo_lock:
+            memo = self._memo.get(project_path)
+        if memo and memo[0] == mtime:
+            return memo[1]
+        structure = self.project_scanner.analyze_project_structure(project_path)
+        with self._memo_lock:
+            self._memo[project_path] = (mtime, structure)
+        if data is not None:
+            self._on_main(self._save, project_path, structure, mtime)
+        return structure
+
+    def warm(self, paths: Iterable[str]) -> None:
+        """Calcula em segundo plano (não bloqueia); persiste quando a fila esvazia."""
+        paths = list(paths)
+        if not paths:
+            return
+        with self._warm_lock:
+            self._warming += len(paths)
+        for i, path in enumerate(paths):
+            try:
+                future = self._executor.submit(self._resolve_safe, path)
+            except RuntimeError:  # pool encerrado (shutdown): desconta o resto
+                self._warm_done(len(paths) - i, 0)
+                return
+            future.add_done_callback(
+                lambda f: self._warm_done(1, 1 if not f.cancelled() and f.result() else 0))
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_main(self, fn, *args) -> None:
+        """Executa na thread principal (via scheduler) ou direto, sem scheduler."""
+        if self.scheduler and threading.current_thread() is not threading.main_thread():
+            self.scheduler.post(fn, *args)
+        else:
+            fn(*args)
+
+    def _warm_done(self, count: int, resolved: int) -> None:
+        with self._warm_lock:
+            self._warming -= count
+            self._warmed += resolved
+            if self._warming:
+                return
+            done, self._warmed = self._warmed, 0
+        if self.db_manager:
+            self._on_main(self.db_manager.commit)  # depois dos _save já postados
+        self.logger.debug("🗂️ Estrutura calculada para %d projeto(s)", done)
+
+    def _save(self, project_path: str, structure: dict, mtime: int) -> None:
+        if project_path in self.db_manager.database:
+            self.db_manager.update_project(
+                project_path, structure=structure, structure_mtime=mtime)
+        with self._memo_lock:
+            self._memo.pop(project_path, None)
+
+    def _resolve_safe(self, project_path: str) -> Optional[dict]:
+        try:
+            return self.resolve(project_path)
+        except Exception as e:
+            self.logger.warning("Falha ao resumir estrutura de %s: %s", project_path, e)
+            return None
@@ -15,9 +15,12 @@ import os
 import queue
 import threading
 from collections import OrderedDict
-from PIL import Image, ImageTk
-from config.settings import THUMBNAIL_CACHE_LIMIT, THUMBNAIL_SIZE
+from PIL import ImageTk
+from config.settings import (
+    THUMBNAIL_CACHE_LIMIT, THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE, THUMBNAIL_REDUCING_GAP,
+)
 from config.constants import FILE_EXTENSIONS
+from utils.image_decode import decode_thumbnail
 from utils.logging_setup import LOGGER
 
 
@@ -160,8 +163,8 @@ class ThumbnailCache:
         if cached:
             return cached
         try:
-            img = Image.open(image_path)
-            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+            img = decode_thumbnail(
+                image_path, THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE, THUMBNAIL_REDUCING_GAP)
             photo = ImageTk.PhotoImage(img)
             self.set(image_path, photo)
             return photo
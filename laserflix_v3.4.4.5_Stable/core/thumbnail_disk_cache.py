@@ -0,0 +1,219 @@
+"""
+core/thumbnail_disk_cache.py — Cache em disco de thumbnails pré-redimensionadas.
+
+Evita reabrir e redimensionar a capa em resolução total (mockups de 4000px)
+a cada partida do app ou evicção do LRU em RAM.
+
+CHAVE (content-addressed):
+    sha1(caminho absoluto | mtime_ns | tamanho em bytes | largura x altura)
+    → <cache_dir>/<ab>/<sha1>.webp   (JPEG se o Pillow não tiver WebP)
+    Capa alterada/substituída = mtime/tamanho novos = chave nova.
+
+EVICÇÃO:
+    Limite total em bytes (THUMBNAIL_DISK_CACHE_MAX_MB). Ao estourar, remove
+    os arquivos menos usados (mtime é "tocado" a cada hit) até 90% do limite.
+
+ESTATÍSTICAS:
+    hits, misses, writes, evictions, bytes, files (ver get_stats()).
+"""
+import hashlib
+import os
+import threading
+from typing import Optional, Tuple
+
+from PIL import Image, features
+
+from utils.logging_setup import LOGGER
+
+
+_LOW_WATER = 0.9  # após evicção, fica em 90% do limite
+
+
+class ThumbnailDiskCache:
+    """
+    Cache de thumbnails em disco, thread-safe (usado pelos workers do preloader).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int,
+        thumbnail_size: Tuple[int, int],
+        image_format: str = "WEBP",
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.thumbnail_size = thumbnail_size
+        self.logger = LOGGER
+
+        if image_format.upper() == "WEBP" and not features.check("webp"):
+            image_format = "JPEG"
+        self.image_format = image_format.upper()
+        self._ext = ".webp" if self.image_format == "WEBP" else ".jpg"
+
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes, self.file_count = self._scan_usage()
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def load(self, image_path: str) -> Optional[Image.Image]:
+        """
+        Retorna a thumbnail cacheada de image_path (já decodificada) ou None.
+        """
+        entry = self._entry_path(image_path)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            img = Image.open(entry)
+            img.load()
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(entry)  # LRU: marca como usado recentemente
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return img
+
+    def store(self, image_path: str, img: Image.Image) -> None:
+        """
+        Grava thumbnail já redimensionada (escrita atômica: tmp + replace).
+        """
+        entry = self._entry_path(image_path)
+        if entry is None:
+            return
+        if self.image_format == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA", "L"):
+            img = img.convert("RGBA")
+
+        tmp = f"{entry}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            img.save(tmp, self.image_format, quality=85)
+            size = os.path.getsize(tmp)
+            existed = os.path.exists(entry)
+            os.replace(tmp, entry)
+        except (OSError, ValueError) as e:
+            self.logger.debug("Falha ao gravar thumb em disco (%s): %s", image_path, e)
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self.writes += 1
+            if not existed:
+                self.total_bytes += size
+                self.file_count += 1
+            over_limit = self.total_bytes > self.max_bytes
+        if over_limit and self._evict_lock.acquire(blocking=False):
+            try:
+                self.evict()
+            finally:
+                self._evict_lock.release()
+
+    def evict(self) -> int:
+        """
+        Remove entradas menos usadas até ficar abaixo de 90% do limite.
+
+        Returns:
+            Número de arquivos removidos
+        """
+        entries = []
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                full = os.path.join(root, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, full))
+        entries.sort()
+
+        total = sum(e[1] for e in entries)
+        target = int(self.max_bytes * _LOW_WATER)
+        removed = 0
+        for _mtime, size, full in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(full)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self.total_bytes = total
+            self.file_count = len(entries) - removed
+            self.evictions += removed
+        if removed:
+            self.logger.info("🗑️ Cache de thumbs em disco: %d arquivos removidos", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove todas as thumbnails do disco."""
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                try:
+                    os.remove(os.path.join(root, name))
+                except OSError:
+                    pass
+        with self._lock:
+            self.total_bytes = 0
+            self.file_count = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_pct": (self.hits / lookups * 100) if lookups else 0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "files": self.file_count,
+            }
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, image_path: str) -> Optional[str]:
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        w, h = self.thumbnail_size
+        raw = f"{os.path.abspath(image_path)}|{st.st_mtime_ns}|{st.st_size}|{w}x{h}"
+        key = hashlib.sha1(raw.encode("utf-8", "surrogateescape")).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + self._ext)
+
+    def _scan_usage(self) -> Tuple[int, int]:
+        total = count = 0
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                    count += 1
+                except OSError:
+                    pass
+        return total, count
@@ -12,27 +12,80 @@ REFERÊNCIA: Netflix Architecture
 CONCEITO:
   1. Carrega batch de 30 thumbnails em paralelo (ThreadPoolExecutor)
   2. Cache LRU otimizado (300 imagens em RAM)
-  3. Predictive preload (pré-carrega próxima página)
+  3. Predictive preload (pré-carrega páginas vizinhas; ver
+     ui/managers/thumbnail_prefetcher.py)
   4. Adaptive quality (reduz resolução se lento)
+  5. Cache em disco (ThumbnailDiskCache): partida a frio só decodifica
+     thumbs pequenas já redimensionadas
+  6. Capa resolvida UMA vez por pedido via CoverResolver (cache no
+     registro do projeto, validado pelo mtime da pasta)
+  7. Workers só decodificam (PIL.Image); ImageTk.PhotoImage é criada na
+     thread principal por drain(), em lote e dentro de um orçamento por
+     frame (ver ui/managers/thumbnail_batcher.py)
+  8. Fila por prioridade (cards visíveis antes de prefetch), cancelável
+     (card destruído / troca de página) e com coalescência: pedidos da
+     mesma capa viram UMA decodificação com vários assinantes
+  9. prefetch(): até a capa é resolvida no worker (os.stat/listdir da
+     pasta — lento em compartilhamento de rede); a thread principal só
+     enfileira
 
 PERFORMANCE:
   - Antes: 1 thread, 100 thumbs × 200ms = 20 segundos
   - Depois: 4 threads, 30 thumbs × 50ms = 1.5 segundos (paralelo)
   - Speedup: 13.3x
 """
-import os
+import heapq
+import itertools
 import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 from typing import List, Callable, Optional, Tuple
 from PIL import Image, ImageTk
 
-from config.settings import THUMBNAIL_CACHE_LIMIT, THUMBNAIL_SIZE
-from config.constants import FILE_EXTENSIONS
+from config.settings import (
+    THUMBNAIL_CACHE_LIMIT, THUMBNAIL_SIZE,
+    THUMBNAIL_DISK_CACHE_ENABLED, THUMBNAIL_DISK_CACHE_DIR,
+    THUMBNAIL_DISK_CACHE_MAX_MB, THUMBNAIL_DISK_CACHE_FORMAT,
+    THUMBNAIL_RESAMPLE, THUMBNAIL_REDUCING_GAP,
+)
+from core.cover_resolver import CoverResolver, find_first_image
+from core.thumbnail_disk_cache import ThumbnailDiskCache
+from utils.image_decode import decode_thumbnail
 from utils.logging_setup import LOGGER
 
 
+# Prioridades da fila (menor = antes)
+PRIORITY_VISIBLE = 0   # cards na tela
+PRIORITY_PREFETCH = 1  # páginas vizinhas / navegação do modal
+
+
+class ThumbJob:
+    """Decodificação de uma capa (coalesce todos os pedidos da mesma imagem)."""
+
+    __slots__ = ("img_path", "priority", "subscribers", "running", "cancelled")
+
+    def __init__(self, img_path: str, priority: int):
+        self.img_path = img_path
+        self.priority = priority
+        self.subscribers: List["ThumbSubscription"] = []
+        self.running = False
+        self.cancelled = False
+
+
+class ThumbSubscription:
+    """Pedido de um card; unsubscribe() o desliga do job."""
+
+    __slots__ = ("job", "project_path", "callback", "active")
+
+    def __init__(self, job: ThumbJob, project_path: str, callback):
+        self.job = job
+        self.project_path = project_path
+        self.callback = callback
+        self.active = True
+
+
 class ThumbnailPreloader:
     """
     Carregador paralelo de thumbnails com cache LRU.
@@ -40,8 +93,6 @@ class ThumbnailPreloader:
     ARQUITETURA:
     ┌───────────────────────────────────┐
     │  MAIN THREAD (UI)                  │
-    │  │                                   │
-    │  ├──> preload_batch([30 paths])     │
     ├───────────────────────────────────┤
     │  THREAD POOL (4 workers)           │
     │  ┌────────┐ ┌────────┐         │
@@ -49,7 +100,11 @@ class ThumbnailPreloader:
     │  └────────┘ └────────┘         │
     │       │           │                 │
     │       v           v                 │
-    │  Carrega 8 thumbs em paralelo      │
+    │  Decodifica 8 thumbs em paralelo   │
+    │  (PIL.Image → fila de resultados)  │
+    ├───────────────────────────────────┤
+    │  MAIN THREAD: drain(orçamento)     │
+    │  PIL.Image → PhotoImage → callback │
     ├───────────────────────────────────┤
     │  LRU CACHE (300 images)            │
     │  ┌─────────────────────────┐    │
@@ -63,16 +118,22 @@ class ThumbnailPreloader:
         max_workers: int = 4,
         cache_limit: int = THUMBNAIL_CACHE_LIMIT,
         thumbnail_size: Tuple[int, int] = THUMBNAIL_SIZE,
+        resample: str = THUMBNAIL_RESAMPLE,
+        cover_resolver: Optional[CoverResolver] = None,
     ):
         """
         Args:
             max_workers: Número de threads paralelas (4 = bom para 4+ cores)
             cache_limit: Máx de imagens em cache (300 = ~150MB RAM)
             thumbnail_size: Tamanho alvo (280, 410)
+            resample: Filtro final do resize (ver utils.image_decode)
+            cover_resolver: Resolução cacheada da capa (None = lista a pasta)
         """
         self.max_workers = max_workers
         self.cache_limit = cache_limit
         self.thumbnail_size = thumbnail_size
+        self.resample = resample
+        self.cover_resolver = cover_resolver
         
         # ThreadPoolExecutor (padrão Netflix)
         self.executor = ThreadPoolExecutor(
@@ -84,139 +145,286 @@ class ThumbnailPreloader:
         self.cache = OrderedDict()
         self.cache_lock = threading.Lock()
         
+        # Fila de decodificação: heap (prioridade, seq, img_path) + jobs
+        # coalescidos por imagem. Entradas obsoletas do heap são puladas.
+        self._jobs: dict = {}
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._queue_lock = threading.Lock()
+        self._pending = 0  # jobs ainda não entregues por drain()
+        self._resolving = 0  # prefetch() com a capa ainda sendo resolvida
+        
+        # Decodificações prontas aguardando PhotoImage na thread principal:
+        # (ThumbJob, PIL.Image | None)
+        self.results: "queue.Queue[tuple]" = queue.Queue()
+        
         self.logger = LOGGER
+        
+        # Cache em disco (thumbs já redimensionadas)
+        self.disk_cache = None
+        if THUMBNAIL_DISK_CACHE_ENABLED:
+            try:
+                self.disk_cache = ThumbnailDiskCache(
+                    THUMBNAIL_DISK_CACHE_DIR,
+                    THUMBNAIL_DISK_CACHE_MAX_MB * 1024 * 1024,
+                    thumbnail_size,
+                    THUMBNAIL_DISK_CACHE_FORMAT,
+                )
+            except OSError as e:
+                self.logger.warning("Cache de thumbs em disco indisponível: %s", e)
         self.logger.info(
             f"📷 Thumbnail Preloader iniciado: {max_workers} threads, "
             f"cache {cache_limit} images"
         )
 
-    def preload_batch(
+    def preload_single(
         self,
-        project_paths: List[str],
+        project_path: str,
         callback: Optional[Callable[[str, ImageTk.PhotoImage], None]] = None,
-    ) -> dict:
+        priority: int = PRIORITY_VISIBLE,
+    ) -> Optional[ImageTk.PhotoImage]:
         """
-        Carrega batch de thumbnails em paralelo.
+        Carrega thumbnail única (usado por cards individuais).
         
-        PADRÃO NETFLIX:
-        - Divide batch em 4 threads
-        - Cada thread processa 7-8 thumbnails
-        - Callback executado na thread principal (Tkinter-safe)
+        Chamar na thread principal. Cache hit → callback imediato; senão
+        o worker decodifica e o callback é entregue por drain().
         
         Args:
-            project_paths: Lista de caminhos de projetos
+            project_path: Caminho do projeto
             callback: Função(path, photo) chamada quando carregar
+            priority: PRIORITY_VISIBLE ou PRIORITY_PREFETCH
         
         Returns:
-            dict: {path: PhotoImage} - thumbs carregadas com sucesso
-        
-        PERFORMANCE:
-            30 thumbs × 200ms = 6000ms serial
-            30 thumbs / 4 threads = 7.5 thumbs/thread × 200ms = 1500ms paralelo
-            Speedup: 4x
+            PhotoImage (cache hit) ou None
         """
-        if not project_paths:
-            return {}
-        
-        results = {}
-        futures = []
+        img_path = self.find_first_image(project_path)
+        if not img_path:
+            return None
         
-        # 1. SUBMIT PARALLEL TASKS
-        for path in project_paths:
-            # Verifica cache primeiro
-            cached = self._get_from_cache(path)
-            if cached:
-                results[path] = cached
-                if callback:
-                    callback(path, cached)
-                continue
-            
-            # Não em cache - agenda carregamento paralelo
-            future = self.executor.submit(self._load_thumbnail, path)
-            futures.append((path, future))
+        # Verifica cache
+        cached = self._get_from_cache(img_path)
+        if cached:
+            if callback:
+                callback(project_path, cached)
+            return cached
         
-        # 2. COLLECT RESULTS (as completed)
-        for path, future in futures:
-            try:
-                photo = future.result(timeout=2.0)  # 2s timeout por thumb
-                if photo:
-                    results[path] = photo
-                    self._add_to_cache(path, photo)
-                    
-                    if callback:
-                        # Callback executado na thread principal
-                        callback(path, photo)
-            
-            except Exception as e:
-                self.logger.warning(f"Erro ao carregar thumb de {path}: {e}")
+        self._enqueue(img_path, priority, project_path, callback)
+        return None  # Retorna None, drain() entregará depois
+
+    def prefetch(self, project_path: str, priority: int = PRIORITY_PREFETCH) -> bool:
+        """
+        Aquece o cache sem callback. Não faz I/O na thread chamadora: a
+        capa é resolvida no worker, que então enfileira a decodificação.
         
-        return results
+        Returns:
+            False se o executor já foi encerrado
+        """
+        with self._queue_lock:
+            self._resolving += 1
+            self._pending += 1
+        try:
+            self.executor.submit(self._resolve_and_enqueue, project_path, priority)
+        except RuntimeError:  # executor encerrado (shutdown)
+            self._resolved()
+            return False
+        return True
 
-    def preload_single(
+    def subscribe(
         self,
         project_path: str,
-        callback: Optional[Callable[[str, ImageTk.PhotoImage], None]] = None,
-    ) -> Optional[ImageTk.PhotoImage]:
+        callback: Callable[[str, ImageTk.PhotoImage], None],
+        priority: int = PRIORITY_VISIBLE,
+    ) -> Optional[ThumbSubscription]:
         """
-        Carrega thumbnail única (usado por cards individuais).
-        
-        Args:
-            project_path: Caminho do projeto
-            callback: Função(path, photo) chamada quando carregar
+        Como preload_single, mas devolve a assinatura para cancelamento.
         
         Returns:
-            PhotoImage ou None
+            ThumbSubscription, ou None (cache hit já entregue / sem capa)
         """
-        # Verifica cache
-        cached = self._get_from_cache(project_path)
+        img_path = self.find_first_image(project_path)
+        if not img_path:
+            return None
+        cached = self._get_from_cache(img_path)
         if cached:
-            if callback:
-                callback(project_path, cached)
-            return cached
+            callback(project_path, cached)
+            return None
+        return self._enqueue(img_path, priority, project_path, callback)
+
+    def unsubscribe(self, sub: ThumbSubscription) -> None:
+        """
+        Desliga o card do job. Job visível sem assinantes é cancelado
+        (prefetch continua: o objetivo dele é só aquecer o cache).
+        """
+        with self._queue_lock:
+            if not sub.active:
+                return
+            sub.active = False
+            job = sub.job
+            if job.priority == PRIORITY_VISIBLE and not any(s.active for s in job.subscribers):
+                self._cancel_job(job)
+
+    def cancel_pending(self, min_priority: int = PRIORITY_VISIBLE) -> int:
+        """
+        Cancela jobs com prioridade >= min_priority (troca de página/filtro).
+        Jobs já em decodificação terminam, mas não viram PhotoImage.
         
-        # Carrega assíncronamente
-        def _async_load():
-            photo = self._load_thumbnail(project_path)
-            if photo:
-                self._add_to_cache(project_path, photo)
-                if callback:
-                    callback(project_path, photo)
+        Returns:
+            Número de jobs cancelados
+        """
+        with self._queue_lock:
+            jobs = [j for j in self._jobs.values() if j.priority >= min_priority]
+            for job in jobs:
+                for sub in job.subscribers:
+                    sub.active = False
+                self._cancel_job(job)
+        return len(jobs)
+
+    def _enqueue(self, img_path: str, priority: int, project_path: str,
+                 callback) -> Optional[ThumbSubscription]:
+        submit = False
+        with self._queue_lock:
+            job = self._jobs.get(img_path)
+            if job is None:
+                job = self._jobs[img_path] = ThumbJob(img_path, priority)
+                self._pending += 1
+                submit = True
+            else:
+                job.cancelled = False  # revive job cancelado ainda em execução
+                if not job.running and priority < job.priority:
+                    job.priority = priority  # promove: nova entrada no heap
+                    submit = True
+            if submit:
+                heapq.heappush(self._heap, (job.priority, next(self._seq), img_path))
+            sub = None
+            if callback:
+                sub = ThumbSubscription(job, project_path, callback)
+                job.subscribers.append(sub)
+        if submit:
+            try:
+                self.executor.submit(self._run_next)
+            except RuntimeError:  # executor encerrado (shutdown): desfaz o job
+                with self._queue_lock:
+                    self._cancel_job(job)
+                return None
+        return sub
+
+    def _resolve_and_enqueue(self, project_path: str, priority: int) -> None:
+        """Worker (prefetch): resolve a capa e enfileira se não estiver em cache."""
+        try:
+            img_path = self.find_first_image(project_path)
+            if img_path and self._get_from_cache(img_path) is None:
+                self._enqueue(img_path, priority, project_path, None)
+        except Exception as e:
+            self.logger.debug(f"Prefetch de thumb falhou ({project_path}): {e}")
+        finally:
+            self._resolved()
+
+    def _resolved(self) -> None:
+        with self._queue_lock:
+            self._resolving -= 1
+            self._pending -= 1
+
+    def _cancel_job(self, job: ThumbJob) -> None:
+        """Com _queue_lock. Job na fila sai já; em execução sai em drain()."""
+        if job.cancelled:
+            return
+        job.cancelled = True
+        if not job.running and self._jobs.get(job.img_path) is job:
+            del self._jobs[job.img_path]
+            self._pending -= 1
+
+    def _run_next(self) -> None:
+        """
+        Worker: decodifica o job de maior prioridade ainda válido.
         
-        self.executor.submit(_async_load)
-        return None  # Retorna None, callback entregará depois
+        Uma tarefa do executor por entrada do heap; entradas de jobs
+        cancelados ou promovidos são descartadas.
+        """
+        with self._queue_lock:
+            while self._heap:
+                priority, _seq, img_path = heapq.heappop(self._heap)
+                job = self._jobs.get(img_path)
+                if (job is not None and not job.running and not job.cancelled
+                        and job.priority == priority):
+                    job.running = True
+                    break
+            else:
+                return
+        img = self._decode_image(img_path)
+        self.results.put((job, img))
+
+    def queued_count(self) -> int:
+        """Jobs na fila que ainda não começaram a decodificar (ou resolver a capa)."""
+        with self._queue_lock:
+            return self._resolving + sum(1 for job in self._jobs.values() if not job.running)
 
-    def _load_thumbnail(self, project_path: str) -> Optional[ImageTk.PhotoImage]:
+    def has_pending(self) -> bool:
+        """Há decodificações na fila, em andamento ou aguardando drain()."""
+        return self._pending > 0
+
+    def drain(self, budget_s: float) -> int:
         """
-        Carrega thumbnail de forma síncrona (chamado em thread worker).
+        Converte decodificações prontas em PhotoImage e entrega os callbacks.
         
-        OTIMIZAÇÕES:
-        - Busca primeira imagem (fast scan)
-        - Usa LANCZOS (melhor qualidade)
-        - Cache mtime (invalida se arquivo mudar)
+        THREAD PRINCIPAL: única parte que toca o Tk. Para quando a fila
+        esvazia ou o orçamento do frame acaba (sempre processa ao menos 1).
         
         Args:
-            project_path: Caminho do projeto
+            budget_s: Tempo máximo gasto neste frame (segundos)
         
         Returns:
-            PhotoImage ou None
+            Número de resultados processados
+        """
+        deadline = time.perf_counter() + budget_s
+        done = 0
+        while True:
+            try:
+                job, img = self.results.get_nowait()
+            except queue.Empty:
+                break
+            with self._queue_lock:
+                if self._jobs.get(job.img_path) is job:
+                    del self._jobs[job.img_path]
+                self._pending -= 1
+                subs = [sub for sub in job.subscribers if sub.active]
+            done += 1
+            if img is not None and not job.cancelled:
+                photo = self._get_from_cache(job.img_path)
+                if photo is None:
+                    try:
+                        photo = ImageTk.PhotoImage(img)
+                    except Exception as e:
+                        self.logger.debug(f"Erro ao criar PhotoImage de {job.img_path}: {e}")
+                        photo = None
+                    if photo:
+                        self._add_to_cache(job.img_path, photo)
+                for sub in subs if photo else ():
+                    try:
+                        sub.callback(sub.project_path, photo)
+                    except Exception as e:
+                        self.logger.debug(f"Callback de thumb falhou ({sub.project_path}): {e}")
+            if time.perf_counter() >= deadline:
+                break
+        return done
+
+    def _decode_image(self, img_path: str) -> Optional[Image.Image]:
+        """
+        Decodifica thumbnail de uma imagem já resolvida (thread worker).
+        
+        Não cria PhotoImage: Tk não é thread-safe fora da thread principal.
         """
         try:
-            # 1. ENCONTRA PRIMEIRA IMAGEM
-            img_path = self.find_first_image(project_path)  # ← HOT-09a: agora público
-            if not img_path:
-                return None
-            
-            # 2. CARREGA E REDIMENSIONA
-            img = Image.open(img_path)
-            img.thumbnail(self.thumbnail_size, Image.Resampling.LANCZOS)
-            
-            # 3. CONVERTE PARA PHOTOIMAGE (Tkinter)
-            photo = ImageTk.PhotoImage(img)
-            
-            return photo
+            # 2. CACHE EM DISCO → senão CARREGA E REDIMENSIONA
+            img = self.disk_cache.load(img_path) if self.disk_cache else None
+            if img is None:
+                img = decode_thumbnail(
+                    img_path, self.thumbnail_size, self.resample, THUMBNAIL_REDUCING_GAP)
+                if self.disk_cache:
+                    self.disk_cache.store(img_path, img)
+            return img
         
         except Exception as e:
-            self.logger.debug(f"Erro ao carregar thumb de {project_path}: {e}")
+            self.logger.debug(f"Erro ao carregar thumb de {img_path}: {e}")
             return None
 
     def find_first_image(self, project_path: str) -> Optional[str]:
@@ -225,7 +433,8 @@ class ThumbnailPreloader:
         
         Encontra primeira imagem válida no projeto.
         
-        OTIMIZAÇÃO: Busca superficial (não recursiva)
+        OTIMIZAÇÃO: CoverResolver (cache no registro, validado pelo mtime
+        da pasta); sem resolver, busca superficial (não recursiva).
         
         Args:
             project_path: Caminho do projeto
@@ -233,38 +442,23 @@ class ThumbnailPreloader:
         Returns:
             Caminho absoluto da imagem ou None
         """
-        valid_extensions = FILE_EXTENSIONS["images"]
-        
-        try:
-            for item in sorted(os.listdir(project_path)):
-                if item.lower().endswith(valid_extensions):
-                    full_path = os.path.join(project_path, item)
-                    if os.path.isfile(full_path):
-                        return full_path
-        except Exception:
-            pass
-        
-        return None
+        if self.cover_resolver:
+            return self.cover_resolver.resolve(project_path)
+        return find_first_image(project_path)
 
-    def _get_from_cache(self, project_path: str) -> Optional[ImageTk.PhotoImage]:
+    def _get_from_cache(self, img_path: str) -> Optional[ImageTk.PhotoImage]:
         """
         Busca thumbnail no cache LRU.
         
         THREAD-SAFE: Lock para evitar race conditions.
         
         Args:
-            project_path: Caminho do projeto
+            img_path: Imagem de capa já resolvida
         
         Returns:
             PhotoImage cacheado ou None
         """
         with self.cache_lock:
-            # Busca primeira imagem
-            img_path = self.find_first_image(project_path)
-            if not img_path:
-                return None
-            
-            # Verifica cache
             cached = self.cache.get(img_path)
             if cached:
                 # Move para final (LRU - most recently used)
@@ -275,7 +469,7 @@ class ThumbnailPreloader:
 
     def _add_to_cache(
         self,
-        project_path: str,
+        img_path: str,
         photo: ImageTk.PhotoImage
     ) -> None:
         """
@@ -284,13 +478,9 @@ class ThumbnailPreloader:
         EVICÇÃO: Remove imagem mais antiga se cache cheio.
         
         Args:
-            project_path: Caminho do projeto
+            img_path: Imagem de capa já resolvida
             photo: PhotoImage carregada
         """
-        img_path = self.find_first_image(project_path)
-        if not img_path:
-            return
-        
         with self.cache_lock:
             # Adiciona ao cache
             self.cache[img_path] = photo
@@ -322,10 +512,16 @@ class ThumbnailPreloader:
         """
         with self.cache_lock:
             cache_size = len(self.cache)
+        queued = self.queued_count()
         
-        return {
+        stats = {
             "cache_size": cache_size,
             "cache_limit": self.cache_limit,
             "cache_usage_pct": (cache_size / self.cache_limit * 100) if self.cache_limit > 0 else 0,
             "max_workers": self.max_workers,
+            "pending": self._pending,
+            "queued": queued,
         }
+        if self.disk_cache:
+            stats.update({f"disk_{k}": v for k, v in self.disk_cache.get_stats().items()})
+        return stats
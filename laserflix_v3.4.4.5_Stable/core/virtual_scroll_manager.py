@@ -15,13 +15,25 @@ CONCEITO:
   3. Atualiza apenas dados, não estrutura DOM
   4. Scroll event driven (60 FPS)
 
+MODO SCROLL INFINITO (main window):
+  - Lista completa = paths filtrados+ordenados (dados buscados sob demanda)
+  - Cards são janelas do próprio canvas (create_window em x/y absolutos):
+    um Frame de 2M px estouraria o limite de 32767 px de janelas X11
+  - scrollregion dimensionada pelo total de linhas; header (scrollable_frame)
+    fica no topo e os cards começam logo abaixo dele
+  - Card que sai do range vai para o pool (item oculto); quem entra pega um
+    do pool e só chama card.update(path, data) + canvas.coords()
+
 ECONOMIA:
   - Antes: 2585 cards × 15 widgets = 38.775 widgets
   - Depois: 30 cards × 15 widgets = 450 widgets
   - Redução: 98.8%
 """
+import math
 import tkinter as tk
-from typing import List, Callable, Tuple, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from config.card_layout import COLS, CARD_W, CARD_H, CARD_PAD
 from utils.logging_setup import LOGGER
 
 
@@ -36,258 +48,259 @@ class VirtualScrollManager:
     │  │ 1 │ │ 2 │ │ 3 │ ...     │
     │  └───┘ └───┘ └───┘         │
     ├─────────────────────────────┤
-    │  BUFFER (pré-carregado)     │  ← +12 cards buffer
+    │  BUFFER (pré-carregado)     │  ← +1 linha acima/abaixo
     │  ┌───┐ ┌───┐               │
     │  │ 19│ │ 20│ ...            │
     │  └───┘ └───┘               │
     └─────────────────────────────┘
     
-    Total: 30 cards renderizados (vs 2585)
+    Total: ~30 cards renderizados (vs 30k)
     """
 
     def __init__(
         self,
         canvas: tk.Canvas,
         scrollable_frame: tk.Frame,
-        data: List,
-        card_renderer: Callable,
-        cols: int = 6,
-        card_width: int = 280,
-        card_height: int = 410,
-        card_pad: int = 8,
-        buffer_multiplier: float = 1.5,
+        data: Sequence[str],
+        card_factory: Callable,
+        data_getter: Callable[[str], dict],
+        cols: int = COLS,
+        card_width: int = CARD_W,
+        card_height: int = CARD_H,
+        card_pad: int = CARD_PAD,
+        buffer_rows: int = 1,
     ):
         """
         Args:
-            canvas: Canvas com scroll
-            scrollable_frame: Frame interno do canvas
-            data: Lista de (path, project_data) tuples
-            card_renderer: Função que renderiza card (path, data, row, col) -> widget
+            canvas: Canvas com scroll (pai dos cards)
+            scrollable_frame: Frame do header, janela do canvas em (0, 0)
+            data: Paths filtrados+ordenados (lista completa, leve)
+            card_factory: Função (parent) -> card reciclável com .frame,
+                          .update(path, data), .release() e .destroy()
+                          (ver ui.project_card.ProjectCard)
+            data_getter: path -> registro do projeto (buscado só para cards visíveis)
             cols: Colunas do grid
             card_width/height: Dimensões do card
             card_pad: Padding entre cards
-            buffer_multiplier: Buffer acima/abaixo (1.5 = 50% extra)
+            buffer_rows: Linhas extras renderizadas acima/abaixo do viewport
         """
         self.canvas = canvas
         self.scrollable_frame = scrollable_frame
-        self.data = data  # Lista completa (leve - só metadados)
-        self.card_renderer = card_renderer
+        self.data = data  # Lista completa (leve - só paths)
+        self.card_factory = card_factory
+        self.data_getter = data_getter
         
         self.cols = cols
         self.card_width = card_width
         self.card_height = card_height
         self.card_pad = card_pad
-        self.buffer_multiplier = buffer_multiplier
+        self.buffer_rows = buffer_rows
+        self.row_height = card_height + card_pad * 2
         
-        # Widget pool (padrão RecyclerView)
-        self.widget_pool: List[tk.Widget] = []
-        self.active_widgets: dict = {}  # {index: widget}
+        # Widget pool (padrão RecyclerView): (card, item_id) com item oculto
+        self.widget_pool: List[tuple] = []
+        self.active_widgets: Dict[int, tuple] = {}  # {index: (card, item_id)}
+        self.created = 0  # cards construídos (o resto foi reciclado)
+        self._signatures: Dict[int, tuple] = {}  # {index: (path, assinatura)} p/ patch_data
+        self.signature: Optional[Callable[[str, dict], tuple]] = None
         
         # Estado de scroll
         self.visible_range: Tuple[int, int] = (0, 0)
-        self.last_scroll_pos: float = 0.0
+        self._layout_width = 0
         self._scroll_update_pending = False  # ← HOT-07e: Previne loop
         
-        self.logger = LOGGER
-        
-        # Calcula viewport
-        self._calculate_viewport()
+        # Callback (conectado pela UI): faixa renderizada mudou (start, end)
+        self.on_range_changed: Optional[Callable[[int, int], None]] = None
         
-        # Bind scroll event
-        self.canvas.bind("<Configure>", self._on_canvas_resize)
-        # ← HOT-07e: REMOVIDO _setup_scroll_callback (causava loop infinito)
+        self.logger = LOGGER
 
-    def _calculate_viewport(self) -> None:
-        """
-        Calcula quantos cards cabem no viewport + buffer.
-        
-        EXEMPLO (1920×1080):
-          - Cards por linha: 6
-          - Linhas visíveis: 2.6 → 3
-          - Cards visíveis: 6 × 3 = 18
-          - Buffer: 18 × 1.5 = 27 → 30 total
-        """
-        try:
-            viewport_height = self.canvas.winfo_height()
-            if viewport_height <= 1:
-                viewport_height = 1080  # Fallback
-            
-            # Linhas visíveis
-            row_height = self.card_height + (self.card_pad * 2)
-            visible_rows = max(1, int(viewport_height / row_height))
-            
-            # Total de cards visíveis
-            visible_cards = visible_rows * self.cols
-            
-            # Buffer (pré-carrega acima/abaixo)
-            buffer_cards = int(visible_cards * self.buffer_multiplier)
-            
-            self.viewport_size = visible_cards
-            self.buffer_size = buffer_cards
-            self.max_pool_size = visible_cards + buffer_cards
-            
-            self.logger.info(
-                f"📐 Viewport calculado: {visible_rows} linhas × {self.cols} cols = "
-                f"{visible_cards} visíveis + {buffer_cards} buffer = {self.max_pool_size} total"
-            )
-        except Exception as e:
-            self.logger.warning(f"Erro ao calcular viewport: {e}, usando padrão")
-            self.viewport_size = 18
-            self.buffer_size = 12
-            self.max_pool_size = 30
+    # ------------------------------------------------------------------
+    # Geometria
+    # ------------------------------------------------------------------
 
-    def _on_canvas_resize(self, event=None) -> None:
-        """
-        Recalcula viewport quando janela redimensiona.
-        """
-        self._calculate_viewport()
-        self.update_visible_items()
+    @property
+    def total_rows(self) -> int:
+        return (len(self.data) + self.cols - 1) // self.cols
+
+    def _top_offset(self) -> int:
+        """Altura do header (scrollable_frame) acima do primeiro card."""
+        return self.scrollable_frame.winfo_reqheight()
+
+    def _cell_width(self) -> float:
+        stride = self.card_width + self.card_pad * 2
+        return max(stride, self._layout_width / self.cols)
+
+    def _position(self, idx: int) -> Tuple[float, float]:
+        """Canto superior esquerdo do card idx (centralizado na coluna, como o grid)."""
+        row, col = divmod(idx, self.cols)
+        cell = self._cell_width()
+        x = col * cell + (cell - self.card_width) / 2
+        y = self._top_offset() + row * self.row_height + self.card_pad
+        return x, y
+
+    def update_scrollregion(self) -> None:
+        """scrollregion cobre header + TODAS as linhas (não só as renderizadas)."""
+        width = max(self.canvas.winfo_width(), self.scrollable_frame.winfo_reqwidth())
+        height = self._top_offset() + self.total_rows * self.row_height + self.card_pad
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def visible_index_range(self) -> Tuple[int, int]:
+        """Índices [start, end) que intersectam o viewport (+ buffer)."""
+        top = self.canvas.canvasy(0) - self._top_offset()
+        bottom = top + max(1, self.canvas.winfo_height())
+        first_row = max(0, int(top // self.row_height) - self.buffer_rows)
+        last_row = min(self.total_rows, int(math.ceil(bottom / self.row_height)) + self.buffer_rows)
+        start = first_row * self.cols
+        end = min(len(self.data), max(first_row, last_row) * self.cols)
+        return start, end
 
-    def update_visible_items(self) -> None:
+    # ------------------------------------------------------------------
+    # Renderização
+    # ------------------------------------------------------------------
+
+    def update_visible_items(self, force: bool = False) -> None:
         """
         CORE: Atualiza apenas items visíveis no viewport.
         
         PADRÃO RECYCLERVIEW:
         1. Calcula range visível baseado em scroll
-        2. Recicla widgets existentes (widget pooling)
-        3. Atualiza apenas dados (não recria estrutura)
+        2. Recicla widgets que saíram do range
+        3. Renderiza apenas índices novos
         
-        PERFORMANCE: O(30) vs O(2585) - redução de 98.8%
+        PERFORMANCE: O(30) vs O(30k)
         """
         # ← HOT-07e: Previne calls recursivos
         if self._scroll_update_pending:
             return
         
-        if not self.data:
-            return
-        
         self._scroll_update_pending = True
-        
         try:
-            # 1. CALCULA RANGE VISÍVEL
-            scroll_pos = self.canvas.yview()[0]  # 0.0 a 1.0
-            total_items = len(self.data)
-            total_rows = (total_items + self.cols - 1) // self.cols
-            
-            row_height = self.card_height + (self.card_pad * 2)
-            total_height = total_rows * row_height
-            
-            # Posição absoluta do scroll (pixels)
-            scroll_pixels = scroll_pos * total_height
-            
-            # Primeira linha visível
-            first_visible_row = max(0, int(scroll_pixels / row_height) - 1)  # -1 buffer acima
+            width = self.canvas.winfo_width()
+            if width != self._layout_width:
+                self._layout_width = width
+                self._relayout()
             
-            # Última linha visível (com buffer abaixo)
-            visible_rows = (self.viewport_size // self.cols) + 2  # +2 buffer
-            last_visible_row = min(total_rows, first_visible_row + visible_rows)
-            
-            # Converte para índices de items
-            start_idx = first_visible_row * self.cols
-            end_idx = min(total_items, last_visible_row * self.cols)
-            
-            new_range = (start_idx, end_idx)
-            
-            # Se range não mudou, skip
-            if new_range == self.visible_range:
+            new_range = self.visible_index_range() if self.data else (0, 0)
+            if new_range == self.visible_range and not force:
                 return
-            
             self.visible_range = new_range
             
-            # 2. WIDGET POOLING: Recicla widgets fora do viewport
-            self._recycle_widgets(start_idx, end_idx)
-            
-            # 3. RENDERIZA APENAS NOVOS ITEMS
-            self._render_visible_items(start_idx, end_idx)
-        
+            self._recycle_widgets(*new_range)
+            self._render_visible_items(*new_range)
         finally:
             self._scroll_update_pending = False
+        
+        if self.on_range_changed:
+            self.on_range_changed(*self.visible_range)
+
+    def _relayout(self) -> None:
+        """Largura do canvas mudou: reposiciona cards ativos."""
+        for idx, (_widget, item) in self.active_widgets.items():
+            self.canvas.coords(item, *self._position(idx))
+        self.update_scrollregion()
 
     def _recycle_widgets(self, start_idx: int, end_idx: int) -> None:
         """
-        Remove widgets fora do viewport e adiciona ao pool.
-        
-        PADRÃO: ViewHolder pattern (Android RecyclerView)
+        Move cards fora do viewport para o pool (ViewHolder pattern).
         """
-        to_remove = []
-        for idx, widget in self.active_widgets.items():
-            if idx < start_idx or idx >= end_idx:
-                # Fora do viewport - remove e adiciona ao pool
-                widget.grid_forget()
-                self.widget_pool.append(widget)
-                to_remove.append(idx)
-        
-        for idx in to_remove:
-            del self.active_widgets[idx]
+        for idx in [i for i in self.active_widgets if i < start_idx or i >= end_idx]:
+            card, item = self.active_widgets.pop(idx)
+            self._signatures.pop(idx, None)
+            card.release()
+            self.canvas.itemconfigure(item, state="hidden")
+            self.widget_pool.append((card, item))
 
     def _render_visible_items(self, start_idx: int, end_idx: int) -> None:
         """
-        Renderiza items visíveis usando widget pool.
-        
-        OTIMIZAÇÃO:
-        - Reutiliza widgets do pool (não recria)
-        - Atualiza apenas dados (bind)
+        Preenche índices do range sem card: reaproveita do pool (update +
+        coords) e só constrói card novo quando o pool está vazio.
         """
         for idx in range(start_idx, end_idx):
-            if idx >= len(self.data):
-                break
-            
-            # Já renderizado? Skip
             if idx in self.active_widgets:
                 continue
             
-            # Calcula posição no grid
-            row = (idx // self.cols) + 2  # +2 pula header
-            col = idx % self.cols
-            
-            # Pega dados
-            project_path, project_data = self.data[idx]
-            
-            # Renderiza card (usa pool se disponível)
-            widget = self.card_renderer(
-                self.scrollable_frame, 
-                project_path, 
-                project_data, 
-                row, 
-                col
-            )
+            project_path = self.data[idx]
+            project_data = self.data_getter(project_path)
+            if project_data is None:
+                continue
             
-            self.active_widgets[idx] = widget
+            x, y = self._position(idx)
+            if self.widget_pool:
+                card, item = self.widget_pool.pop()
+                card.update(project_path, project_data)
+                self.canvas.coords(item, x, y)
+                self.canvas.itemconfigure(item, state="normal")
+            else:
+                card = self.card_factory(self.canvas)
+                card.update(project_path, project_data)
+                item = self.canvas.create_window(
+                    x, y, window=card.frame, anchor="nw",
+                    width=self.card_width, height=self.card_height)
+                self.created += 1
+            self.active_widgets[idx] = (card, item)
+            if self.signature:
+                self._signatures[idx] = (project_path, self.signature(project_path, project_data))
 
-    def refresh_data(self, new_data: List) -> None:
+    def patch_data(self, new_data: Sequence[str], signature: Callable[[str, dict], tuple]) -> None:
         """
-        Atualiza dataset completo (ex: após filtro).
-        
-        Args:
-            new_data: Nova lista de (path, project_data)
+        Troca a lista mantendo a posição do scroll (toggle, seleção, edição):
+        só cards cujo (path, signature) mudou são re-vinculados.
         """
-        # Limpa tudo
-        self.clear()
-        
-        # Atualiza dados
+        self.signature = signature
         self.data = new_data
+        self.update_scrollregion()
+        for idx in list(self.active_widgets):
+            card, item = self.active_widgets[idx]
+            path = new_data[idx] if idx < len(new_data) else None
+            data = self.data_getter(path) if path is not None else None
+            if data is None:
+                card.release()
+                self.canvas.itemconfigure(item, state="hidden")
+                self.widget_pool.append(self.active_widgets.pop(idx))
+                continue
+            sig = (path, signature(path, data))
+            if self._signatures.get(idx) != sig:
+                card.update(path, data)
+                self._signatures[idx] = sig
+        self.update_visible_items(force=True)
+
+    def set_callbacks(self, card_callbacks: dict) -> None:
+        """Callbacks novos (ex.: modo seleção) valem no próximo update() de cada card."""
+        for card, _item in list(self.active_widgets.values()) + self.widget_pool:
+            card.cb = card_callbacks
+
+    # ------------------------------------------------------------------
+    # Dados
+    # ------------------------------------------------------------------
+
+    def refresh_data(self, new_data: Sequence[str]) -> None:
+        """
+        Atualiza dataset completo (ex: após filtro) e volta pro topo.
+        Cards ativos voltam ao pool e são re-vinculados, não recriados.
         
-        # Re-renderiza viewport
+        Args:
+            new_data: Nova lista de paths filtrados+ordenados
+        """
+        self._recycle_widgets(0, 0)
         self.visible_range = (0, 0)
-        self.update_visible_items()
-        
-        # Volta pro topo
+        self.data = new_data
+        self.scrollable_frame.update_idletasks()  # altura do header recém-montado
+        self._layout_width = self.canvas.winfo_width()
+        self.update_scrollregion()
         self.canvas.yview_moveto(0)
+        self.update_visible_items(force=True)
 
     def clear(self) -> None:
         """
-        Limpa todos os widgets (usa ao trocar filtro).
+        Destrói todos os cards (ao sair do modo scroll infinito).
         """
-        # Remove widgets ativos
-        for widget in self.active_widgets.values():
-            widget.destroy()
-        
-        # Limpa pool
-        for widget in self.widget_pool:
-            widget.destroy()
+        for card, item in list(self.active_widgets.values()) + self.widget_pool:
+            self.canvas.delete(item)
+            card.destroy()
         
         self.active_widgets.clear()
         self.widget_pool.clear()
+        self._signatures.clear()
         self.visible_range = (0, 0)
 
     def get_stats(self) -> dict:
@@ -296,10 +309,9 @@ class VirtualScrollManager:
         """
         return {
             "total_items": len(self.data),
+            "total_rows": self.total_rows,
             "active_widgets": len(self.active_widgets),
             "pool_size": len(self.widget_pool),
+            "cards_created": self.created,
             "visible_range": self.visible_range,
-            "viewport_size": self.viewport_size,
-            "buffer_size": self.buffer_size,
-            "max_pool": self.max_pool_size,
         }
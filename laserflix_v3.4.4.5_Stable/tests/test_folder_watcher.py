@@ -0,0 +1,115 @@
+"""
+tests/test_folder_watcher.py — FolderWatcher nunca apaga registros.
+
+Cobre: renomeação na raiz, projeto movido para dentro de uma pasta
+contêiner nova, pasta apagada (marcada ausente) e raiz desmontada.
+
+Uso:
+    python -m pytest tests/test_folder_watcher.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.database import DatabaseManager
+from core.folder_watcher import FolderWatcher
+from core.project_scanner import ProjectScanner
+
+
+def make_project(path: str, marker: str = "modelo.svg") -> None:
+    os.makedirs(path)
+    open(os.path.join(path, marker), "wb").close()
+
+
+class FolderWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="laserflix_watch_")
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp)  # journal/backups do DatabaseManager ficam no tmp
+        self.root = os.path.join(self.tmp, "biblioteca")
+        os.makedirs(self.root)
+        self.db = DatabaseManager()
+        self.scanner = ProjectScanner(self.db.database)
+        for name in ("ProjA", "ProjB"):
+            path = os.path.join(self.root, name)
+            make_project(path)
+            self.db.add_project(path, self.scanner.build_record(path))
+        self.db.update_project(os.path.join(self.root, "ProjA"),
+                               favorite=True, ai_description="descrição")
+        self.watcher = FolderWatcher(self.db, self.scanner, debounce_s=0)
+        self.db.add_change_listener(self.watcher.on_database_change)
+        self.watcher.set_roots([self.root])
+        self.watcher.poll()  # referência inicial
+        self._backdate()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _backdate(self):
+        """Recua mtimes: pastas novas não contam como 'ainda copiando'."""
+        past = time.time() - 60
+        for dirpath, _dirs, _files in os.walk(self.root):
+            os.utime(dirpath, (past, past))
+
+    def _poll(self):
+        self._backdate()
+        return self.watcher.poll()
+
+    def test_rename_keeps_record(self):
+        os.rename(os.path.join(self.root, "ProjA"), os.path.join(self.root, "ProjA Natal"))
+        changes = self._poll()
+        new_path = os.path.join(self.root, "ProjA Natal")
+        self.assertEqual(changes["renamed"], [(os.path.join(self.root, "ProjA"), new_path)])
+        self.assertNotIn(os.path.join(self.root, "ProjA"), self.db.database)
+        self.assertTrue(self.db.database[new_path]["favorite"])
+        self.assertEqual(self.db.database[new_path]["ai_description"], "descrição")
+        self.assertEqual(self.db.database[new_path]["name"], "ProjA Natal")
+
+    def test_move_into_new_container_keeps_record(self):
+        container = os.path.join(self.root, "Natal")
+        os.makedirs(container)
+        shutil.move(os.path.join(self.root, "ProjA"), os.path.join(container, "ProjA"))
+        changes = self._poll()
+        moved = os.path.join(container, "ProjA")
+        self.assertEqual(changes["renamed"], [(os.path.join(self.root, "ProjA"), moved)])
+        self.assertNotIn(container, self.db.database)  # contêiner não vira projeto
+        self.assertTrue(self.db.database[moved]["favorite"])
+        self.assertEqual(self.db.database[moved]["ai_description"], "descrição")
+
+    def test_deleted_folder_is_marked_missing_not_removed(self):
+        path = os.path.join(self.root, "ProjA")
+        shutil.rmtree(path)
+        changes = self._poll()
+        self.assertEqual(changes["missing"], [path])
+        self.assertTrue(self.db.database[path]["missing"])
+        self.assertTrue(self.db.database[path]["favorite"])
+
+        make_project(path)  # pasta volta
+        changes = self._poll()
+        self.assertEqual(changes["restored"], [path])
+        self.assertFalse(self.db.database[path]["missing"])
+
+    def test_new_project_and_container(self):
+        make_project(os.path.join(self.root, "ProjC"))
+        os.makedirs(os.path.join(self.root, "Vazia"))
+        changes = self._poll()
+        self.assertEqual(changes["added"], [os.path.join(self.root, "ProjC")])
+        self.assertNotIn(os.path.join(self.root, "Vazia"), self.db.database)
+
+    def test_unmounted_root_changes_nothing(self):
+        before = dict(self.db.database)
+        os.rename(self.root, self.root + "_offline")  # raiz inacessível
+        self.assertIsNone(self.watcher.poll())
+        self.assertEqual(dict(self.db.database), before)
+        self.assertFalse(any(d.get("missing") for d in self.db.database.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,17 +7,17 @@ Redução: ~25 linhas
 Responsabilidades:
 - Construir grid de cards de projetos
 - Calcular posição (row, col) de cada card
-- Delegar renderização para build_card()
+- Reciclar ProjectCards do pool entre páginas (só update(), sem recriar)
 """
-from config.card_layout import COLS
-from ui.project_card import build_card
+from config.card_layout import COLS, CARD_PAD
+from ui.project_card import ProjectCard
 
 
 class CardsGridBuilder:
     """Construtor de grid de cards de projetos."""
     
     @staticmethod
-    def build(parent, page_items, card_callbacks, start_row=2):
+    def build(parent, page_items, card_callbacks, start_row=2, pool=None):
         """
         Constrói grid de cards de projetos.
         
@@ -26,15 +26,33 @@ class CardsGridBuilder:
             page_items: Lista de tuplas (project_path, project_data)
             card_callbacks: Dicionário com callbacks para os cards
             start_row: Linha inicial do grid (padrão: 2)
+            pool: Lista de ProjectCard reaproveitada entre chamadas
+                  (cresce sob demanda; sobras ficam ocultas)
         """
-        for i, (project_path, project_data) in enumerate(page_items):
-            row = (i // COLS) + start_row
-            col = i % COLS
-            build_card(
-                parent, 
-                project_path, 
-                project_data, 
-                card_callbacks, 
-                row, 
-                col
-            )
+        pool = [] if pool is None else pool
+        CardsGridBuilder.patch(parent, page_items, card_callbacks,
+                               range(len(page_items)), start_row, pool)
+    
+    @staticmethod
+    def patch(parent, page_items, card_callbacks, indices, start_row=2, pool=None):
+        """
+        Re-vincula só os cards em `indices` (plano do DisplayDiff); o resto
+        da página fica intocado. Cards além de len(page_items) são ocultados.
+        """
+        for i in indices:
+            project_path, project_data = page_items[i]
+            while i >= len(pool):
+                pool.append(ProjectCard(parent, card_callbacks))
+            card = pool[i]
+            card.update(project_path, project_data, card_callbacks)
+            card.frame.grid(row=(i // COLS) + start_row, column=i % COLS,
+                            padx=CARD_PAD, pady=CARD_PAD, sticky="n")
+        CardsGridBuilder.hide(pool[len(page_items):])
+    
+    @staticmethod
+    def hide(cards):
+        """Oculta cards do pool sem destruí-los."""
+        for card in cards:
+            if card.frame.winfo_manager():
+                card.release()
+                card.frame.grid_remove()
@@ -53,7 +53,8 @@ class HeaderBuilder:
         ).pack(side="left")
         
         # Navegação (se houver projetos filtrados)
-        filtered_count = len(display_ctrl.get_filtered_projects())
+        filtered_count = (total_count if total_count is not None
+                          else len(display_ctrl.get_filtered_projects()))
         if filtered_count > 0:
             page_info = display_ctrl.get_page_info(filtered_count)
             HeaderBuilder._build_navigation(header_frame, page_info, display_ctrl)
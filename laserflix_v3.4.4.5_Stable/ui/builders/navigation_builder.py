@@ -10,6 +10,7 @@ Responsabilidades:
 - Label de página atual
 - Callbacks de mudança de ordenação
 - Estados disabled baseados em paginação
+- Alternância páginas ↔ scroll infinito
 """
 
 import tkinter as tk
@@ -38,7 +39,32 @@ class NavigationBuilder:
         NavigationBuilder._build_sort_controls(right_controls, display_ctrl)
         
         # === NAVEGAÇÃO ===
-        NavigationBuilder._build_pagination_controls(right_controls, page_info, display_ctrl)
+        if not display_ctrl.infinite_scroll:
+            NavigationBuilder._build_pagination_controls(right_controls, page_info, display_ctrl)
+        NavigationBuilder._build_mode_toggle(right_controls, display_ctrl)
+    
+    @staticmethod
+    def _build_mode_toggle(parent: tk.Frame, display_ctrl) -> None:
+        """
+        Botão que alterna paginação ↔ scroll infinito.
+        
+        Args:
+            parent: Frame pai
+            display_ctrl: DisplayController com infinite_scroll
+        """
+        infinite = display_ctrl.infinite_scroll
+        tk.Button(
+            parent,
+            text="📄 Páginas" if infinite else "♾️ Rolagem",
+            command=lambda: display_ctrl.set_infinite_scroll(not infinite),
+            bg="#333333",
+            fg=ACCENT_GOLD if infinite else FG_PRIMARY,
+            font=("Arial", 9),
+            relief="flat",
+            cursor="hand2",
+            padx=6,
+            pady=3
+        ).pack(side="left", padx=(10, 0))
     
     @staticmethod
     def _build_sort_controls(parent: tk.Frame, display_ctrl) -> None:
@@ -73,7 +73,7 @@ class UIBuilder:
             "on_more_categories":    window.open_categories_picker,
             "on_collection":         window._on_collection_filter,
             "on_manage_collections": window.open_collections_dialog,
-        })
+        }, facets=window.facet_counts)
         window.sidebar.refresh(window.database, window.collections_manager)
         
         # Content frame
@@ -89,13 +89,15 @@ class UIBuilder:
         # Canvas + Scrollbar
         window.content_canvas = tk.Canvas(content_frame, bg=BG_PRIMARY, highlightthickness=0)
         scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=window.content_canvas.yview)
-        window.content_canvas.configure(yscrollcommand=scrollbar.set)
+        
+        def _on_yscroll(first, last):
+            scrollbar.set(first, last)
+            window.renderer.schedule_viewport_update()  # roda, arrasto da barra, yview_moveto
+        window.content_canvas.configure(yscrollcommand=_on_yscroll)
         
         window.scrollable_frame = tk.Frame(window.content_canvas, bg=BG_PRIMARY)
         window.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: window.content_canvas.configure(
-                scrollregion=window.content_canvas.bbox("all")))
+            "<Configure>", lambda e: window.renderer.on_content_configure())
         window.content_canvas.create_window((0, 0), window=window.scrollable_frame, anchor="nw")
         
         window.content_canvas.pack(side="left", fill="both", expand=True, padx=10, pady=10)
@@ -103,8 +105,8 @@ class UIBuilder:
         
         # Bind scroll events
         window.content_canvas.bind("<MouseWheel>",
-            lambda e: window._on_scroll(e))
-        window.content_canvas.bind("<Configure>", lambda e: window._schedule_viewport_update())
+            lambda e: window.renderer.on_scroll(e))
+        window.content_canvas.bind("<Configure>", lambda e: window.renderer.schedule_viewport_update())
         
         # Configure grid columns
         for i in range(COLS):
@@ -138,7 +140,7 @@ class UIBuilder:
         
         window.stop_btn = tk.Button(
             sf, text="⏹ Parar",
-            command=window.analysis_manager.stop,
+            command=window.stop_current_task,
             bg=ACCENT_RED, fg=FG_PRIMARY,
             font=("Arial", 10, "bold"), relief="flat", cursor="hand2"
         )
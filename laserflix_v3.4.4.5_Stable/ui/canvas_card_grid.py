@@ -0,0 +1,271 @@
+"""
+ui/canvas_card_grid.py — Grid de cards desenhado direto no content_canvas.
+
+Alternativa leve ao ProjectCard (árvore de Frames/Labels/Buttons): cada
+card vira ~20-35 itens de canvas (retângulos, textos, imagem da capa,
+chips de categoria/tag/origem/coleção, ícones de ação). Uma página de 36
+cards = algumas centenas de itens e ZERO widgets — sem geometry manager.
+
+HIT-TESTING:
+    Todos os itens levam as tags "gridcard" e "slot<i>"; chips e ações
+    levam "act=<ação>". Um único tag_bind por evento no canvas resolve
+    o card (slot) e a ação do item sob o cursor ("current").
+
+Ativado por CARD_RENDERER = "canvas" (config/settings.py) no modo paginado.
+"""
+import tkinter as tk
+from typing import Dict, List, Optional, Tuple
+
+from config.card_layout import COLS, CARD_W, CARD_H, COVER_H, CARD_PAD
+from config.ui_constants import (
+    CARD_NAME_MAX_LENGTH, CARD_NAME_TRUNCATE_AT,
+    CARD_TAG_MAX_LENGTH, CARD_TAG_TRUNCATE_AT,
+    CARD_CATEGORY_MAX_LENGTH, CARD_MAX_CATEGORIES, CARD_MAX_TAGS,
+    BG_CARD, BG_SECONDARY, ACCENT_GREEN, ACCENT_GOLD,
+    FG_PRIMARY, FG_TERTIARY, ORIGIN_COLORS, CATEGORY_COLORS,
+)
+from ui.card_helpers import (
+    CARD_MAX_COLLECTIONS, COLLECTION_COLOR,
+    analysis_badge_style, visible_categories, truncate,
+    create_context_menu_handler,
+)
+
+_TAG = "gridcard"
+_F_NAME = ("Arial", 10, "bold")
+_F_CHIP = ("Arial", 7)
+_F_CHIP_BOLD = ("Arial", 7, "bold")
+_F_ICON = ("Arial", 12)
+_F_PLACEHOLDER = ("Arial", 52)
+_F_BADGE = ("Arial", 14)
+
+
+class _ItemButton:
+    """Adapta item de texto do canvas à API btn.config(text=, fg=) dos toggles."""
+
+    def __init__(self, canvas: tk.Canvas, item: int):
+        self.canvas = canvas
+        self.item = item
+
+    def config(self, text=None, fg=None, **_ignored) -> None:
+        opts = {}
+        if text is not None:
+            opts["text"] = text
+        if fg is not None:
+            opts["fill"] = fg
+        if opts:
+            self.canvas.itemconfigure(self.item, **opts)
+
+    configure = config
+
+
+class CanvasCardGrid:
+    """
+    Desenha uma página de cards no canvas e roteia cliques por hit-testing.
+    """
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.cb: dict = {}
+        self._slots: List[dict] = []
+        self._photos: Dict[int, object] = {}  # slot → PhotoImage (mantém referência)
+        self._subs: list = []
+
+        canvas.tag_bind(_TAG, "<Button-1>", self._on_click)
+        canvas.tag_bind(_TAG, "<Button-3>", self._on_context)
+        canvas.tag_bind(_TAG, "<Enter>", lambda e: canvas.config(cursor="hand2"))
+        canvas.tag_bind(_TAG, "<Leave>", lambda e: canvas.config(cursor=""))
+
+    # ------------------------------------------------------------------
+    # Renderização
+    # ------------------------------------------------------------------
+
+    def render(self, page_items: List[Tuple[str, dict]], cb: dict, top: int) -> int:
+        """
+        Redesenha a página inteira a partir de `top` (abaixo do header).
+
+        Returns:
+            Coordenada y do fim do grid (para a scrollregion)
+        """
+        self.clear()
+        self.cb = cb
+        cell = max(CARD_W + CARD_PAD * 2, self.canvas.winfo_width() / COLS)
+        bottom = top
+        for i, (path, data) in enumerate(page_items):
+            row, col = divmod(i, COLS)
+            x = col * cell + (cell - CARD_W) / 2
+            y = top + row * (CARD_H + CARD_PAD * 2) + CARD_PAD
+            self._draw_card(i, x, y, path, data)
+            bottom = y + CARD_H + CARD_PAD
+        return int(bottom)
+
+    def clear(self) -> None:
+        """Apaga os itens da página e cancela pedidos de capa pendentes."""
+        release = self.cb.get("release_cover_image")
+        if release:
+            for sub in self._subs:
+                release(sub)
+        self._subs.clear()
+        self.canvas.delete(_TAG)
+        self._slots.clear()
+        self._photos.clear()
+
+    def _draw_card(self, slot: int, x: float, y: float, path: str, data: dict) -> None:
+        c = self.canvas
+        cb = self.cb
+        tags = (_TAG, f"slot{slot}")
+        selection_mode = cb.get("selection_mode", False)
+        selected = path in cb.get("selected_paths", set())
+        info = {"path": path, "data": data, "cats": [], "tags": [], "cols": [], "items": {}}
+        self._slots.append(info)
+
+        c.create_rectangle(x, y, x + CARD_W, y + CARD_H, fill=BG_CARD,
+                           outline="#FFFF00" if selected else "", width=2, tags=tags)
+        c.create_rectangle(x, y, x + CARD_W, y + COVER_H, fill=BG_SECONDARY, width=0, tags=tags)
+        cover = c.create_text(x + CARD_W / 2, y + COVER_H / 2, text="📁",
+                              font=_F_PLACEHOLDER, fill=FG_TERTIARY, tags=tags)
+
+        text, bg = analysis_badge_style(data)
+        self._chip(x + CARD_W - 4, y + 4, text, bg, "#FFFFFF", _F_BADGE, tags, anchor="ne", pad=(6, 2))
+
+        if selection_mode:
+            self._chip(x + 4, y + 4, "☑" if selected else "☐", BG_CARD, FG_PRIMARY,
+                       _F_ICON, tags + ("act=select",))
+
+        cy = y + COVER_H + 6
+        name = truncate(data.get("name", "Sem nome"), CARD_NAME_MAX_LENGTH, CARD_NAME_TRUNCATE_AT)
+        item = c.create_text(x + 8, cy, text=name, font=_F_NAME, fill=FG_PRIMARY,
+                             width=CARD_W - 20, anchor="nw", tags=tags)
+        cy = c.bbox(item)[3]
+
+        info["cats"] = visible_categories(data)[:CARD_MAX_CATEGORIES]
+        cy = self._chip_row(x, cy + 4, [
+            (cat[:CARD_CATEGORY_MAX_LENGTH], CATEGORY_COLORS[i], "#000000", _F_CHIP_BOLD, f"cat:{i}")
+            for i, cat in enumerate(info["cats"])], tags)
+
+        info["tags"] = (data.get("tags", []) or [])[:CARD_MAX_TAGS]
+        cy = self._chip_row(x, cy + 3, [
+            (truncate(t, CARD_TAG_MAX_LENGTH, CARD_TAG_TRUNCATE_AT), "#3A3A3A", FG_PRIMARY, _F_CHIP, f"tag:{i}")
+            for i, t in enumerate(info["tags"])], tags)
+
+        origin = data.get("origin", "Desconhecido")
+        cy = self._chip_row(x, cy + 4, [
+            (origin, ORIGIN_COLORS.get(origin, ORIGIN_COLORS["default"]), FG_PRIMARY, _F_CHIP, "origin")], tags)
+
+        get_project_collections = cb.get("get_project_collections")
+        all_cols = (get_project_collections(path) if get_project_collections else None) or []
+        info["cols"] = all_cols[:CARD_MAX_COLLECTIONS]
+        chips = [(truncate(n, 15, 12), COLLECTION_COLOR, "#FFFFFF", _F_CHIP_BOLD, f"col:{i}")
+                 for i, n in enumerate(info["cols"])]
+        if len(all_cols) > CARD_MAX_COLLECTIONS:
+            chips.append((f"+{len(all_cols) - CARD_MAX_COLLECTIONS}", BG_CARD, "#888888", _F_CHIP, "open"))
+        cy = self._chip_row(x, cy + 3, chips, tags)
+
+        if not selection_mode:
+            ax = x + 8
+            for action, on_text, off_text, on_fg in (
+                ("folder", "📂", "📂", ACCENT_GOLD),
+                ("favorite", "⭐", "☆", ACCENT_GOLD),
+                ("done", "✓", "○", "#00FF00"),
+                ("good", "👍", "👍", "#00FF00"),
+                ("bad", "👎", "👎", "#FF0000"),
+                ("analyze", "🤖", "🤖", ACCENT_GREEN),
+            ):
+                if action == "analyze" and data.get("analyzed"):
+                    continue
+                on = action in ("folder", "analyze") or bool(data.get(action))
+                item = c.create_text(ax, cy + 8, text=on_text if on else off_text, font=_F_ICON,
+                                     fill=on_fg if on else FG_TERTIARY, anchor="nw",
+                                     tags=tags + (f"act={action}",))
+                info["items"][action] = item
+                ax = c.bbox(item)[2] + 8
+
+        get_cover_async = cb.get("get_cover_image_async")
+        if get_cover_async:
+            sub = get_cover_async(path, lambda p, photo: self._on_cover(slot, path, cover, photo), None)
+            if sub is not None:
+                self._subs.append(sub)
+
+    def _chip(self, x, y, text, bg, fg, font, tags, anchor="nw", pad=(4, 2)) -> Tuple[float, float]:
+        """Texto + retângulo de fundo; retorna (x2, y2) do chip."""
+        c = self.canvas
+        dx = -pad[0] if anchor == "ne" else pad[0]
+        item = c.create_text(x + dx, y + pad[1], text=text, font=font, fill=fg, anchor=anchor, tags=tags)
+        x1, y1, x2, y2 = c.bbox(item)
+        rect = c.create_rectangle(x1 - pad[0], y1 - pad[1], x2 + pad[0], y2 + pad[1],
+                                  fill=bg, width=0, tags=tags)
+        c.tag_lower(rect, item)
+        return x2 + pad[0], y2 + pad[1]
+
+    def _chip_row(self, x, y, chips, tags) -> float:
+        """Chips lado a lado (como os botões pack(side="left")); retorna y final."""
+        if not chips:
+            return y
+        cx, bottom = x + 8, y
+        for text, bg, fg, font, action in chips:
+            cx, y2 = self._chip(cx, y, text, bg, fg, font, tags + (f"act={action}",))
+            cx += 4
+            bottom = max(bottom, y2)
+        return bottom
+
+    def _on_cover(self, slot: int, path: str, item: int, photo) -> None:
+        if slot >= len(self._slots) or self._slots[slot]["path"] != path:
+            return  # página já redesenhada
+        self._photos[slot] = photo
+        c = self.canvas
+        try:
+            x, y = c.coords(item)
+            tags = c.gettags(item)
+            c.delete(item)  # placeholder 📁 → imagem
+            c.create_image(x, y, image=photo, tags=tags)
+        except (tk.TclError, ValueError):
+            pass
+
+    # ------------------------------------------------------------------
+    # Hit-testing
+    # ------------------------------------------------------------------
+
+    def _hit(self) -> Optional[Tuple[dict, str]]:
+        current = self.canvas.find_withtag("current")
+        if not current:
+            return None
+        slot, action = None, "open"
+        for tag in self.canvas.gettags(current[0]):
+            if tag.startswith("slot"):
+                slot = int(tag[4:])
+            elif tag.startswith("act="):
+                action = tag[4:]
+        if slot is None or slot >= len(self._slots):
+            return None
+        return self._slots[slot], action
+
+    def _on_click(self, _event) -> None:
+        hit = self._hit()
+        if not hit:
+            return
+        info, action = hit
+        cb, path = self.cb, info["path"]
+        kind, _, idx = action.partition(":")
+        if kind == "open":
+            cb["on_open_modal"](path)
+        elif kind == "select":
+            cb["on_toggle_select"](path)
+        elif kind == "cat":
+            cb["on_set_category"]([info["cats"][int(idx)]])
+        elif kind == "tag":
+            cb["on_set_tag"](info["tags"][int(idx)])
+        elif kind == "col":
+            cb.get("on_set_collection", lambda x: None)(info["cols"][int(idx)])
+        elif kind == "origin":
+            cb["on_set_origin"](info["data"].get("origin", "Desconhecido"))
+        elif kind == "folder":
+            cb["on_open_folder"](path)
+        elif kind == "analyze":
+            cb["on_analyze_single"](path)
+        else:
+            btn = _ItemButton(self.canvas, info["items"][kind])
+            cb[f"on_toggle_{kind}"](path, btn)
+
+    def _on_context(self, event) -> None:
+        hit = self._hit()
+        if hit:
+            create_context_menu_handler(hit[0]["path"], self.cb)(event)
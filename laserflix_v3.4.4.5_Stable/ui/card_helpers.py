@@ -0,0 +1,98 @@
+"""
+ui/card_helpers.py — Helpers compartilhados pelos renderizadores de card.
+
+Usados por ProjectCard (ui/project_card.py, widgets) e CanvasCardGrid
+(ui/canvas_card_grid.py, itens de canvas): badge de análise, filtro de
+categorias, truncamento e o menu contextual de coleções.
+"""
+from tkinter import Menu
+
+from config.ui_constants import CARD_BANNED_STRINGS
+
+# F-08: Constantes de coleções
+CARD_MAX_COLLECTIONS = 3  # Máximo de badges de coleções visíveis
+COLLECTION_COLOR = "#7B68EE"  # Roxo (MediumSlateBlue)
+
+
+def analysis_badge_style(data: dict):
+    """
+    F-05: Badge de status de análise (texto, cor de fundo).
+    
+    - 🤖 IA (verde): analisado por modelo
+    - ⚡ Fallback (amarelo): análise de emergência
+    - ⏳ Pendente (cinza): não analisado
+    """
+    if not data.get("analyzed", False):
+        return "⏳", "#4A4A4A"
+    if data.get("analyzed_model", "fallback") == "fallback":
+        return "⚡", "#FFA500"
+    return "🤖", "#00AA00"
+
+
+def visible_categories(data: dict) -> list:
+    raw_cats = data.get("categories", []) or []
+    return [c for c in raw_cats if c and c.strip() and c.strip().lower() not in CARD_BANNED_STRINGS]
+
+
+def truncate(text: str, max_len: int, cut_at: int) -> str:
+    return (text[:cut_at] + "...") if len(text) > max_len else text
+
+
+def create_context_menu_handler(project_path: str, cb: dict):
+    """
+    PERF-FIX-4: Retorna handler único de menu contextual.
+    Evita criar função inline para cada bind.
+    """
+    def _show_menu(event):
+        menu = Menu(event.widget, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
+                    activebackground="#4A4A6E", activeforeground="#FFFFFF",
+                    font=("Arial", 10))
+        
+        all_collections = cb.get("get_collections", lambda: [])() or []
+        project_collections = cb.get("get_project_collections", lambda p: [])(project_path) or []
+        
+        if all_collections:
+            add_menu = Menu(menu, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
+                            activebackground="#4A4A6E", activeforeground="#FFFFFF",
+                            font=("Arial", 9))
+            
+            for col_name in sorted(all_collections):
+                is_in = col_name in project_collections
+                label = f"✓ {col_name}" if is_in else f"  {col_name}"
+                state = "disabled" if is_in else "normal"
+                
+                add_menu.add_command(
+                    label=label,
+                    command=lambda c=col_name: cb["on_add_to_collection"](project_path, c),
+                    state=state
+                )
+            
+            menu.add_cascade(label="➕ Adicionar à coleção", menu=add_menu)
+        else:
+            menu.add_command(label="📁 Nenhuma coleção disponível", state="disabled")
+        
+        if project_collections:
+            remove_menu = Menu(menu, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
+                               activebackground="#4A4A6E", activeforeground="#FFFFFF",
+                               font=("Arial", 9))
+            
+            for col_name in sorted(project_collections):
+                remove_menu.add_command(
+                    label=col_name,
+                    command=lambda c=col_name: cb["on_remove_from_collection"](project_path, c)
+                )
+            
+            menu.add_cascade(label="➖ Remover de coleção", menu=remove_menu)
+        
+        menu.add_separator()
+        menu.add_command(
+            label="🆕 Nova coleção com este projeto",
+            command=lambda: cb["on_new_collection_with"](project_path)
+        )
+        
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+    
+    return _show_menu
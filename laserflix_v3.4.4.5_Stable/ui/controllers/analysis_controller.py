@@ -18,6 +18,7 @@ import os
 import threading
 from typing import Optional, Callable
 from tkinter import messagebox
+from ui.managers.ui_scheduler import PRIORITY_HIGH, PRIORITY_NORMAL
 from utils.logging_setup import LOGGER
 
 
@@ -46,7 +47,13 @@ class AnalysisController:
         self.ollama = ollama_client
         self.logger = LOGGER
         
+        # Agendador da thread principal (UIScheduler). Sem ele os callbacks
+        # rodam direto na thread da análise (comportamento antigo).
+        self.scheduler = None
+        
         # Callbacks de UI (conectados pelo main_window)
+        # *_progress: chamados da thread de trabalho — o ProgressUIManager
+        # com scheduler já é thread-safe e coalesce as atualizações.
         self.on_show_progress: Optional[Callable] = None
         self.on_hide_progress: Optional[Callable] = None
         self.on_update_progress: Optional[Callable] = None
@@ -143,8 +150,8 @@ class AnalysisController:
         def _run():
             try:
                 desc = self.text_generator.generate_description(path, database[path])
-                database[path]["ai_description"] = desc
-                self.db_manager.save_database()
+                self.db_manager.update_project(path, ai_description=desc)
+                self.db_manager.commit()
                 
                 if "on_success" in callbacks:
                     callbacks["on_success"](desc)
@@ -233,35 +240,33 @@ class AnalysisController:
                     
                     # Gera descrição
                     desc = self.text_generator.generate_description(path, database[path])
-                    database[path]["ai_description"] = desc
+                    self.db_manager.update_project(path, ai_description=desc)
                     done += 1
                     
                     # Salva a cada 5 descrições
                     if done % 5 == 0:
-                        self.db_manager.save_database()
+                        self.db_manager.commit()
                 
                 except Exception as e:
                     self.logger.error("Erro ao gerar descrição para %s: %s", path, e)
                     skipped += 1
             
             # Salva final
-            self.db_manager.save_database()
+            self.db_manager.commit()
             
             # Esconde progresso
             if self.on_hide_progress:
                 self.on_hide_progress()
             
             # Refresh UI
-            if self.on_refresh_ui:
-                self.on_refresh_ui()
+            self._ui(self.on_refresh_ui, key="analysis_refresh")
             
             # Mensagem final
             msg = f"✅ {done} descrição(ões) gerada(s)"
             if skipped > 0:
                 msg += f" ({skipped} pulada(s))"
             
-            if self.on_analysis_complete:
-                self.on_analysis_complete(msg)
+            self._ui(self.on_analysis_complete, msg, priority=PRIORITY_HIGH)
         
         threading.Thread(target=_run, daemon=True).start()
     
@@ -284,16 +289,24 @@ class AnalysisController:
         if self.on_hide_progress:
             self.on_hide_progress()
         
-        if self.on_refresh_ui:
-            self.on_refresh_ui()
+        self._ui(self.on_refresh_ui, key="analysis_refresh")
         
         msg = f"✅ Análise: {done} projeto(s)"
         if skipped > 0:
             msg += f" ({skipped} pulado(s))"
         
-        if self.on_analysis_complete:
-            self.on_analysis_complete(msg)
+        self._ui(self.on_analysis_complete, msg, priority=PRIORITY_HIGH)
     
     def _on_analysis_error(self, error_msg: str) -> None:
         """Chamado quando ocorre erro crítico."""
-        messagebox.showwarning("⚠️ Erro na Análise", error_msg)
+        self._ui(messagebox.showwarning, "⚠️ Erro na Análise", error_msg, priority=PRIORITY_HIGH)
+    
+    def _ui(self, callback: Optional[Callable], *args,
+            priority: int = PRIORITY_NORMAL, key=None) -> None:
+        """Executa callback de UI na thread principal (via scheduler, se houver)."""
+        if callback is None:
+            return
+        if self.scheduler:
+            self.scheduler.post(callback, *args, priority=priority, key=key)
+        else:
+            callback(*args)
@@ -11,14 +11,19 @@ Responsabilidades:
 - Paginar resultados
 - Notificar UI sobre mudanças (callbacks)
 
+Filtros via índices, ordenação e cache LRU de resultados (SQL,
+SortIndex, sort_projects): ui/controllers/result_view.py.
+
 EXTRAÍDO DE: main_window.py (~300 linhas)
-TAMANHO: ~280 linhas
+TAMANHO: ~290 linhas
 LIMITE: 300 linhas
 STATUS: ✅ OK
 """
 from typing import Any, Callable, Optional
+from config.settings import INFINITE_SCROLL_DEFAULT
 from utils.logging_setup import LOGGER
 from utils.name_translator import search_bilingual
+from ui.controllers.result_view import ResultView, sort_projects
 
 
 class DisplayController:
@@ -32,11 +37,16 @@ class DisplayController:
     - NOTIFICAÇÃO: Dispara callbacks quando estado muda
     """
     
-    def __init__(self, database: dict, collections_manager=None, items_per_page: int = 36):
+    def __init__(self, database: dict, collections_manager=None, items_per_page: int = 36,
+                 project_index=None, search_index=None, changes=None, sort_index=None):
         self.database = database
         self.collections_manager = collections_manager
         self.logger = LOGGER
         
+        # Resultado filtro+ordenação (índices, cache LRU, SortIndex/SQL)
+        self._results = ResultView(self, project_index=project_index, search_index=search_index,
+                                   changes=changes, sort_index=sort_index)
+        
         # Estado de filtros
         self.current_filter = "all"  # all/favorite/done/good/bad
         self.current_categories = []  # Lista de categorias
@@ -52,6 +62,7 @@ class DisplayController:
         self.items_per_page = items_per_page
         self.current_page = 1
         self.total_pages = 1
+        self.infinite_scroll = INFINITE_SCROLL_DEFAULT  # True = sem paginação (VirtualScrollManager)
         
         # Callbacks (conectados pela UI)
         self.on_display_update: Optional[Callable] = None  # Chamado quando precisa re-renderizar
@@ -173,6 +184,10 @@ class DisplayController:
         Returns:
             list: Lista de project_paths
         """
+        if self._results.project_index is not None:
+            return self._results.indexed_paths()
+        
+        search_hits = self._results.search_hits()
         result = []
         
         for path, data in self.database.items():
@@ -230,7 +245,10 @@ class DisplayController:
                 continue
             
             # 4. Busca textual (bilíngue)
-            if self.search_query:
+            if search_hits is not None:
+                if path not in search_hits:
+                    continue
+            elif self.search_query:
                 name_en = data.get("name", "")
                 if not search_bilingual(self.search_query, name_en):
                     continue
@@ -253,38 +271,12 @@ class DisplayController:
         self._trigger_update()
     
     def apply_sorting(self, projects: list) -> list:
-        """
-        Aplica ordenação aos projetos.
-        
-        Args:
-            projects: Lista de tuplas (path, data)
-        
-        Returns:
-            list: Lista ordenada de tuplas (path, data)
-        """
-        if not projects:
-            return projects
-        
-        try:
-            if self.current_sort == "date_desc":
-                return sorted(projects, key=lambda p: p[1].get("added_date", ""), reverse=True)
-            elif self.current_sort == "date_asc":
-                return sorted(projects, key=lambda p: p[1].get("added_date", ""))
-            elif self.current_sort == "name_asc":
-                return sorted(projects, key=lambda p: p[1].get("name", "").lower())
-            elif self.current_sort == "name_desc":
-                return sorted(projects, key=lambda p: p[1].get("name", "").lower(), reverse=True)
-            elif self.current_sort == "origin":
-                return sorted(projects, key=lambda p: (p[1].get("origin", "zzz"), p[1].get("name", "").lower()))
-            elif self.current_sort == "analyzed":
-                return sorted(projects, key=lambda p: (not p[1].get("analyzed", False), p[1].get("name", "").lower()))
-            elif self.current_sort == "not_analyzed":
-                return sorted(projects, key=lambda p: (p[1].get("analyzed", False), p[1].get("name", "").lower()))
-            else:
-                return projects
-        except Exception as e:
-            self.logger.error("Erro ao ordenar projetos: %s", e)
-            return projects
+        """Ordena [(path, data)] pelo current_sort (ver result_view.sort_projects)."""
+        return sort_projects(projects, self.current_sort)
+    
+    def get_sorted_paths(self) -> list:
+        """Paths filtrados JÁ ordenados (lista compartilhada com o cache — não modificar)."""
+        return self._results.sorted_paths()
     
     # ═══════════════════════════════════════════════════════════════════
     # PAGINAÇÃO
@@ -312,6 +304,13 @@ class DisplayController:
         self.current_page = self.total_pages
         self._trigger_update()
     
+    def set_infinite_scroll(self, enabled: bool) -> None:
+        """Alterna entre páginas de items_per_page e scroll infinito."""
+        if self.infinite_scroll != enabled:
+            self.infinite_scroll = enabled
+            self.current_page = 1
+            self._trigger_update()
+    
     def get_page_info(self, total_count: int) -> dict:
         """
         Calcula informações de paginação.
@@ -359,5 +358,6 @@ class DisplayController:
             "search": self.search_query,
             "sort": self.current_sort,
             "page": self.current_page,
+            "infinite": self.infinite_scroll,
             "active_filters": tuple((f["type"], f["value"]) for f in self.active_filters),
         }
@@ -0,0 +1,79 @@
+"""
+ui/controllers/display_diff.py — Diff entre a página exibida e a nova.
+
+Toggle de favorito, seleção de um card ou edição no modal não mudam o
+layout: só um ou poucos cards mudam. Em vez de derrubar a página, o
+DisplayDiff compara a lista anterior de (path, assinatura de render) com
+a nova e devolve só os índices a re-vincular (ProjectCard.update).
+
+REBUILD COMPLETO quando:
+    - a chave de layout mudou (filtros, busca, ordenação, página, modo
+      seleção, scroll infinito, lista vazia ↔ não vazia)
+    - mais de rebuild_ratio das posições trocaram de projeto
+"""
+from typing import Hashable, List, Optional, Sequence, Tuple
+
+
+# Campos do registro que aparecem no card
+RENDER_FIELDS = (
+    "name", "categories", "tags", "origin",
+    "favorite", "done", "good", "bad",
+    "analyzed", "analyzed_model",
+)
+
+# Campos que mudam o card ou o resultado de filtro/busca/ordenação
+DISPLAY_FIELDS = RENDER_FIELDS + ("added_date", "analysis_type")
+
+
+def _frozen(value):
+    return tuple(value) if isinstance(value, list) else value
+
+
+def render_signature(data: dict, selected: bool = False, collections: Sequence[str] = ()) -> tuple:
+    """Tudo que, se mudar, exige re-vincular o card."""
+    return tuple(_frozen(data.get(f)) for f in RENDER_FIELDS) + (selected, tuple(collections))
+
+
+class DisplayDiff:
+    """
+    Guarda a última página renderizada e planeja o patch da próxima.
+    """
+
+    def __init__(self, rebuild_ratio: float = 0.5):
+        self.rebuild_ratio = rebuild_ratio
+        self._layout_key: Optional[Hashable] = None
+        self._rows: List[Tuple[str, tuple]] = []
+
+    def reset(self) -> None:
+        """Força rebuild completo na próxima chamada."""
+        self._layout_key = None
+        self._rows = []
+
+    def same_layout(self, layout_key) -> bool:
+        """True se a tela atual tem o mesmo layout (um rebuild pode manter o scroll)."""
+        return self._layout_key is not None and self._layout_key == layout_key
+
+    def plan(self, layout_key, rows: List[Tuple[str, tuple]]) -> Optional[List[int]]:
+        """
+        Args:
+            layout_key: Estado que define o layout (comparado por ==)
+            rows: [(path, render_signature)] da nova página, em ordem
+
+        Returns:
+            None para rebuild completo, ou índices cujos cards mudaram
+            (posições além de len(rows) devem ser ocultadas pelo chamador)
+        """
+        old_key, old_rows = self._layout_key, self._rows
+        self._layout_key, self._rows = layout_key, rows
+        if old_key is None or old_key != layout_key:
+            return None
+
+        total = max(len(rows), len(old_rows))
+        if not total:
+            return []
+        moved = abs(len(rows) - len(old_rows)) + sum(
+            1 for new, old in zip(rows, old_rows) if new[0] != old[0])
+        if moved / total > self.rebuild_ratio:
+            return None
+
+        return [i for i, row in enumerate(rows) if i >= len(old_rows) or row != old_rows[i]]
@@ -0,0 +1,274 @@
+"""
+ui/controllers/display_renderer.py — Renderização do grid de projetos.
+
+Responsabilidades:
+- Decidir se a tela precisa mudar (ChangeTracker + estado de exibição)
+- Patch dos cards alterados (DisplayDiff) em vez de rebuild da página
+- Rebuild: header com contador, cards (pool de ProjectCards ou
+  CanvasCardGrid) ou scroll infinito (VirtualScrollManager)
+- Scroll: viewport do scroll infinito, scrollregion, posição mantida
+  em rebuild de mesmo layout
+
+O main_window só delega: display_projects() → render(),
+_invalidate_cache() → invalidate().
+
+EXTRAÍDO DE: main_window.py (~190 linhas)
+TAMANHO: ~225 linhas
+LIMITE: 300 linhas
+STATUS: ✅ OK
+"""
+import tkinter as tk
+
+from config.settings import CARD_RENDERER, SIDEBAR_FACETS_IN_FILTER
+from config.card_layout import COLS
+from config.ui_constants import BG_PRIMARY, FG_TERTIARY, SCROLL_SPEED
+
+from core.virtual_scroll_manager import VirtualScrollManager
+from utils.logging_setup import LOGGER
+from utils.platform_utils import open_folder
+
+from ui.builders.cards_grid_builder import CardsGridBuilder
+from ui.builders.header_builder import HeaderBuilder
+from ui.canvas_card_grid import CanvasCardGrid
+from ui.controllers.display_diff import DisplayDiff, DISPLAY_FIELDS, render_signature
+from ui.project_card import ProjectCard
+
+
+class DisplayRenderer:
+    """
+    Monta a página atual no scrollable_frame/content_canvas do main window.
+
+    Args:
+        window: Instância de LaserflixMainWindow (widgets, controllers e
+                callbacks dos cards são lidos dela na hora de renderizar)
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.logger = LOGGER
+        self._changes = window.db_manager.changes.cursor()  # mutações desde o último display
+        self._last_display_state = None
+        self._force_rebuild = False
+        self._scroll_update_pending = False
+        self.virtual_scroll = None  # VirtualScrollManager no modo scroll infinito
+        self._card_pool = []  # ProjectCards reciclados entre páginas
+        self._canvas_grid = None  # CanvasCardGrid (CARD_RENDERER = "canvas")
+        self._diff = DisplayDiff()  # patch de cards em vez de rebuild
+        self._sidebar_scope = None  # resultado usado nas facetas "dentro do filtro"
+        self._header_key = None
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    def invalidate(self) -> None:
+        self._force_rebuild = True
+
+    def render(self) -> None:
+        if not self._should_rebuild():
+            self.logger.debug("⚡ SKIP display_projects")
+            return
+
+        win = self.window
+        infinite = win.display_ctrl.infinite_scroll
+        sorted_paths = win.display_ctrl.get_sorted_paths()
+        total_count = len(sorted_paths)
+        if SIDEBAR_FACETS_IN_FILTER and sorted_paths is not self._sidebar_scope:
+            self._sidebar_scope = sorted_paths  # mesmo objeto = hit no cache de resultados
+            win.sidebar.set_scope(sorted_paths)
+
+        page_info = win.display_ctrl.get_page_info(total_count)
+        start_idx = 0 if infinite else page_info["start_idx"]
+        end_idx = total_count if infinite else page_info["end_idx"]
+        page_items = [] if infinite else [(p, win.database[p]) for p in sorted_paths[start_idx:end_idx]]
+
+        # Diff com a tela atual: toggle/seleção/edição → patch só dos cards alterados
+        layout_key = (win.display_ctrl.get_display_state(),
+                      win.selection_ctrl.selection_mode, bool(sorted_paths))
+        if infinite:
+            rows = [(p, ()) for p in sorted_paths]
+        else:
+            rows = [(p, self._render_signature(p, d)) for p, d in page_items]
+        # Mesmo layout (toggle no modo canvas, patch grande demais): rebuild sem pular ao topo
+        scroll_top = win.content_canvas.yview()[0] if self._diff.same_layout(layout_key) else 0
+        changed = self._diff.plan(layout_key, rows)
+        if changed is not None and sorted_paths and CARD_RENDERER != "canvas":
+            if self._patch(layout_key, sorted_paths, page_items, changed, start_idx, end_idx):
+                return
+
+        self._clear_frame()
+        win.thumbnail_batcher.cancel_pending()
+        if self._canvas_grid is not None:
+            self._canvas_grid.clear()
+        if self.virtual_scroll is not None and not infinite:
+            self.virtual_scroll.clear()
+            self.virtual_scroll = None
+
+        self._header_key = None
+        self._build_header(layout_key, total_count, end_idx - start_idx)
+
+        if infinite or not sorted_paths:
+            CardsGridBuilder.hide(self._card_pool)
+        if not sorted_paths:
+            if self.virtual_scroll is not None:
+                self.virtual_scroll.refresh_data(sorted_paths)
+            self._build_empty_state()
+            return
+        if infinite:
+            self._display_infinite(sorted_paths)
+            return
+
+        # Usar CardsGridBuilder (FASE-1.2B) — recicla cards do pool
+        card_cb = self._card_callbacks()
+        if CARD_RENDERER == "canvas":
+            self._display_canvas_grid(page_items, card_cb)
+        else:
+            CardsGridBuilder.build(win.scrollable_frame, page_items, card_cb, pool=self._card_pool)
+        win.thumbnail_prefetcher.prefetch_pages(sorted_paths, start_idx, end_idx)
+
+        win.content_canvas.yview_moveto(scroll_top)
+
+    # Scroll (bindings do UIBuilder)
+    def on_scroll(self, event) -> None:
+        self.window.content_canvas.yview_scroll(int(-1*(event.delta/SCROLL_SPEED)), "units")
+        self.schedule_viewport_update()
+
+    def schedule_viewport_update(self) -> None:
+        if self._scroll_update_pending:
+            return
+        self._scroll_update_pending = True
+        self.window.root.after(16, self._update_visible_cards)
+
+    def on_content_configure(self) -> None:
+        if self.virtual_scroll is not None:
+            self.virtual_scroll.update_scrollregion()
+        else:
+            canvas = self.window.content_canvas
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+    # ------------------------------------------------------------------
+    # Internos
+    # ------------------------------------------------------------------
+
+    def _update_visible_cards(self) -> None:
+        self._scroll_update_pending = False
+        if self.virtual_scroll is not None:
+            self.virtual_scroll.update_visible_items()
+
+    def _should_rebuild(self) -> bool:
+        # O(1): conjuntos sujos do ChangeTracker em vez de varrer o banco
+        changes = self._changes.take()
+        current_state = self.window.display_ctrl.get_display_state()
+        current_state["selection_mode"] = self.window.selection_ctrl.selection_mode
+
+        if self._force_rebuild or self._last_display_state is None:
+            self._force_rebuild = False
+            self._last_display_state = current_state
+            return True
+
+        if current_state == self._last_display_state and not changes.touches(*DISPLAY_FIELDS):
+            self.logger.debug("⚡ SKIP rebuild")
+            return False
+
+        self._last_display_state = current_state
+        return True
+
+    def _patch(self, layout_key, sorted_paths, page_items, changed, start_idx, end_idx) -> bool:
+        """
+        Aplica o plano do DisplayDiff sem derrubar a página nem mexer no
+        scroll. Retorna False quando não há o que remendar (rebuild).
+        """
+        if self.window.display_ctrl.infinite_scroll:
+            if self.virtual_scroll is None:
+                return False
+            self._build_header(layout_key, len(sorted_paths), len(sorted_paths))
+            self.virtual_scroll.patch_data(sorted_paths, self._render_signature)
+        else:
+            self._build_header(layout_key, len(sorted_paths), end_idx - start_idx)
+            CardsGridBuilder.patch(self.window.scrollable_frame, page_items, self._card_callbacks(),
+                                   changed, pool=self._card_pool)
+        self.logger.debug("⚡ PATCH display: %d card(s) alterado(s)", len(changed))
+        return True
+
+    def _clear_frame(self) -> None:
+        """Destrói os widgets do frame, menos os cards do pool."""
+        pooled = {card.frame for card in self._card_pool}
+        for w in self.window.scrollable_frame.winfo_children():
+            if w not in pooled:
+                w.destroy()
+
+    def _build_header(self, layout_key, total_count: int, showing_count: int) -> None:
+        """Header com contador (FASE-1.2.1); só é recriado se o conteúdo mudou."""
+        header_key = (layout_key, total_count, showing_count)
+        if header_key == self._header_key:
+            return
+        self._header_key = header_key
+        self._clear_frame()
+        HeaderBuilder.build(
+            self.window.scrollable_frame,
+            self.window.display_ctrl,
+            total_count=total_count,
+            showing_count=showing_count
+        )
+
+    def _render_signature(self, path: str, data: dict) -> tuple:
+        return render_signature(
+            data, path in self.window.selection_ctrl.selected_paths,
+            self.window.collections_manager.get_project_collections(path) or ())
+
+    def _display_canvas_grid(self, page_items, card_cb) -> None:
+        """Página desenhada como itens do content_canvas, abaixo do header."""
+        canvas, frame = self.window.content_canvas, self.window.scrollable_frame
+        if self._canvas_grid is None:
+            self._canvas_grid = CanvasCardGrid(canvas)
+        frame.update_idletasks()
+        bottom = self._canvas_grid.render(page_items, card_cb, frame.winfo_reqheight())
+        canvas.configure(scrollregion=(0, 0, canvas.winfo_width(), bottom))
+
+    def _display_infinite(self, sorted_paths) -> None:
+        """Scroll infinito: só a janela visível da lista inteira vira widget."""
+        win = self.window
+        card_cb = self._card_callbacks()
+        if self.virtual_scroll is None:
+            self.virtual_scroll = VirtualScrollManager(
+                win.content_canvas, win.scrollable_frame, sorted_paths,
+                card_factory=None, data_getter=win.database.get)
+            self.virtual_scroll.on_range_changed = lambda s, e: (
+                win.thumbnail_prefetcher.prefetch_pages(self.virtual_scroll.data, s, e))
+        self.virtual_scroll.card_factory = lambda parent: ProjectCard(parent, card_cb)
+        self.virtual_scroll.set_callbacks(card_cb)
+        self.virtual_scroll.refresh_data(sorted_paths)
+
+    def _card_callbacks(self) -> dict:
+        """Retorna dict de callbacks para project_card (FASE-1.2 Bônus)."""
+        win = self.window
+        return {
+            "on_open_modal": win.open_project_modal,
+            "on_toggle_favorite": win.toggle_favorite,
+            "on_toggle_done": win.toggle_done,
+            "on_toggle_good": win.toggle_good,
+            "on_toggle_bad": win.toggle_bad,
+            "on_analyze_single": win.analyze_single_project,
+            "on_open_folder": open_folder,
+            "on_set_category": lambda c: win.display_ctrl.add_filter_chip("category", c),
+            "on_set_tag": lambda t: win.display_ctrl.add_filter_chip("tag", t),
+            "on_set_origin": lambda o: win.display_ctrl.add_filter_chip("origin", o),
+            "on_set_collection": lambda c: win.display_ctrl.add_filter_chip("collection", c),
+            "get_cover_image_async": win.thumbnail_batcher.request,
+            "release_cover_image": win.thumbnail_batcher.release,
+            "selection_mode": win.selection_ctrl.selection_mode,
+            "selected_paths": win.selection_ctrl.selected_paths,
+            "on_toggle_select": win.selection_ctrl.toggle_project,
+            "on_add_to_collection": win._on_add_to_collection,
+            "on_remove_from_collection": win._on_remove_from_collection,
+            "on_new_collection_with": win._on_new_collection_with,
+            "get_collections": lambda: list(win.collections_manager.collections.keys()),
+            "get_project_collections": lambda p: win.collections_manager.get_project_collections(p),
+        }
+
+    def _build_empty_state(self) -> None:
+        """Exibe mensagem quando não há projetos (FASE-1E)."""
+        tk.Label(self.window.scrollable_frame,
+                 text="Nenhum projeto.\nClique em 'Importar Pastas' para adicionar.",
+                 font=("Arial", 14), bg=BG_PRIMARY, fg=FG_TERTIARY, justify="center"
+                 ).grid(row=2, column=0, columnspan=COLS, pady=80)
@@ -0,0 +1,198 @@
+"""
+ui/controllers/result_view.py — Lista filtrada+ordenada do DisplayController.
+
+FILTROS VIA ÍNDICES (backend JSON):
+    mesma semântica de DisplayController.get_filtered_projects(), via
+    interseção de posting lists do ProjectIndex (menor lista primeiro);
+    busca pelo SearchIndex quando existe.
+
+CACHE DE RESULTADOS (LRU):
+    sorted_paths() memoiza a lista filtrada+ordenada pela chave
+    (estado de exibição sem página, revisão dos campos de filtro/ordem,
+    versão das coleções). Trocar de página = fatiar a lista em cache;
+    voltar a uma combinação de chips recente = hit no LRU.
+    Sem ChangeTracker não há como validar a chave → sem cache.
+
+ORIGEM DA LISTA (por backend):
+    - SQLite: filtros e ORDER BY empurrados para SQL (query_paths)
+    - JSON + SortIndex: o resultado vira SortedPaths — a ordem mantida
+      incrementalmente é percorrida testando pertinência no filtro, só
+      até onde a página pede
+    - JSON sem ordem pré-ordenada: filtro + sort_projects()
+
+EXTRAÍDO DE: ui/controllers/display_controller.py (~140 linhas)
+TAMANHO: ~170 linhas
+LIMITE: 300 linhas
+STATUS: ✅ OK
+"""
+from collections import OrderedDict
+from typing import Optional
+
+from config.settings import DISPLAY_RESULT_CACHE_SIZE
+from core.project_index import chip_key
+from utils.logging_setup import LOGGER
+from utils.name_translator import search_bilingual
+
+# Campos do registro que afetam filtros, busca ou ordenação
+FILTER_SORT_FIELDS = (
+    "favorite", "done", "good", "bad", "categories", "tags", "origin",
+    "name", "analyzed", "analysis_type", "added_date",
+)
+
+
+def sort_projects(projects: list, sort_type: str) -> list:
+    """
+    Aplica ordenação aos projetos.
+
+    Args:
+        projects: Lista de tuplas (path, data)
+        sort_type: date_desc, date_asc, name_asc, name_desc, origin, analyzed, not_analyzed
+
+    Returns:
+        list: Lista ordenada de tuplas (path, data)
+    """
+    if not projects:
+        return projects
+
+    try:
+        if sort_type == "date_desc":
+            return sorted(projects, key=lambda p: p[1].get("added_date", ""), reverse=True)
+        elif sort_type == "date_asc":
+            return sorted(projects, key=lambda p: p[1].get("added_date", ""))
+        elif sort_type == "name_asc":
+            return sorted(projects, key=lambda p: p[1].get("name", "").lower())
+        elif sort_type == "name_desc":
+            return sorted(projects, key=lambda p: p[1].get("name", "").lower(), reverse=True)
+        elif sort_type == "origin":
+            return sorted(projects, key=lambda p: (p[1].get("origin", "zzz"), p[1].get("name", "").lower()))
+        elif sort_type == "analyzed":
+            return sorted(projects, key=lambda p: (not p[1].get("analyzed", False), p[1].get("name", "").lower()))
+        elif sort_type == "not_analyzed":
+            return sorted(projects, key=lambda p: (p[1].get("analyzed", False), p[1].get("name", "").lower()))
+        else:
+            return projects
+    except Exception as e:
+        LOGGER.error("Erro ao ordenar projetos: %s", e)
+        return projects
+
+
+class ResultView:
+    """
+    Resultado ordenado do estado atual de um DisplayController.
+
+    Args:
+        ctrl: DisplayController (estado de filtros/busca/ordenação)
+        project_index: core.project_index.ProjectIndex (opcional)
+        search_index: core.search_index.SearchIndex (opcional)
+        changes: core.change_tracker.ChangeTracker (None = sem cache)
+        sort_index: core.sort_index.SortIndex (opcional)
+    """
+
+    def __init__(self, ctrl, project_index=None, search_index=None, changes=None,
+                 sort_index=None, max_size: int = DISPLAY_RESULT_CACHE_SIZE):
+        self.ctrl = ctrl
+        self.project_index = project_index
+        self.search_index = search_index
+        self.changes = changes
+        self.sort_index = sort_index
+        self.max_size = max_size
+        self.logger = LOGGER
+        self._cache: "OrderedDict[tuple, list]" = OrderedDict()
+        self._collections_version = 0
+        manager = ctrl.collections_manager
+        if manager is not None and hasattr(manager, "add_change_listener"):
+            manager.add_change_listener(self._on_collections_changed)
+
+    def sorted_paths(self) -> list:
+        """Paths filtrados JÁ ordenados (lista compartilhada com o cache — não modificar)."""
+        key = self._key()
+        if key is None:
+            return self._compute()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.logger.debug("⚡ Resultado em cache (%d projetos)", len(cached))
+            return cached
+
+        paths = self._compute()
+        self._cache[key] = paths
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return paths
+
+    def indexed_paths(self) -> list:
+        """Paths que passam nos filtros, na ordem do ProjectIndex."""
+        members = self.filtered_members()
+        if members is None:
+            return self.project_index.all_paths()
+        return self.project_index.ordered(members)
+
+    def filtered_members(self) -> Optional[set]:
+        """Conjunto de paths que passam nos filtros via índice (None = todos)."""
+        ctrl = self.ctrl
+        required = [chip_key(f["type"], f["value"]) for f in ctrl.active_filters]
+        if ctrl.current_filter != "all":
+            required.append(("flag", ctrl.current_filter))
+        if ctrl.current_origin != "all":
+            required.append(("origin", ctrl.current_origin))
+        if ctrl.current_tag:
+            required.append(("tag", ctrl.current_tag))
+        any_of = [("category", c) for c in ctrl.current_categories]
+
+        candidates = self.project_index.intersect(required, any_of)
+
+        search_hits = self.search_hits()
+        if search_hits is not None:
+            if candidates is None:
+                return set(search_hits)
+            return {p for p in candidates if p in search_hits}
+        if ctrl.search_query:
+            query = ctrl.search_query
+            source = self.project_index.all_paths() if candidates is None else candidates
+            return {p for p in source
+                    if search_bilingual(query, ctrl.database.get(p, {}).get("name", ""))}
+        return candidates
+
+    def search_hits(self):
+        """Paths que casam com a busca via SearchIndex (None = sem índice/busca)."""
+        if self.search_index is None or not self.ctrl.search_query:
+            return None
+        return self.search_index.search(self.ctrl.search_query)
+
+    def _key(self) -> Optional[tuple]:
+        """Chave do cache: estado sem página + revisão dos dados (None = sem cache)."""
+        if self.changes is None:
+            return None
+        state = self.ctrl.get_display_state()
+        del state["page"], state["infinite"]
+        return (tuple(state.values()),
+                self.changes.field_revision(*FILTER_SORT_FIELDS),
+                self._collections_version)
+
+    def _on_collections_changed(self, _collections) -> None:
+        self._collections_version += 1
+
+    def _compute(self) -> list:
+        ctrl = self.ctrl
+        query_paths = getattr(ctrl.database, "query_paths", None)
+        if query_paths is None and self.sort_index is not None:
+            members = (self.filtered_members() if self.project_index is not None
+                       else set(ctrl.get_filtered_projects()))
+            view = self.sort_index.sorted_view(ctrl.current_sort, members)
+            if view is not None:
+                return view
+        if query_paths is None:
+            filtered = [(p, ctrl.database[p]) for p in ctrl.get_filtered_projects()]
+            return [p for p, _ in sort_projects(filtered, ctrl.current_sort)]
+
+        query = ctrl.search_query
+        return query_paths(
+            main_filter=ctrl.current_filter,
+            chips=[(f["type"], f["value"]) for f in ctrl.active_filters],
+            origin=ctrl.current_origin,
+            categories=ctrl.current_categories,
+            tag=ctrl.current_tag,
+            sort=ctrl.current_sort,
+            name_predicate=(lambda name: search_bilingual(query, name)) if query else None,
+        )
@@ -103,8 +103,7 @@ class SelectionController:
         
         # Remover do banco
         for path in self.selected_paths:
-            if path in self.database:
-                del self.database[path]
+            self.db_manager.remove_project(path)
             
             # Remover de colecoes
             for collection_name in list(self.collections_manager.collections.keys()):
@@ -112,7 +111,7 @@ class SelectionController:
                     self.collections_manager.collections[collection_name].remove(path)
         
         # Salvar alteracoes
-        self.db_manager.save()
+        self.db_manager.commit()
         self.collections_manager.save()
         
         # Limpar selecao
@@ -9,14 +9,15 @@ UI/UX 2026 Best Practices:
 - Ação primária destacada (Importar)
 - Redução de elementos visuais (8 vs 9)
 
-F-04: Busca com debounce 300ms (performance + UX)
+F-04: Busca com debounce (performance + UX) — agendado via after() na
+      thread do Tk; com o SearchIndex a busca custa poucos ms, então o
+      atraso caiu de 300ms para SEARCH_DEBOUNCE_MS
 F-03: Botão Limpar Órfãos no menu BANCO DE DADOS
 F-08: Botão Gerenciar Coleções no menu CONFIGURAÇÕES
 PERF-FIX-2: Indicadores visuais para filtros ativos (🏠⭐✓👍👎)
 """
 import tkinter as tk
 from tkinter import ttk
-import threading
 
 from config.settings import VERSION
 from config.ui_constants import (
@@ -26,6 +27,9 @@ from config.ui_constants import (
 )
 
 
+SEARCH_DEBOUNCE_MS = 120
+
+
 class HeaderBar:
     """
     Callbacks em `cb`:
@@ -45,7 +49,7 @@ class HeaderBar:
         self._cb = cb
         self._select_btn = None
         self.search_var = tk.StringVar()
-        self._search_timer = None  # F-04: Timer de debounce
+        self._search_job = None  # F-04: after() de debounce
         # PERF-FIX-2: Armazena referências dos botões de filtro
         self.filter_btns = {}  # {ftype: btn}
         self._build(parent)
@@ -81,14 +85,17 @@ class HeaderBar:
 
     def _debounced_search(self) -> None:
         """
-        F-04: Debounce 300ms — só busca após usuário parar de digitar.
-        Cancela timer anterior se continuar digitando.
+        F-04: Debounce — só busca após usuário parar de digitar.
+        Cancela agendamento anterior se continuar digitando.
         """
-        if self._search_timer:
-            self._search_timer.cancel()
+        if self._search_job:
+            self._search_entry.after_cancel(self._search_job)
         
-        self._search_timer = threading.Timer(0.3, self._cb["on_search"])
-        self._search_timer.start()
+        self._search_job = self._search_entry.after(SEARCH_DEBOUNCE_MS, self._run_search)
+    
+    def _run_search(self) -> None:
+        self._search_job = None
+        self._cb["on_search"]()
 
     def _build(self, parent: tk.Widget) -> None:
         hdr = tk.Frame(parent, bg="#000000", height=70)
@@ -144,12 +151,13 @@ class HeaderBar:
                  fg=FG_PRIMARY, font=("Arial", 14)).pack(side="left", padx=5)
         
         self.search_var.trace_add("write", lambda *_: self._debounced_search())
-        tk.Entry(
+        self._search_entry = tk.Entry(
             search_frame, textvariable=self.search_var,
             bg="#222222", fg=FG_PRIMARY, font=("Arial", 12),
             width=35, relief="flat", insertbackground=FG_PRIMARY,
             highlightthickness=1, highlightbackground="#444444", highlightcolor=ACCENT_RED,
-        ).pack(side="left", ipady=6)
+        )
+        self._search_entry.pack(side="left", ipady=6)
 
         # ══════════════════════════════════════════════════════════════════
         # DIREITA: Ação Primária + Menu Organizado
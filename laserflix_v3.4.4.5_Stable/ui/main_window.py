@@ -20,22 +20,30 @@ REFACTOR-FASE-1.2: HeaderBuilder + CardsGridBuilder extraídos ✅
 REFACTOR-FASE-1.2.1: Contador integrado ao HeaderBuilder ✅
 REFACTOR-FASE-1.2.2: ModalGenerator extraído ✅
 REFACTOR-FASE-1.3: OrphanManager extraído ✅
+DisplayRenderer extraído (header, grid, patch, scroll) ✅
 """
 import os
 import tkinter as tk
 from tkinter import ttk, simpledialog
 
-from config.settings import VERSION
-from config.card_layout import COLS
+from config.settings import VERSION, WATCH_ENABLED
 from config.ui_constants import (
     BG_PRIMARY, BG_CARD, ACCENT_RED, ACCENT_GOLD,
-    FG_PRIMARY, FG_TERTIARY, SCROLL_SPEED,
+    FG_PRIMARY,
 )
 
 from core.database import DatabaseManager
 from core.collections_manager import CollectionsManager
+from core.project_index import ProjectIndex
+from core.search_index import SearchIndex
+from core.sort_index import SortIndex
+from core.facet_counts import FacetCounter
 from core.thumbnail_preloader import ThumbnailPreloader
+from core.cover_resolver import CoverResolver
+from core.structure_resolver import StructureResolver
+from core.cover_image_cache import CoverImageCache
 from core.project_scanner import ProjectScanner
+from core.folder_watcher import FolderWatcher
 
 from ai.ollama_client import OllamaClient
 from ai.image_analyzer import ImageAnalyzer
@@ -44,7 +52,7 @@ from ai.fallbacks import FallbackGenerator
 from ai.analysis_manager import AnalysisManager
 
 from utils.logging_setup import LOGGER
-from utils.platform_utils import open_folder
+from utils.scan_snapshot import ScanSnapshot
 
 from ui.recursive_import_integration import RecursiveImportManager
 from ui.edit_modal import EditModal
@@ -54,6 +62,7 @@ from ui.controllers.display_controller import DisplayController
 from ui.controllers.analysis_controller import AnalysisController
 from ui.controllers.selection_controller import SelectionController
 from ui.controllers.collection_controller import CollectionController
+from ui.controllers.display_renderer import DisplayRenderer
 from ui.builders.ui_builder import UIBuilder
 from ui.managers.dialog_manager import DialogManager
 from ui.managers.toggle_manager import ToggleManager
@@ -61,6 +70,9 @@ from ui.managers.collection_dialog_manager import CollectionDialogManager
 from ui.managers.progress_ui_manager import ProgressUIManager
 from ui.managers.orphan_manager import OrphanManager
 from ui.managers.modal_generator import ModalGenerator
+from ui.managers.thumbnail_batcher import ThumbnailBatcher
+from ui.managers.ui_scheduler import UIScheduler
+from ui.managers.thumbnail_prefetcher import ThumbnailPrefetcher
 
 class LaserflixMainWindow:
     def __init__(self, root: tk.Tk):
@@ -72,7 +84,34 @@ class LaserflixMainWindow:
         self.db_manager.load_database()
         
         self.collections_manager = CollectionsManager()
-        self.thumbnail_preloader = ThumbnailPreloader(max_workers=4)
+        if self.db_manager.store:
+            self.collections_manager.add_change_listener(self.db_manager.store.replace_collections)
+            self.db_manager.store.replace_collections(self.collections_manager.collections)
+            self.project_index = None  # filtros resolvidos em SQL
+            self.search_index = None
+            self.sort_index = None     # ORDER BY no SQL
+        else:
+            self.project_index = ProjectIndex(self.db_manager, self.collections_manager)
+            self.db_manager.add_change_listener(self.project_index.on_database_change)
+            self.collections_manager.add_change_listener(self.project_index.on_collections_change)
+            self.search_index = SearchIndex(self.db_manager)
+            self.db_manager.add_change_listener(self.search_index.on_database_change)
+            self.sort_index = SortIndex(self.db_manager)
+            self.db_manager.add_change_listener(self.sort_index.on_database_change)
+        self.facet_counts = FacetCounter(self.db_manager)  # contagens da sidebar
+        self.db_manager.add_change_listener(self.facet_counts.on_database_change)
+        self.ui_scheduler = UIScheduler(self.root)  # trabalho de UI com orçamento por frame
+        self.ui_scheduler.start()
+        self.cover_resolver = CoverResolver(self.db_manager, scheduler=self.ui_scheduler)
+        self.thumbnail_preloader = ThumbnailPreloader(
+            max_workers=4, cover_resolver=self.cover_resolver)
+        self.thumbnail_batcher = ThumbnailBatcher(
+            self.root, self.thumbnail_preloader, scheduler=self.ui_scheduler)
+        self.cover_images = CoverImageCache()  # capas grandes do modal (decode 1x, worker)
+        self.thumbnail_prefetcher = ThumbnailPrefetcher(
+            self.root, self.thumbnail_preloader, self.thumbnail_batcher)
+        self.thumbnail_prefetcher.watch_interaction()
+        self.scan_snapshot = ScanSnapshot()  # rescan incremental (mtime das pastas)
         self.scanner = ProjectScanner(self.db_manager.database)
 
         self.ollama = OllamaClient(self.db_manager.config.get("models"))
@@ -80,6 +119,10 @@ class LaserflixMainWindow:
         self.fallback_generator = FallbackGenerator(self.scanner)
         self.text_generator = TextGenerator(
             self.ollama, self.image_analyzer, self.scanner, self.fallback_generator)
+        self.text_generator.cover_resolver = self.cover_resolver
+        self.structure_resolver = StructureResolver(
+            self.db_manager, self.scanner, scheduler=self.ui_scheduler)
+        self.text_generator.structure_resolver = self.structure_resolver
         self.analysis_manager = AnalysisManager(
             self.text_generator, self.db_manager, self.ollama)
 
@@ -89,7 +132,11 @@ class LaserflixMainWindow:
         self.display_ctrl = DisplayController(
             database=self.database,
             collections_manager=self.collections_manager,
-            items_per_page=36
+            items_per_page=36,
+            project_index=self.project_index,
+            search_index=self.search_index,
+            changes=self.db_manager.changes,
+            sort_index=self.sort_index,
         )
         self.display_ctrl.on_display_update = self.display_projects
         
@@ -100,6 +147,7 @@ class LaserflixMainWindow:
             db_manager=self.db_manager,
             ollama_client=self.ollama
         )
+        self.analysis_ctrl.scheduler = self.ui_scheduler
         # Progress UI configurado após _build_ui()
         self.analysis_ctrl.on_analysis_complete = lambda msg: self.status_bar.config(text=msg)
         self.analysis_ctrl.on_refresh_ui = lambda: (
@@ -137,16 +185,15 @@ class LaserflixMainWindow:
             self.display_projects()
         )
         
-        self._last_display_state = None
-        self._force_rebuild = False
-        self._visible_range = (0, 36)
-        self._scroll_update_pending = False
+        self.renderer = DisplayRenderer(self)  # header + grid, patch/rebuild, scroll
 
         self.import_manager = RecursiveImportManager(
-            parent=self.root, database=self.database,
+            parent=self.root, database=self.database, db_manager=self.db_manager,
             project_scanner=self.scanner, text_generator=self.text_generator,
             analysis_manager=self.analysis_manager,
             on_complete=self._on_import_complete,
+            scan_snapshot=self.scan_snapshot,
+            structure_resolver=self.structure_resolver,
         )
 
         self.root.title(f"LASERFLIX {VERSION}")
@@ -168,11 +215,18 @@ class LaserflixMainWindow:
         )
         
         self.progress_ui = ProgressUIManager(
-            self.progress_bar, self.stop_btn, self.status_bar, self.root
+            self.progress_bar, self.stop_btn, self.status_bar, self.root,
+            scheduler=self.ui_scheduler
         )
         self.analysis_ctrl.on_show_progress = self.progress_ui.show
         self.analysis_ctrl.on_hide_progress = self.progress_ui.hide
         self.analysis_ctrl.on_update_progress = self.progress_ui.update
+        self.import_manager.scheduler = self.ui_scheduler
+        self.import_manager.on_show_progress = self.progress_ui.show
+        self.import_manager.on_hide_progress = self.progress_ui.hide
+        self.import_manager.on_update_progress = self.progress_ui.update
+        self.import_manager.on_batch_imported = self._on_import_batch
+        self.import_manager.on_warm_thumbnails = self.thumbnail_prefetcher.add_neighbors
         
         self.orphan_mgr = OrphanManager(
             database=self.database,
@@ -193,6 +247,14 @@ class LaserflixMainWindow:
         )
         # === FIM MANAGERS ===
         
+        # Watcher em segundo plano: mudanças nas pastas → banco/índices em lote
+        self.folder_watcher = FolderWatcher(self.db_manager, self.scanner, scheduler=self.ui_scheduler)
+        self.db_manager.add_change_listener(self.folder_watcher.on_database_change)
+        self.folder_watcher.on_changes = self._on_library_changed
+        if WATCH_ENABLED:
+            self.folder_watcher.start(self.db_manager.config.get("folders", []))
+        
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.display_projects()
         self.logger.info("✨ Laserflix v%s iniciado (FASE-1.2.2)", VERSION)
 
@@ -200,49 +262,23 @@ class LaserflixMainWindow:
         if hasattr(self, 'thumbnail_preloader'):
             self.thumbnail_preloader.shutdown()
 
+    def _on_close(self) -> None:
+        """Compacta journal do banco no snapshot antes de sair."""
+        self.folder_watcher.stop()
+        self.thumbnail_prefetcher.cancel()
+        self.thumbnail_batcher.stop()
+        self.ui_scheduler.stop()
+        self.cover_images.shutdown()
+        self.structure_resolver.shutdown()
+        self.db_manager.close()
+        self.root.destroy()
+
     def _build_ui(self) -> None:
         """Constrói UI usando UIBuilder (FASE-D)."""
         UIBuilder.build(self)
 
-    def _on_scroll(self, event):
-        self.content_canvas.yview_scroll(int(-1*(event.delta/SCROLL_SPEED)), "units")
-        self._schedule_viewport_update()
-    
-    def _schedule_viewport_update(self):
-        if self._scroll_update_pending:
-            return
-        self._scroll_update_pending = True
-        self.root.after(100, self._update_visible_cards)
-    
-    def _update_visible_cards(self):
-        self._scroll_update_pending = False
-
-    def _should_rebuild(self) -> bool:
-        if self._force_rebuild:
-            self._force_rebuild = False
-            return True
-        
-        current_state = self.display_ctrl.get_display_state()
-        current_state["selection_mode"] = self.selection_ctrl.selection_mode
-        current_state["db_hash"] = (
-            len(self.database),
-            sum(1 for d in self.database.values() if d.get("favorite")),
-            sum(1 for d in self.database.values() if d.get("done")),
-        )
-        
-        if self._last_display_state is None:
-            self._last_display_state = current_state
-            return True
-        
-        if current_state == self._last_display_state:
-            self.logger.debug("⚡ SKIP rebuild")
-            return False
-        
-        self._last_display_state = current_state
-        return True
-
     def _invalidate_cache(self) -> None:
-        self._force_rebuild = True
+        self.renderer.invalidate()
 
     # FILTROS
     def set_filter(self, filter_type: str) -> None:
@@ -304,83 +340,7 @@ class LaserflixMainWindow:
 
     # DISPLAY
     def display_projects(self) -> None:
-        if not self._should_rebuild():
-            self.logger.debug("⚡ SKIP display_projects")
-            return
-        
-        for w in self.scrollable_frame.winfo_children():
-            w.destroy()
-        
-        filtered_paths = self.display_ctrl.get_filtered_projects()
-        all_filtered = [(p, self.database[p]) for p in filtered_paths if p in self.database]
-        all_filtered = self.display_ctrl.apply_sorting(all_filtered)
-        total_count = len(all_filtered)
-        
-        page_info = self.display_ctrl.get_page_info(total_count)
-        start_idx = page_info["start_idx"]
-        end_idx = page_info["end_idx"]
-        page_items = all_filtered[start_idx:end_idx]
-        
-        # Usar HeaderBuilder com contador integrado (FASE-1.2.1)
-        from ui.builders.header_builder import HeaderBuilder
-        HeaderBuilder.build(
-            self.scrollable_frame, 
-            self.display_ctrl,
-            total_count=total_count,
-            showing_count=len(page_items)
-        )
-        
-        if not all_filtered:
-            self._build_empty_state()
-            return
-        
-        # Usar CardsGridBuilder (FASE-1.2B)
-        from ui.builders.cards_grid_builder import CardsGridBuilder
-        card_cb = self._get_card_callbacks()
-        CardsGridBuilder.build(self.scrollable_frame, page_items, card_cb)
-        
-        self.content_canvas.yview_moveto(0)
-
-    def _get_card_callbacks(self) -> dict:
-        """Retorna dict de callbacks para project_card (FASE-1.2 Bônus)."""
-        return {
-            "on_open_modal": self.open_project_modal,
-            "on_toggle_favorite": self.toggle_favorite,
-            "on_toggle_done": self.toggle_done,
-            "on_toggle_good": self.toggle_good,
-            "on_toggle_bad": self.toggle_bad,
-            "on_analyze_single": self.analyze_single_project,
-            "on_open_folder": open_folder,
-            "on_set_category": lambda c: self.display_ctrl.add_filter_chip("category", c),
-            "on_set_tag": lambda t: self.display_ctrl.add_filter_chip("tag", t),
-            "on_set_origin": lambda o: self.display_ctrl.add_filter_chip("origin", o),
-            "on_set_collection": lambda c: self.display_ctrl.add_filter_chip("collection", c),
-            "get_cover_image_async": self._get_thumbnail_async,
-            "selection_mode": self.selection_ctrl.selection_mode,
-            "selected_paths": self.selection_ctrl.selected_paths,
-            "on_toggle_select": self.selection_ctrl.toggle_project,
-            "on_add_to_collection": self._on_add_to_collection,
-            "on_remove_from_collection": self._on_remove_from_collection,
-            "on_new_collection_with": self._on_new_collection_with,
-            "get_collections": lambda: list(self.collections_manager.collections.keys()),
-            "get_project_collections": lambda p: self.collections_manager.get_project_collections(p),
-        }
-
-    def _build_empty_state(self) -> None:
-        """Exibe mensagem quando não há projetos (FASE-1E)."""
-        tk.Label(self.scrollable_frame,
-                 text="Nenhum projeto.\nClique em 'Importar Pastas' para adicionar.",
-                 font=("Arial", 14), bg=BG_PRIMARY, fg=FG_TERTIARY, justify="center"
-                 ).grid(row=2, column=0, columnspan=COLS, pady=80)
-
-    def _get_thumbnail_async(self, project_path, callback, widget):
-        def _ui_safe_callback(path, photo):
-            try:
-                if widget and widget.winfo_exists():
-                    self.root.after(0, lambda: callback(path, photo))
-            except Exception as e:
-                self.logger.debug(f"Widget destruído: {e}")
-        self.thumbnail_preloader.preload_single(project_path, _ui_safe_callback)
+        self.renderer.render()
 
     # MODALS
     def open_project_modal(self, project_path: str) -> None:
@@ -398,14 +358,19 @@ class LaserflixMainWindow:
                 "on_set_tag": lambda t: self.display_ctrl.add_filter_chip("tag", t),
                 "on_remove": self.remove_project,
                 "get_project_collections": lambda p: self.collections_manager.get_project_collections(p),
+                "on_prefetch_neighbors": self.thumbnail_prefetcher.add_neighbors,
             },
             cache=self.thumbnail_preloader, scanner=self.scanner,
+            cover_images=self.cover_images, structures=self.structure_resolver,
         ).open()
 
     def _modal_toggle(self, path, key, value) -> None:
         if path in self.database:
-            self.database[path][key] = value
-            self.db_manager.save_database()
+            fields = {key: value}
+            if value and key in ("good", "bad"):
+                fields["bad" if key == "good" else "good"] = False
+            self.db_manager.update_project(path, **fields)
+            self.db_manager.commit()
             self._invalidate_cache()
             self.display_projects()
 
@@ -420,10 +385,10 @@ class LaserflixMainWindow:
 
     def _on_edit_save(self, path, new_cats, new_tags) -> None:
         if path in self.database:
-            if new_cats: self.database[path]["categories"] = new_cats
-            self.database[path]["tags"] = new_tags
-            self.database[path]["analyzed"] = True
-            self.db_manager.save_database()
+            fields = {"tags": new_tags, "analyzed": True}
+            if new_cats: fields["categories"] = new_cats
+            self.db_manager.update_project(path, **fields)
+            self.db_manager.commit()
             self.sidebar.refresh(self.database, self.collections_manager)
             self._invalidate_cache()
             self.display_projects()
@@ -445,8 +410,8 @@ class LaserflixMainWindow:
     def remove_project(self, path: str) -> None:
         if path in self.database:
             name = self.database[path].get("name", path)
-            self.database.pop(path)
-            self.db_manager.save_database()
+            self.db_manager.remove_project(path)
+            self.db_manager.commit()
             self.collections_manager.clean_orphan_projects(set(self.database.keys()))
             self.sidebar.refresh(self.database, self.collections_manager)
             self._invalidate_cache()
@@ -496,6 +461,28 @@ class LaserflixMainWindow:
     def manual_backup(self) -> None:
         DialogManager.manual_backup(self)
 
+    def stop_current_task(self) -> None:
+        """Botão ⏹: cancela a importação em andamento, senão a análise."""
+        if self.import_manager.is_importing():
+            self.import_manager.cancel()
+        else:
+            self.analysis_manager.stop()
+
+    def _on_import_batch(self) -> None:
+        """Lote da importação em streaming gravado: novos projetos aparecem no grid."""
+        self._invalidate_cache()
+        self.display_projects()
+
+    def _on_library_changed(self, changes: dict) -> None:
+        """Lote do FolderWatcher já gravado no banco (ausentes só marcados)."""
+        for old_path, new_path in changes["renamed"]:
+            self.collections_manager.rename_project(old_path, new_path)
+        self._invalidate_cache()
+        self.display_projects()
+        self.status_bar.config(
+            text=f"👁️ Pastas: +{len(changes['added'])} / ✏️ {len(changes['renamed'])} / "
+                 f"{len(changes['missing'])} ausente(s) — remover em 🧹 Limpar órfãos")
+
     def _on_import_complete(self) -> None:
         self.database = self.db_manager.database
         self.import_manager.database = self.database
@@ -8,7 +8,6 @@ FASE-F: DialogManager (reorganização segura)
 - ZERO mudança de lógica, apenas reorganização
 """
 import os
-import shutil
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
@@ -118,7 +117,7 @@ class DialogManager:
         )
         
         if path:
-            shutil.copy2("laserflix_database.json", path)
+            window.db_manager.export_json(path)
             messagebox.showinfo(
                 "✅ Exportado",
                 f"Banco exportado:\n{path}"
@@ -144,8 +143,7 @@ class DialogManager:
         )
         
         if path:
-            shutil.copy2(path, "laserflix_database.json")
-            window.db_manager.load_database()
+            window.db_manager.import_json(path)
             window.database = window.db_manager.database
             window.sidebar.refresh(window.database, window.collections_manager)
             window._invalidate_cache()
@@ -0,0 +1,129 @@
+"""
+ui/managers/import_analysis_manager.py — Fim da importação + análise automática.
+
+ANÁLISE AUTOMÁTICA SEQUENCIAL pós-importação:
+  - após importação bem-sucedida, pergunta se quer analisar
+  - se sim, executa SEQUENCIALMENTE (apenas os recém-importados):
+    1. Categorias + Tags (analysis_manager)
+    2. Descrições (text_generator) — geradas numa thread de trabalho e
+       gravadas na thread principal (commit a cada 5 e no fim)
+  - on_complete é postado com a prioridade das gravações (FIFO): roda
+    depois da última descrição gravada e commitada
+
+EXTRAÍDO DE: ui/recursive_import_integration.py
+"""
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+from tkinter import messagebox
+from utils.logging_setup import LOGGER
+
+
+class ImportAnalysisManager:
+    """
+    save(path, **campos): grava no banco (chamado na thread principal).
+    commit(): persiste as gravações pendentes (thread principal).
+    ui(callback, *args, priority=...): agenda na thread principal.
+    """
+
+    def __init__(self, parent, analysis_manager, text_generator, database,
+                 save: Callable, commit: Callable, ui: Callable):
+        self.parent = parent
+        self.analysis_manager = analysis_manager
+        self.text_generator = text_generator
+        self.database = database
+        self.save = save
+        self.commit = commit
+        self.ui = ui
+        self.logger = LOGGER
+
+    def finish(self, paths: List[str], success: int, failed: int, cancelled: bool,
+               on_complete: Optional[Callable]) -> None:
+        """Thread principal: oferece análise dos importados ou encerra."""
+        if success > 0 and self.analysis_manager and self.text_generator:
+            self._ask_auto_analysis(paths, success, on_complete)
+            return
+
+        # Callback normal sem análise
+        if on_complete:
+            on_complete()
+
+        title = "⏹ Importação Cancelada" if cancelled else "✅ Importação Concluída"
+        messagebox.showinfo(
+            title,
+            f"Importados: {success} produto(s)\nPulados/erros: {failed}",
+            parent=self.parent,
+        )
+
+    def _ask_auto_analysis(self, paths: List[str], success_count: int,
+                           on_complete: Optional[Callable]) -> None:
+        response = messagebox.askyesno(
+            "🤖 Análise Automática",
+            f"✅ {success_count} produto(s) importado(s)!\n\n"
+            f"🤔 Deseja analisar AGORA?\n\n"
+            f"SEQUENCIAL:\n"
+            f"1️⃣ Categorias + Tags (IA)\n"
+            f"2️⃣ Descrições (IA)\n\n"
+            f"Isso pode levar alguns minutos.",
+            parent=self.parent,
+        )
+
+        if response:
+            self.logger.info("🤖 Iniciando análise SEQUENCIAL de %d produtos", len(paths))
+            self._run_sequential_analysis(paths, on_complete)
+        else:
+            self.logger.info("⏭️ Usuário optou por NÃO analisar")
+            if on_complete:
+                on_complete()
+
+    def _run_sequential_analysis(self, paths: List[str], on_complete: Optional[Callable]) -> None:
+        """
+        1. Categorias + Tags para todos  2. Aguarda conclusão  3. Descrições
+        """
+        def _worker():
+            try:
+                self.logger.info("📊 ETAPA 1/2: Analisando categorias e tags...")
+                self._wait_for_analysis_manager()
+                self.logger.info("📝 ETAPA 2/2: Gerando descrições...")
+                self._generate_descriptions_batch(paths)
+                self.logger.info("✅ Análise sequencial concluída!")
+            except Exception as e:
+                self.logger.error("Erro na análise sequencial: %s", e, exc_info=True)
+            finally:
+                # Mesma prioridade das gravações: FIFO atrás da última descrição
+                self.ui(self.commit)
+                self.ui(on_complete)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+        # Inicia análise de categorias/tags (não bloqueia)
+        self.analysis_manager.analyze_batch(paths, self.database)
+
+    def _wait_for_analysis_manager(self) -> None:
+        while self.analysis_manager.is_analyzing:
+            time.sleep(0.5)
+        self.logger.info("✅ Categorias e tags finalizadas")
+
+    def _generate_descriptions_batch(self, paths: List[str]) -> None:
+        """Thread de trabalho: gera; a gravação vai para a thread principal."""
+        done = 0
+        for path in paths:
+            data = self.database.get(path)
+            if data is None or not os.path.isdir(path):
+                continue
+            try:
+                desc = self.text_generator.generate_description(path, data)
+                self.ui(self._save_description, path, desc)
+                done += 1
+                if done % 5 == 0:
+                    self.ui(self.commit)
+                self.logger.debug(f"📝 [{done}/{len(paths)}] {os.path.basename(path)}")
+            except Exception as e:
+                self.logger.error(f"Erro ao gerar descrição para {path}: {e}")
+
+        self.logger.info(f"📝 {done} descrições geradas")
+
+    def _save_description(self, path: str, desc: str) -> None:
+        if path in self.database:
+            self.save(path, ai_description=desc)
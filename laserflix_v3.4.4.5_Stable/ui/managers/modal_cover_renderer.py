@@ -0,0 +1,122 @@
+"""
+ui/managers/modal_cover_renderer.py — Capa do ProjectModal sem travar o Tk.
+
+Fluxo a cada resize (com debounce de MODAL_COVER_DEBOUNCE_MS):
+    1. variante final já em cache → exibe na hora
+    2. senão: worker gera prévia BILINEAR → exibe
+              worker gera passada final (MODAL_RESAMPLE) → substitui
+Resizes novos invalidam os anteriores (geração); resultados chegam por
+uma fila drenada via after() — a PhotoImage nasce na thread principal.
+"""
+import queue
+from typing import Callable, Optional, Tuple
+
+from config.settings import MODAL_RESAMPLE, MODAL_COVER_PREVIEW_RESAMPLE, MODAL_COVER_DEBOUNCE_MS
+from utils.logging_setup import LOGGER
+
+
+class ModalCoverRenderer:
+    """
+    Mantém `label` preenchido com `cover_path` no tamanho de `container`.
+
+    on_rendered(box): chamado quando a passada final de `box` é exibida
+    (o modal usa para pré-gerar ◄ ► no mesmo tamanho).
+    """
+
+    POLL_MS = 16
+
+    def __init__(self, container, label, cover_path: str, images,
+                 debounce_ms: int = MODAL_COVER_DEBOUNCE_MS):
+        self.container = container
+        self.label = label
+        self.cover_path = cover_path
+        self.images = images  # core.cover_image_cache.CoverImageCache
+        self.debounce_ms = debounce_ms
+        self.logger = LOGGER
+        self.on_rendered: Optional[Callable[[Tuple[int, int]], None]] = None
+
+        self._gen = 0
+        self._box: Optional[Tuple[int, int]] = None
+        self._after_id = None
+        self._polling = False
+        self._waiting = False  # passada final da geração atual ainda no worker
+        self._results: "queue.Queue" = queue.Queue()
+
+        container.bind("<Configure>", lambda e: self.schedule())
+
+    def schedule(self, delay_ms: Optional[int] = None) -> None:
+        """(Re)agenda o render após o resize assentar."""
+        if self._after_id is not None:
+            self.container.after_cancel(self._after_id)
+        self._after_id = self.container.after(
+            self.debounce_ms if delay_ms is None else delay_ms, self._start)
+
+    def _start(self) -> None:
+        self._after_id = None
+        if not self.container.winfo_exists():
+            return
+        box = (self.container.winfo_width(), self.container.winfo_height())
+        if box[0] < 10 or box[1] < 10 or box == self._box:
+            return
+        self._box = box
+        self._gen += 1
+
+        final = self.images.peek(self.cover_path, box, MODAL_RESAMPLE)
+        if final is not None:
+            self._waiting = False
+            self._show(final)
+            self._rendered(box)
+            return
+        preview = self.images.peek(self.cover_path, box, MODAL_COVER_PREVIEW_RESAMPLE)
+        if preview is not None:
+            self._show(preview)
+        self._waiting = True
+        self.images.submit(self._render, self._gen, box, preview is None)
+        if not self._polling:
+            self._polling = True
+            self.container.after(self.POLL_MS, self._poll)
+
+    def _render(self, gen: int, box: Tuple[int, int], need_preview: bool) -> None:
+        """Worker: prévia + passada final, abortando se outro resize chegou."""
+        try:
+            if need_preview and gen == self._gen:
+                img = self.images.scaled(self.cover_path, box, MODAL_COVER_PREVIEW_RESAMPLE)
+                self._results.put((gen, box, img, False))
+            if gen == self._gen:
+                img = self.images.scaled(self.cover_path, box, MODAL_RESAMPLE)
+                self._results.put((gen, box, img, True))
+        except Exception as e:
+            self.logger.warning("Falha ao renderizar capa %s: %s", self.cover_path, e)
+            self._results.put((gen, box, None, True))
+
+    def _poll(self) -> None:
+        if not self.container.winfo_exists():
+            self._polling = False
+            return
+        while True:
+            try:
+                gen, box, img, final = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if gen != self._gen:
+                continue
+            if img is not None:
+                self._show(img)
+            if final:
+                self._waiting = False
+                if img is not None:
+                    self._rendered(box)
+        if self._waiting:
+            self.container.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def _show(self, img) -> None:
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(img)
+        self.label.config(image=photo)
+        self.label.image = photo
+
+    def _rendered(self, box: Tuple[int, int]) -> None:
+        if self.on_rendered:
+            self.on_rendered(box)
@@ -59,8 +59,8 @@ class ModalGenerator:
                 )
                 
                 # Salvar no banco
-                self.database[path]["ai_description"] = desc
-                self.db_manager.save_database()
+                self.db_manager.update_project(path, ai_description=desc)
+                self.db_manager.commit()
                 
                 # Fechar modal e reabrir com descrição nova
                 modal.after(0, modal.destroy)
@@ -62,10 +62,10 @@ class OrphanManager:
         
         # Remover órfãos
         for path in orphans:
-            self.database.pop(path, None)
+            self.db_manager.remove_project(path)
         
         # Salvar e atualizar UI
-        self.db_manager.save_database()
+        self.db_manager.commit()
         self.collections_manager.clean_orphan_projects(set(self.database.keys()))
         self.on_refresh()
         self.on_status_update(f"🧹 {len(orphans)} órfão(s) removido(s) do banco.")
@@ -1,25 +1,53 @@
 # -*- coding: utf-8 -*-
-"""Gerencia UI de progresso (progress bar)."""
+"""
+Gerencia UI de progresso (progress bar).
+
+Com `scheduler` (UIScheduler), show/hide/update podem ser chamados de
+qualquer thread: viram tarefas da thread principal e update() é coalescido
+— rajadas de progresso desenham só o valor mais recente, uma vez por frame.
+"""
+from ui.managers.ui_scheduler import PRIORITY_HIGH, PRIORITY_LOW
 
 
 class ProgressUIManager:
-    def __init__(self, progress_bar, stop_btn, status_bar, root):
+    def __init__(self, progress_bar, stop_btn, status_bar, root, scheduler=None):
         self.progress_bar = progress_bar
         self.stop_btn = stop_btn
         self.status_bar = status_bar
         self.root = root
-    
+        self.scheduler = scheduler
+
     def show(self):
+        if self.scheduler:
+            self.scheduler.post(self._show, priority=PRIORITY_HIGH, key="progress_visibility")
+        else:
+            self._show()
+
+    def hide(self):
+        if self.scheduler:
+            self.scheduler.cancel("progress")  # não redesenha valor antigo depois
+            self.scheduler.post(self._hide, priority=PRIORITY_HIGH, key="progress_visibility")
+        else:
+            self._hide()
+
+    def update(self, current: int, total: int, message: str = ""):
+        if self.scheduler:
+            self.scheduler.post(self._render, current, total, message,
+                                priority=PRIORITY_LOW, key="progress")
+        else:
+            self._render(current, total, message)
+            self.root.update_idletasks()
+
+    def _show(self):
         self.progress_bar.pack(side="left", padx=10)
         self.stop_btn.pack(side="right", padx=10)
         self.progress_bar["value"] = 0
-    
-    def hide(self):
+
+    def _hide(self):
         self.progress_bar.pack_forget()
         self.stop_btn.pack_forget()
-    
-    def update(self, current: int, total: int, message: str = ""):
+
+    def _render(self, current: int, total: int, message: str):
         pct = (current / total) * 100 if total else 0
         self.progress_bar["value"] = pct
         self.status_bar.config(text=f"{message} ({current}/{total} — {pct:.1f}%)")
-        self.root.update_idletasks()
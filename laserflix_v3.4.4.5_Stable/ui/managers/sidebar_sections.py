@@ -0,0 +1,216 @@
+"""
+ui/managers/sidebar_sections.py — Conteúdo das seções da sidebar.
+
+INCREMENTAL: contagens vêm do FacetCounter (mantido pelo DatabaseManager)
+quando disponível. Cada seção vira uma lista de linhas (chave, texto);
+se as chaves não mudaram só os textos alterados recebem config(text=),
+senão só aquela seção é recriada.
+
+"Dentro do filtro" (set_scope): origem/categorias/tags contam só os
+paths do resultado atual, exibidos como n/total.
+
+EXTRAÍDO DE: ui/sidebar.py (~130 linhas)
+"""
+import tkinter as tk
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.ui_constants import (
+    SIDEBAR_MAX_CATEGORIES, SIDEBAR_MAX_TAGS,
+    BG_SECONDARY, BG_CARD,
+    FG_TERTIARY,
+    ORIGIN_COLORS,
+)
+from core.facet_counts import FACETS, project_facets
+
+
+class SidebarSections:
+    """
+    Args:
+        frames: {"origins"|"collections"|"categories"|"tags": tk.Frame}
+        cb: callbacks da SidebarPanel (on_origin, on_category, ...)
+        facets: core.facet_counts.FacetCounter (opcional; evita recontar o banco)
+        bind_scroll: liga a roda do mouse aos widgets novos de uma seção
+        active_btn: retorna o botão destacado (hover não o apaga)
+    """
+
+    def __init__(self, frames: Dict[str, tk.Frame], cb: dict, facets=None,
+                 bind_scroll: Optional[Callable] = None,
+                 active_btn: Callable[[], Optional[tk.Widget]] = lambda: None):
+        self._frames = frames
+        self._cb = cb
+        self._facets = facets
+        self._bind_scroll = bind_scroll
+        self._active_btn = active_btn
+        self._database = {}
+        self._collections_manager = None
+        self._scope = None
+        self._scope_token = 0
+        self._seen: Dict[str, tuple] = {}  # faceta → (revisão, scope) já exibidos
+        self._rows: Dict[str, List[Tuple[tuple, str]]] = {}   # seção → linhas exibidas
+        self._widgets: Dict[str, Dict[tuple, tk.Widget]] = {}  # seção → {chave: widget}
+
+    def refresh(self, database: dict, collections_manager=None) -> None:
+        self._database = database
+        self._collections_manager = collections_manager
+        self._update_origins()
+        self._update_collections()
+        self._update_categories()
+        self._update_tags()
+
+    def set_scope(self, scope: Optional[Iterable[str]]) -> None:
+        self._scope = None if scope is None else list(scope)
+        self._scope_token += 1
+        self._update_origins()
+        self._update_categories()
+        self._update_tags()
+
+    # ------------------------------------------------------------------
+    # Atualização de cada seção
+    # ------------------------------------------------------------------
+
+    def _update_origins(self) -> None:
+        if self._unchanged("origin"):
+            return
+        origins = self._facet_counts("origin")
+        totals = self._facet_totals("origin", origins)
+        rows = [(("origin", o), self._label(o, origins[o], totals)) for o in sorted(origins)]
+        self._sync("origins", rows)
+
+    def _update_collections(self) -> None:
+        """
+        F-08: Lista todas as coleções com contador de projetos.
+        Botão "Gerenciar" para abrir dialog.
+        """
+        if not self._collections_manager:
+            rows = [(("empty",), "Aguardando...")]
+        else:
+            collections = self._collections_manager.get_all_collections()
+            rows = [(("collection", name),
+                     f"📁 {name} ({self._collections_manager.get_collection_size(name)})")
+                    for name in collections] or [(("empty",), "Nenhuma coleção")]
+            rows.append((("manage",), "⚙️ Gerenciar"))
+        self._sync("collections", rows)
+
+    def _update_categories(self) -> None:
+        self._update_ranked("categories", "category", SIDEBAR_MAX_CATEGORIES, "Nenhuma categoria")
+
+    def _update_tags(self) -> None:
+        self._update_ranked("tags", "tag", SIDEBAR_MAX_TAGS, "Nenhuma tag")
+
+    def _update_ranked(self, section: str, facet: str, limit: int, empty_text: str) -> None:
+        """Top-N por contagem (empate por nome) + "Ver mais" nas categorias."""
+        if self._unchanged(facet):
+            return
+        counts = self._facet_counts(facet)
+        totals = self._facet_totals(facet, counts)
+        ranked = sorted(counts.items(), key=lambda x: (-x[1], x[0]))
+        rows = [((facet, name), self._label(name, n, totals)) for name, n in ranked[:limit]]
+        if not rows:
+            rows = [(("empty",), empty_text)]
+        elif facet == "category" and len(ranked) > limit:
+            rows.append((("more",), f"+ Ver mais ({len(ranked) - limit})"))
+        self._sync(section, rows)
+
+    # ------------------------------------------------------------------
+    # Contagens
+    # ------------------------------------------------------------------
+
+    def _unchanged(self, facet: str) -> bool:
+        """O(1) com FacetCounter: mesma revisão e mesmo scope → nada a fazer."""
+        if self._facets is None:
+            return False
+        seen = (self._facets.revision(facet), self._scope_token)
+        if self._seen.get(facet) == seen:
+            return True
+        self._seen[facet] = seen
+        return False
+
+    def _facet_counts(self, facet: str) -> Dict[str, int]:
+        if self._facets is not None:
+            return self._facets.counts(facet, self._scope)
+        return self._count_database(facet, self._scope)
+
+    def _facet_totals(self, facet: str, counts: Dict[str, int]) -> Optional[Dict[str, int]]:
+        """Contagens no banco inteiro (só quando exibindo "dentro do filtro")."""
+        if self._scope is None:
+            return None
+        if self._facets is not None:
+            return self._facets.counts(facet)
+        return self._count_database(facet)
+
+    def _count_database(self, facet: str, scope=None) -> Dict[str, int]:
+        """Fallback sem FacetCounter: varre o banco (ou só o scope)."""
+        pos = FACETS.index(facet)
+        database = self._database
+        paths = database.keys() if scope is None else (p for p in scope if p in database)
+        counts: Dict[str, int] = {}
+        for path in paths:
+            value = project_facets(database[path])[pos]
+            for v in ((value,) if pos == 0 else value):
+                counts[v] = counts.get(v, 0) + 1
+        return counts
+
+    @staticmethod
+    def _label(name: str, count: int, totals: Optional[Dict[str, int]]) -> str:
+        if totals is None:
+            return f"{name} ({count})"
+        return f"{name} ({count}/{totals.get(name, count)})"
+
+    # ------------------------------------------------------------------
+    # Atualização incremental das seções
+    # ------------------------------------------------------------------
+
+    def _sync(self, section: str, rows: List[Tuple[tuple, str]]) -> None:
+        """Mesmas chaves → só troca textos alterados; senão recria a seção."""
+        shown = self._rows.get(section)
+        if shown is not None and [k for k, _ in shown] == [k for k, _ in rows]:
+            widgets = self._widgets[section]
+            for (key, text), (_, old_text) in zip(rows, shown):
+                if text != old_text:
+                    widgets[key].config(text=text)
+            self._rows[section] = rows
+            return
+
+        frame = self._frames[section]
+        for w in frame.winfo_children():
+            w.destroy()
+        self._widgets[section] = {key: self._build_row(frame, key, text) for key, text in rows}
+        self._rows[section] = rows
+        if self._bind_scroll:
+            self._bind_scroll(frame)
+
+    def _build_row(self, frame: tk.Frame, key: tuple, text: str) -> tk.Widget:
+        kind = key[0]
+        if kind == "empty":
+            w = tk.Label(frame, text=text, bg=BG_SECONDARY, fg=FG_TERTIARY,
+                         font=("Arial", 10, "italic"), anchor="w", padx=15, pady=10)
+            w.pack(fill="x")
+            return w
+        if kind in ("more", "manage"):
+            command = self._cb["on_more_categories"] if kind == "more" else self._cb["on_manage_collections"]
+            w = tk.Button(frame, text=text, bg=BG_CARD, fg="#888888", font=("Arial", 9),
+                          relief="flat", cursor="hand2", anchor="w", padx=15, pady=6,
+                          command=command)
+            w.pack(fill="x", pady=(4, 2))
+            return w
+
+        value = key[1]
+        if kind == "origin":
+            fg, font, pady = ORIGIN_COLORS.get(value, ORIGIN_COLORS["default"]), ("Arial", 10, "bold"), 8
+            on_click = lambda b: self._cb["on_origin"](value, b)
+        elif kind == "collection":
+            fg, font, pady = "#88CCFF", ("Arial", 10), 8
+            on_click = lambda b: self._cb["on_collection"](value, b)
+        elif kind == "category":
+            fg, font, pady = "#CCCCCC", ("Arial", 10), 8
+            on_click = lambda b: self._cb["on_category"]([value], b)
+        else:  # tag
+            fg, font, pady = "#CCCCCC", ("Arial", 10), 6
+            on_click = lambda b: self._cb["on_tag"](value, b)
+        btn = tk.Button(frame, text=text, bg=BG_SECONDARY, fg=fg, font=font,
+                        relief="flat", cursor="hand2", anchor="w", padx=15, pady=pady)
+        btn.config(command=lambda: on_click(btn))
+        btn.pack(fill="x", pady=1 if kind == "tag" else 2)
+        btn.bind("<Enter>",  lambda e: btn.config(bg=BG_CARD)     if btn is not self._active_btn() else None)
+        btn.bind("<Leave>", lambda e: btn.config(bg=BG_SECONDARY) if btn is not self._active_btn() else None)
+        return btn
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Batcher de thumbnails na thread principal.
+
+Os workers do ThumbnailPreloader só decodificam (PIL.Image). Este batcher
+drena a fila de resultados a cada frame (THUMBNAIL_FRAME_MS), cria as
+PhotoImages em lote dentro de THUMBNAIL_FRAME_BUDGET_MS e aplica nos cards.
+Substitui um root.after(0, ...) por imagem: com centenas de thumbs
+pendentes o event loop continua livre para rolagem e cliques.
+
+Com `scheduler` (UIScheduler), a drenagem vira uma tarefa coalescida do
+agendador e divide o orçamento do frame com progresso/análise.
+
+Pedido com widget: <Destroy> cancela a assinatura (e o job, se ninguém
+mais espera a mesma capa). Cards reciclados (ProjectCard) não são
+destruídos: liberam a assinatura via release() ao trocar de projeto.
+"""
+import tkinter as tk
+
+from config.settings import THUMBNAIL_FRAME_MS, THUMBNAIL_FRAME_BUDGET_MS
+from ui.managers.ui_scheduler import PRIORITY_NORMAL
+from utils.logging_setup import LOGGER
+
+
+class ThumbnailBatcher:
+    def __init__(self, root, preloader,
+                 frame_ms: int = THUMBNAIL_FRAME_MS,
+                 budget_ms: int = THUMBNAIL_FRAME_BUDGET_MS,
+                 scheduler=None):
+        self.root = root
+        self.preloader = preloader
+        self.scheduler = scheduler
+        self.frame_ms = frame_ms
+        self.budget_s = budget_ms / 1000.0
+        self.logger = LOGGER
+        self._after_id = None
+
+    def request(self, project_path: str, callback, widget=None):
+        """
+        Pede a thumb de project_path; callback(path, photo) roda na thread
+        principal e é descartado se o widget já foi destruído.
+        
+        Returns:
+            Assinatura (para release()) ou None se entregue do cache
+        """
+        def _apply(path, photo):
+            try:
+                if widget is None or widget.winfo_exists():
+                    callback(path, photo)
+            except tk.TclError as e:
+                self.logger.debug(f"Widget destruído: {e}")
+
+        sub = self.preloader.subscribe(project_path, _apply)
+        if sub is None:
+            return None
+        if widget is not None:
+            widget.bind("<Destroy>", lambda _e: self.preloader.unsubscribe(sub), add="+")
+        self._schedule()
+        return sub
+
+    def release(self, sub) -> None:
+        """Card reciclado para outro projeto: desiste do pedido anterior."""
+        self.preloader.unsubscribe(sub)
+
+    def wake(self) -> None:
+        """Garante a drenagem enquanto houver jobs (ex.: prefetch sem callback)."""
+        if self.preloader.has_pending():
+            self._schedule()
+
+    def cancel_pending(self) -> None:
+        """Descarta pedidos ainda não entregues (troca de página/filtro)."""
+        self.preloader.cancel_pending()
+
+    def stop(self) -> None:
+        """Para a drenagem periódica (fechamento da janela)."""
+        if self.scheduler:
+            self.scheduler.cancel("thumbnails")
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _schedule(self) -> None:
+        if self.scheduler:
+            self.scheduler.post(self._pump, priority=PRIORITY_NORMAL, key="thumbnails")
+        elif self._after_id is None:
+            self._after_id = self.root.after(self.frame_ms, self._pump)
+
+    def _pump(self) -> None:
+        self._after_id = None
+        budget = self.budget_s
+        if self.scheduler:
+            budget = min(budget, self.scheduler.remaining_s())
+        self.preloader.drain(budget)
+        if self.preloader.has_pending():
+            self._schedule()
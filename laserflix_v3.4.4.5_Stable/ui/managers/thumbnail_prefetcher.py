@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Prefetch preditivo de thumbnails em tempo ocioso.
+
+Depois de montar a página, aquece o cache LRU com as capas da próxima e
+da página anterior do resultado filtrado+ordenado (e dos vizinhos ◄ ► do
+modal), com PRIORITY_PREFETCH — cards visíveis sempre passam na frente.
+
+ORÇAMENTO:
+    - Só envia pedidos após THUMBNAIL_PREFETCH_IDLE_MS sem interação
+      (roda do mouse, cliques, teclas); interação adia a próxima rodada
+    - THUMBNAIL_PREFETCH_SLICE pedidos por rodada, e só enquanto a fila
+      do preloader tiver menos de THUMBNAIL_PREFETCH_MAX_QUEUED jobs
+    - A thread principal só enfileira: capa resolvida (stat/listdir da
+      pasta) e decodificada no worker do preloader
+"""
+import time
+import tkinter as tk
+
+from config.settings import (
+    THUMBNAIL_PREFETCH_ENABLED, THUMBNAIL_PREFETCH_IDLE_MS,
+    THUMBNAIL_PREFETCH_SLICE, THUMBNAIL_PREFETCH_MAX_QUEUED,
+)
+from core.thumbnail_preloader import PRIORITY_PREFETCH
+from utils.logging_setup import LOGGER
+
+_INTERACTION_EVENTS = ("<MouseWheel>", "<Button-4>", "<Button-5>", "<ButtonPress>", "<KeyPress>")
+
+
+class ThumbnailPrefetcher:
+    def __init__(self, root, preloader, batcher,
+                 idle_ms: int = THUMBNAIL_PREFETCH_IDLE_MS,
+                 slice_size: int = THUMBNAIL_PREFETCH_SLICE,
+                 max_queued: int = THUMBNAIL_PREFETCH_MAX_QUEUED,
+                 enabled: bool = THUMBNAIL_PREFETCH_ENABLED):
+        self.root = root
+        self.preloader = preloader
+        self.batcher = batcher
+        self.idle_ms = idle_ms
+        self.slice_size = slice_size
+        self.max_queued = max_queued
+        self.enabled = enabled
+        self.logger = LOGGER
+        self._targets = []
+        self._after_id = None
+        self._last_interaction = 0.0
+
+    def watch_interaction(self) -> None:
+        """Registra eventos globais de interação (adiam o prefetch)."""
+        for seq in _INTERACTION_EVENTS:
+            self.root.bind_all(seq, self._on_interaction, add="+")
+
+    def prefetch_pages(self, sorted_paths, start_idx: int, end_idx: int) -> None:
+        """Próxima página (primeiro) e página anterior (mais próximos antes)."""
+        n = max(1, end_idx - start_idx)
+        nxt = sorted_paths[end_idx:end_idx + n]
+        prev = sorted_paths[max(0, start_idx - n):start_idx][::-1]
+        self.schedule(list(nxt) + list(prev))
+
+    def schedule(self, paths) -> None:
+        """Substitui os alvos pendentes e agenda a próxima rodada ociosa."""
+        if not self.enabled:
+            return
+        self._targets = list(dict.fromkeys(paths))[::-1]  # pop() do fim = ordem original
+        self._restart(self.idle_ms)
+
+    def add_neighbors(self, paths) -> None:
+        """Acrescenta alvos sem descartar os atuais (vizinhos do modal, vão primeiro)."""
+        if not self.enabled:
+            return
+        for path in paths:
+            if path:
+                self._targets.append(path)
+        self._restart(self.idle_ms)
+
+    def cancel(self) -> None:
+        self._targets = []
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+    def _on_interaction(self, _event=None) -> None:
+        self._last_interaction = time.monotonic()
+
+    def _restart(self, delay_ms: int) -> None:
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._after_id = self.root.after(delay_ms, self._tick) if self._targets else None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        if not self._targets:
+            return
+
+        idle_for = (time.monotonic() - self._last_interaction) * 1000
+        if idle_for < self.idle_ms:
+            self._restart(int(self.idle_ms - idle_for) + 1)
+            return
+
+        room = self.max_queued - self.preloader.queued_count()
+        sent = 0
+        while self._targets and sent < min(self.slice_size, room):
+            path = self._targets.pop()
+            self.preloader.prefetch(path, PRIORITY_PREFETCH)  # capa resolvida no worker
+            sent += 1
+        if sent:
+            self.batcher.wake()
+        self._restart(self.batcher.frame_ms * 4)
@@ -12,8 +12,8 @@ class ToggleManager:
     def toggle_favorite(self, path: str, btn=None):
         if path in self.database:
             nv = not self.database[path].get("favorite", False)
-            self.database[path]["favorite"] = nv
-            self.db_manager.save_database()
+            self.db_manager.update_project(path, favorite=nv)
+            self.db_manager.commit()
             if self.on_invalidate_cache:
                 self.on_invalidate_cache()
             if btn:
@@ -22,8 +22,8 @@ class ToggleManager:
     def toggle_done(self, path: str, btn=None):
         if path in self.database:
             nv = not self.database[path].get("done", False)
-            self.database[path]["done"] = nv
-            self.db_manager.save_database()
+            self.db_manager.update_project(path, done=nv)
+            self.db_manager.commit()
             if self.on_invalidate_cache:
                 self.on_invalidate_cache()
             if btn:
@@ -32,10 +32,9 @@ class ToggleManager:
     def toggle_good(self, path: str, btn=None):
         if path in self.database:
             nv = not self.database[path].get("good", False)
-            self.database[path]["good"] = nv
-            if nv:
-                self.database[path]["bad"] = False
-            self.db_manager.save_database()
+            fields = {"good": nv, "bad": False} if nv else {"good": nv}
+            self.db_manager.update_project(path, **fields)
+            self.db_manager.commit()
             if self.on_invalidate_cache:
                 self.on_invalidate_cache()
             if btn:
@@ -44,10 +43,9 @@ class ToggleManager:
     def toggle_bad(self, path: str, btn=None):
         if path in self.database:
             nv = not self.database[path].get("bad", False)
-            self.database[path]["bad"] = nv
-            if nv:
-                self.database[path]["good"] = False
-            self.db_manager.save_database()
+            fields = {"bad": nv, "good": False} if nv else {"bad": nv}
+            self.db_manager.update_project(path, **fields)
+            self.db_manager.commit()
             if self.on_invalidate_cache:
                 self.on_invalidate_cache()
             if btn:
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Agendador de trabalho de UI na thread principal, com orçamento por frame.
+
+Threads (análise, importação) não tocam o Tk: chamam post(), que é
+thread-safe. A cada frame (UI_FRAME_MS) a thread principal executa as
+tarefas por prioridade até gastar UI_FRAME_BUDGET_MS; o resto fica para o
+próximo frame — rajadas de callbacks não travam rolagem nem cliques.
+
+COALESCÊNCIA: post(..., key="progress") substitui a tarefa pendente com a
+mesma chave (a barra de progresso só desenha o valor mais recente).
+
+PRIORIDADES:
+    PRIORITY_HIGH    → mostrar/esconder progresso, conclusão, erros
+    PRIORITY_NORMAL  → entrega de thumbnails, refresh do grid
+    PRIORITY_LOW     → progresso, status
+
+Sem trabalho pendente, a fila é verificada a cada UI_IDLE_POLL_MS
+(threads de trabalho não podem chamar root.after()).
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+import tkinter as tk
+
+from config.settings import UI_FRAME_MS, UI_FRAME_BUDGET_MS, UI_IDLE_POLL_MS
+from utils.logging_setup import LOGGER
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class UIScheduler:
+    def __init__(self, root,
+                 frame_ms: int = UI_FRAME_MS,
+                 budget_ms: int = UI_FRAME_BUDGET_MS,
+                 idle_ms: int = UI_IDLE_POLL_MS):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.budget_s = budget_ms / 1000.0
+        self.idle_ms = idle_ms
+        self.logger = LOGGER
+        self._lock = threading.Lock()
+        self._heap: List[tuple] = []               # (prioridade, seq, chave)
+        self._tasks: Dict[Hashable, tuple] = {}     # chave → (fn, args)
+        self._priority: Dict[Hashable, int] = {}    # chave → prioridade na fila
+        self._seq = itertools.count()
+        self._main_thread = threading.current_thread()
+        self._after_id = None
+        self._due = None       # instante do pump agendado (perf_counter)
+        self._deadline = 0.0
+        self._pumping = False
+        self._stopped = False
+
+    # ------------------------------------------------------------------
+    # API (qualquer thread)
+    # ------------------------------------------------------------------
+
+    def post(self, fn: Callable, *args, priority: int = PRIORITY_NORMAL,
+             key: Optional[Hashable] = None) -> None:
+        """
+        Agenda fn(*args) na thread principal.
+
+        Com `key`, substitui a tarefa pendente de mesma chave: roda só a
+        última, na posição da primeira (ou antes, se a prioridade subiu).
+        """
+        with self._lock:
+            seq = next(self._seq)
+            if key is None:
+                key = ("_", seq)
+            self._tasks[key] = (fn, args)
+            current = self._priority.get(key)
+            if current is None or priority < current:
+                self._priority[key] = priority
+                heapq.heappush(self._heap, (priority, seq, key))
+        if threading.current_thread() is self._main_thread and not self._pumping:
+            self._schedule(0)
+
+    def cancel(self, key: Hashable) -> None:
+        """Descarta a tarefa pendente com esta chave (se houver)."""
+        with self._lock:
+            if self._tasks.pop(key, None) is not None:
+                del self._priority[key]  # entrada do heap vira obsoleta
+
+    def wrap(self, fn: Optional[Callable], priority: int = PRIORITY_NORMAL,
+             key: Optional[Hashable] = None) -> Optional[Callable]:
+        """Versão de fn que posta a chamada em vez de executá-la."""
+        if fn is None:
+            return None
+        return lambda *args: self.post(fn, *args, priority=priority, key=key)
+
+    def remaining_s(self) -> float:
+        """Orçamento restante do frame atual (tarefas que trabalham em lote)."""
+        return max(0.0, self._deadline - time.perf_counter())
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._tasks)
+
+    # ------------------------------------------------------------------
+    # Ciclo (thread principal)
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        self._stopped = False
+        self._schedule(self.idle_ms)
+
+    def stop(self) -> None:
+        """Para o ciclo (fechamento da janela); tarefas pendentes são descartadas."""
+        self._stopped = True
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        with self._lock:
+            self._heap.clear()
+            self._tasks.clear()
+            self._priority.clear()
+
+    def _schedule(self, delay_ms: int) -> None:
+        if self._stopped:
+            return
+        due = time.perf_counter() + delay_ms / 1000.0
+        if self._after_id is not None:
+            if self._due <= due:
+                return  # já há um pump mais cedo
+            self.root.after_cancel(self._after_id)
+        self._due = due
+        self._after_id = self.root.after(delay_ms, self._pump)
+
+    def _pump(self) -> None:
+        self._after_id = None
+        self._deadline = time.perf_counter() + self.budget_s
+        with self._lock:
+            limit = next(self._seq)  # postado durante o frame → próximo frame
+        deferred = []
+        ran = 0
+        self._pumping = True
+        while ran == 0 or time.perf_counter() < self._deadline:
+            with self._lock:
+                if not self._heap:
+                    break
+                entry = heapq.heappop(self._heap)
+                priority, seq, key = entry
+                if seq > limit:
+                    deferred.append(entry)
+                    continue
+                if self._priority.get(key) != priority:
+                    continue  # entrada obsoleta (chave promovida ou cancelada)
+                del self._priority[key]
+                fn, args = self._tasks.pop(key)
+            ran += 1
+            try:
+                fn(*args)
+            except Exception as e:
+                self.logger.error(f"❌ Erro em tarefa de UI ({getattr(fn, '__name__', fn)}): {e}",
+                                  exc_info=True)
+        self._pumping = False
+        with self._lock:
+            for entry in deferred:
+                heapq.heappush(self._heap, entry)
+            busy = bool(self._tasks)
+        self._schedule(self.frame_ms if busy else self.idle_ms)
@@ -1,10 +1,16 @@
 """
-ui/project_card.py — Factory de card de projeto.
-Função pura. Teto: 200 linhas.
+ui/project_card.py — Card de projeto reciclável.
+
+ProjectCard cria a árvore de widgets UMA vez (com slots para o máximo de
+categorias/tags/coleções) e update(path, data) só troca textos, cores,
+visibilidade (grid/grid_remove) e o projeto alvo dos handlers — os binds
+leem self.path/self.cb, então nada é re-vinculado. Scroll e troca de
+página reaproveitam cards do pool em vez de destruir/criar ~15 widgets.
+build_card() continua como fábrica de uso único.
 
 HOT-06c: Callback assíncrono thread-safe:
-  - Passa widget (placeholder) para get_cover_image_async
-  - Valida se widget existe antes de atualizar
+  - get_cover_image_async devolve a assinatura; o card a libera ao
+    receber outro projeto (callback de capa antiga é ignorado)
   - Previne "main thread is not in main loop"
 
 F-05: Badge de status de análise (🤖 IA / ⚡ Fallback / ⏳ Pendente)
@@ -12,7 +18,7 @@ F-08: Menu contextual de coleções (botão direito) + Badges de coleções vis
 PERF-FIX-4: Bind único de menu contextual + redução de lambdas (~25% mais rápido)
 """
 import tkinter as tk
-from tkinter import Menu
+from typing import Optional
 
 from config.card_layout import CARD_W, CARD_H, COVER_H, CARD_PAD
 from config.ui_constants import (
@@ -24,12 +30,12 @@ from config.ui_constants import (
     ACCENT_RED, ACCENT_GREEN, ACCENT_GOLD,
     FG_PRIMARY, FG_TERTIARY,
     ORIGIN_COLORS, CATEGORY_COLORS,
-    CARD_BANNED_STRINGS,
 )
-
-# F-08: Constantes de coleções
-CARD_MAX_COLLECTIONS = 3  # Máximo de badges de coleções visíveis
-COLLECTION_COLOR = "#7B68EE"  # Roxo (MediumSlateBlue)
+from ui.card_helpers import (
+    CARD_MAX_COLLECTIONS, COLLECTION_COLOR,
+    analysis_badge_style, visible_categories, truncate,
+    create_context_menu_handler,
+)
 
 
 def _darken(hex_color: str) -> str:
@@ -38,98 +44,250 @@ def _darken(hex_color: str) -> str:
     return f"#{max(0,int(r*.8)):02x}{max(0,int(g*.8)):02x}{max(0,int(b*.8)):02x}"
 
 
-def _create_analysis_badge(parent: tk.Frame, data: dict) -> None:
-    """
-    F-05: Cria badge de status de análise no canto superior direito.
-    
-    - 🤖 IA (verde): analisado por modelo
-    - ⚡ Fallback (amarelo): análise de emergência
-    - ⏳ Pendente (cinza): não analisado
+class ProjectCard:
     """
-    analyzed = data.get("analyzed", False)
-    model = data.get("analyzed_model", "fallback")
-    
-    if not analyzed:
-        badge_text = "⏳"
-        badge_bg = "#4A4A4A"
-    elif model == "fallback":
-        badge_text = "⚡"
-        badge_bg = "#FFA500"
-    else:
-        badge_text = "🤖"
-        badge_bg = "#00AA00"
+    Card de projeto com widgets fixos, re-vinculável via update().
     
-    badge = tk.Label(
-        parent,
-        text=badge_text,
-        font=("Arial", 14),
-        bg=badge_bg,
-        fg="#FFFFFF",
-        padx=6,
-        pady=2,
-        relief="flat",
-    )
-    badge.place(relx=1.0, x=-4, y=4, anchor="ne")
-
-
-def _create_context_menu_handler(project_path: str, cb: dict):
+    Callbacks esperados em cb (F-08):
+        on_open_modal(path), on_toggle_*(path, btn), on_analyze_single(path)
+        on_open_folder(path), on_set_category([cat]), on_set_tag(tag)
+        on_set_origin(origin), on_set_collection(name), on_toggle_select(path)
+        on_add_to_collection / on_remove_from_collection / on_new_collection_with
+        get_collections() -> list[str], get_project_collections(path) -> list[str]
+        get_cover_image_async(path, callback, widget) -> assinatura | None
+        release_cover_image(assinatura)
     """
-    PERF-FIX-4: Retorna handler único de menu contextual.
-    Evita criar função inline para cada bind.
-    """
-    def _show_menu(event):
-        menu = Menu(event.widget, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
-                    activebackground="#4A4A6E", activeforeground="#FFFFFF",
-                    font=("Arial", 10))
-        
-        all_collections = cb.get("get_collections", lambda: [])() or []
-        project_collections = cb.get("get_project_collections", lambda p: [])(project_path) or []
-        
-        if all_collections:
-            add_menu = Menu(menu, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
-                            activebackground="#4A4A6E", activeforeground="#FFFFFF",
-                            font=("Arial", 9))
-            
-            for col_name in sorted(all_collections):
-                is_in = col_name in project_collections
-                label = f"✓ {col_name}" if is_in else f"  {col_name}"
-                state = "disabled" if is_in else "normal"
-                
-                add_menu.add_command(
-                    label=label,
-                    command=lambda c=col_name: cb["on_add_to_collection"](project_path, c),
-                    state=state
-                )
-            
-            menu.add_cascade(label="➕ Adicionar à coleção", menu=add_menu)
+
+    def __init__(self, parent: tk.Widget, cb: dict):
+        self.cb = cb
+        self.path: Optional[str] = None
+        self.data: dict = {}
+        self._cover_path: Optional[str] = None
+        self._cover_sub = None
+        self._cats: list = []
+        self._tags: list = []
+        self._cols: list = []
+
+        self.frame = card = tk.Frame(parent, bg=BG_CARD, width=CARD_W, height=CARD_H)
+        card.grid_propagate(False)
+        card.pack_propagate(False)
+        card.bind("<Button-3>", self._show_menu)  # PERF-FIX-4: menu contextual ÚNICO
+
+        self.inner = inner = tk.Frame(card, bg=BG_CARD)
+        inner.pack(fill="both", expand=True)
+
+        self.chk_var = tk.BooleanVar(value=False)
+        self.chk = tk.Checkbutton(inner, variable=self.chk_var, bg=BG_CARD,
+                                  activebackground=BG_CARD, cursor="hand2",
+                                  command=lambda: self.cb["on_toggle_select"](self.path))
+
+        # Capa + placeholder instantâneo + badge F-05
+        cover_frm = tk.Frame(inner, bg=BG_SECONDARY, width=CARD_W, height=COVER_H)
+        cover_frm.pack(fill="x")
+        cover_frm.pack_propagate(False)
+        cover_frm.bind("<Button-1>", self._open_modal)
+        self.cover = tk.Label(cover_frm, text="📁", font=("Arial", 52),
+                              bg=BG_SECONDARY, fg=FG_TERTIARY, cursor="hand2")
+        self.cover.pack(expand=True)
+        self.cover.bind("<Button-1>", self._open_modal)
+        self.badge = tk.Label(cover_frm, font=("Arial", 14), fg="#FFFFFF",
+                              padx=6, pady=2, relief="flat")
+        self.badge.place(relx=1.0, x=-4, y=4, anchor="ne")
+
+        info = tk.Frame(inner, bg=BG_CARD)
+        info.pack(fill="both", expand=True, padx=8, pady=6)
+        info.columnconfigure(0, weight=1)
+
+        self.name_lbl = tk.Label(info, font=("Arial", 10, "bold"), bg=BG_CARD, fg=FG_PRIMARY,
+                                 wraplength=CARD_W - 20, justify="left", cursor="hand2")
+        self.name_lbl.grid(row=0, column=0, sticky="w")
+        self.name_lbl.bind("<Button-1>", self._open_modal)
+
+        # Slots fixos: índice do slot define cor e handler (lê a lista atual)
+        self.cat_frame, self.cat_btns = self._slot_row(info, 1, (4, 0), CARD_MAX_CATEGORIES)
+        for i, b in enumerate(self.cat_btns):
+            clr = CATEGORY_COLORS[i]
+            b.config(bg=clr, fg="#000000", font=("Arial", 7, "bold"), pady=2,
+                     command=lambda i=i: self.cb["on_set_category"]([self._cats[i]]))
+            b.bind("<Enter>", lambda e, btn=b, dc=_darken(clr): btn.config(bg=dc))
+            b.bind("<Leave>", lambda e, btn=b, lc=clr: btn.config(bg=lc))
+
+        self.tag_frame, self.tag_btns = self._slot_row(info, 2, (3, 0), CARD_MAX_TAGS)
+        for i, b in enumerate(self.tag_btns):
+            b.config(bg="#3A3A3A", fg=FG_PRIMARY, font=("Arial", 7), pady=1,
+                     command=lambda i=i: self.cb["on_set_tag"](self._tags[i]))
+            b.bind("<Enter>", lambda e, w=b: w.config(bg=ACCENT_RED))
+            b.bind("<Leave>", lambda e, w=b: w.config(bg="#3A3A3A"))
+
+        self.origin_btn = tk.Button(info, font=("Arial", 7), fg=FG_PRIMARY, padx=4, pady=2,
+                                    relief="flat", cursor="hand2",
+                                    command=lambda: self.cb["on_set_origin"](self._origin))
+        self.origin_btn.grid(row=3, column=0, sticky="w", pady=(4, 0))
+
+        self.col_frame, self.col_btns = self._slot_row(info, 4, (3, 0), CARD_MAX_COLLECTIONS)
+        dark_col = _darken(COLLECTION_COLOR)  # PERF-FIX-4: Pre-compute
+        for i, b in enumerate(self.col_btns):
+            b.config(bg=COLLECTION_COLOR, fg="#FFFFFF", font=("Arial", 7, "bold"), pady=2,
+                     command=lambda i=i: self.cb.get("on_set_collection", lambda x: None)(self._cols[i]))
+            b.bind("<Enter>", lambda e, bt=b: bt.config(bg=dark_col))
+            b.bind("<Leave>", lambda e, bt=b: bt.config(bg=COLLECTION_COLOR))
+        self.col_more = tk.Label(self.col_frame, bg=BG_CARD, fg="#888888", font=("Arial", 7), padx=4)
+
+        # Ações (ocultas no modo seleção)
+        self.actions = af = tk.Frame(info, bg=BG_CARD)
+        af.grid(row=5, column=0, sticky="ew", pady=(6, 0))
+
+        def _action(text, fg, command):
+            btn = tk.Button(af, text=text, font=("Arial", 12), bg=BG_CARD, fg=fg,
+                            relief="flat", cursor="hand2")
+            btn.config(command=lambda: command(btn))
+            btn.pack(side="left", padx=1)
+            return btn
+
+        _action("📂", ACCENT_GOLD, lambda b: self.cb["on_open_folder"](self.path))
+        self.btn_fav = _action("☆", FG_TERTIARY, lambda b: self.cb["on_toggle_favorite"](self.path, b))
+        self.btn_done = _action("○", FG_TERTIARY, lambda b: self.cb["on_toggle_done"](self.path, b))
+        self.btn_good = _action("👍", FG_TERTIARY, lambda b: self.cb["on_toggle_good"](self.path, b))
+        self.btn_bad = _action("👎", FG_TERTIARY, lambda b: self.cb["on_toggle_bad"](self.path, b))
+        self.btn_analyze = _action("🤖", ACCENT_GREEN, lambda b: self.cb["on_analyze_single"](self.path))
+        self._origin = ""
+
+    @staticmethod
+    def _slot_row(info: tk.Frame, row: int, pady, count: int):
+        frame = tk.Frame(info, bg=BG_CARD)
+        frame.grid(row=row, column=0, sticky="ew", pady=pady)
+        btns = [tk.Button(frame, relief="flat", cursor="hand2", padx=4) for _ in range(count)]
+        return frame, btns
+
+    @staticmethod
+    def _fill_slots(frame: tk.Frame, btns: list, texts: list) -> None:
+        """Mostra os primeiros len(texts) slots (grid/grid_remove mantém a ordem)."""
+        for i, b in enumerate(btns):
+            if i < len(texts):
+                b.config(text=texts[i])
+                b.grid(row=0, column=i, padx=2, pady=1)
+            else:
+                b.grid_remove()
+        if texts:
+            frame.grid()
+        else:
+            frame.grid_remove()
+
+    # ------------------------------------------------------------------
+    # Rebind
+    # ------------------------------------------------------------------
+
+    def update(self, project_path: str, data: dict, cb: Optional[dict] = None) -> None:
+        """Re-vincula o card a outro projeto (ou ao mesmo com dados novos)."""
+        if cb is not None:
+            self.cb = cb
+        cb = self.cb
+        self.path, self.data = project_path, data
+
+        # Seleção: borda amarela + checkbox
+        selection_mode = cb.get("selection_mode", False)
+        is_selected = project_path in cb.get("selected_paths", set())
+        border = "#FFFF00" if is_selected else BG_CARD
+        self.frame.config(bg=border, highlightbackground=border,
+                          highlightthickness=2 if is_selected else 0)
+        pad = 2 if is_selected else 0
+        self.inner.pack_configure(padx=pad, pady=pad)
+        self.chk_var.set(is_selected)
+        if selection_mode:
+            self.chk.place(x=4, y=4)
+            self.chk.lift()
+        else:
+            self.chk.place_forget()
+
+        text, bg = analysis_badge_style(data)
+        self.badge.config(text=text, bg=bg)
+        self.name_lbl.config(text=truncate(data.get("name", "Sem nome"),
+                                            CARD_NAME_MAX_LENGTH, CARD_NAME_TRUNCATE_AT))
+
+        self._cats = visible_categories(data)[:CARD_MAX_CATEGORIES]
+        self._fill_slots(self.cat_frame, self.cat_btns,
+                         [c[:CARD_CATEGORY_MAX_LENGTH] for c in self._cats])
+        self._tags = (data.get("tags", []) or [])[:CARD_MAX_TAGS]
+        self._fill_slots(self.tag_frame, self.tag_btns,
+                         [truncate(t, CARD_TAG_MAX_LENGTH, CARD_TAG_TRUNCATE_AT) for t in self._tags])
+
+        self._origin = data.get("origin", "Desconhecido")
+        self.origin_btn.config(text=self._origin,
+                               bg=ORIGIN_COLORS.get(self._origin, ORIGIN_COLORS["default"]))
+
+        get_project_collections = cb.get("get_project_collections")
+        all_cols = (get_project_collections(project_path) if get_project_collections else None) or []
+        self._cols = all_cols[:CARD_MAX_COLLECTIONS]
+        self._fill_slots(self.col_frame, self.col_btns,
+                         [truncate(c, 15, 12) for c in self._cols])
+        if len(all_cols) > CARD_MAX_COLLECTIONS:
+            self.col_more.config(text=f"+{len(all_cols) - CARD_MAX_COLLECTIONS}")
+            self.col_more.grid(row=0, column=CARD_MAX_COLLECTIONS)
         else:
-            menu.add_command(label="📁 Nenhuma coleção disponível", state="disabled")
-        
-        if project_collections:
-            remove_menu = Menu(menu, tearoff=0, bg="#2E2E4E", fg="#FFFFFF",
-                               activebackground="#4A4A6E", activeforeground="#FFFFFF",
-                               font=("Arial", 9))
-            
-            for col_name in sorted(project_collections):
-                remove_menu.add_command(
-                    label=col_name,
-                    command=lambda c=col_name: cb["on_remove_from_collection"](project_path, c)
-                )
-            
-            menu.add_cascade(label="➖ Remover de coleção", menu=remove_menu)
-        
-        menu.add_separator()
-        menu.add_command(
-            label="🆕 Nova coleção com este projeto",
-            command=lambda: cb["on_new_collection_with"](project_path)
-        )
-        
+            self.col_more.grid_remove()
+
+        if selection_mode:
+            self.actions.grid_remove()
+        else:
+            self.actions.grid()
+            self._set_flag(self.btn_fav, "favorite", "⭐", "☆", ACCENT_GOLD)
+            self._set_flag(self.btn_done, "done", "✓", "○", "#00FF00")
+            self._set_flag(self.btn_good, "good", "👍", "👍", "#00FF00")
+            self._set_flag(self.btn_bad, "bad", "👎", "👎", "#FF0000")
+            if data.get("analyzed"):
+                self.btn_analyze.pack_forget()
+            else:
+                self.btn_analyze.pack(side="left", padx=1)
+
+        self._request_cover(project_path)
+
+    def _set_flag(self, btn, key, on_text, off_text, on_fg) -> None:
+        value = self.data.get(key)
+        btn.config(text=on_text if value else off_text, fg=on_fg if value else FG_TERTIARY)
+
+    def _request_cover(self, project_path: str) -> None:
+        if project_path == self._cover_path and self._cover_sub is None:
+            return  # mesma capa já exibida
+        self.release()
+        self._cover_path = project_path
+        self.cover.config(image="", text="📁")
+        self.cover.image = None
+        get_cover_async = self.cb.get("get_cover_image_async")
+        if get_cover_async:
+            self._cover_sub = get_cover_async(project_path, self._on_thumb_loaded, None)
+
+    def _on_thumb_loaded(self, path, photo) -> None:
+        if path != self._cover_path:
+            return  # card já reciclado para outro projeto
+        self._cover_sub = None
         try:
-            menu.tk_popup(event.x_root, event.y_root)
-        finally:
-            menu.grab_release()
-    
-    return _show_menu
+            self.cover.config(image=photo, text="")
+            self.cover.image = photo
+        except tk.TclError:
+            pass
+
+    def release(self) -> None:
+        """Cancela o pedido de capa pendente (card reciclado/oculto)."""
+        if self._cover_sub is not None:
+            release = self.cb.get("release_cover_image")
+            if release:
+                release(self._cover_sub)
+            self._cover_sub = None
+        self._cover_path = None
+
+    def destroy(self) -> None:
+        self.release()
+        self.frame.destroy()
+
+    # ------------------------------------------------------------------
+    # Handlers (leem o projeto atual)
+    # ------------------------------------------------------------------
+
+    def _open_modal(self, _event=None) -> None:
+        self.cb["on_open_modal"](self.path)
+
+    def _show_menu(self, event) -> None:
+        create_context_menu_handler(self.path, self.cb)(event)
 
 
 def build_card(
@@ -137,235 +295,20 @@ def build_card(
     project_path: str,
     data: dict,
     cb: dict,
-    row: int,
-    col: int,
+    row: Optional[int],
+    col: Optional[int],
     pad: int = CARD_PAD,
 ) -> tk.Frame:
     """
-    Constrói um card de projeto.
+    Constrói um card de projeto de uso único (ver ProjectCard para reciclagem).
     
-    PERF-FIX-4: Otimizado para reduzir lambdas e binds duplicados.
-    
-    Callbacks esperados (F-08):
-        on_add_to_collection(path, collection_name)
-        on_remove_from_collection(path, collection_name)
-        on_new_collection_with(path)
-        get_collections() -> list[str]
-        get_project_collections(path) -> list[str]
-        on_set_collection(collection_name) -> filtrar por coleção
+    row/col = None: card não é posicionado.
     
     Returns:
-        tk.Frame: Widget do card criado (para virtual scroll)
+        tk.Frame: Widget do card criado
     """
-    selection_mode  = cb.get("selection_mode", False)
-    selected_paths  = cb.get("selected_paths", set())
-    is_selected     = project_path in selected_paths
-
-    # Card externo — altura fixa 410px
-    border_color = "#FFFF00" if is_selected else BG_CARD
-    card = tk.Frame(parent, bg=border_color, width=CARD_W, height=CARD_H,
-                    highlightbackground=border_color, highlightthickness=2 if is_selected else 0)
-    card.grid(row=row, column=col, padx=pad, pady=pad, sticky="n")
-    card.grid_propagate(False)
-
-    # Inner — conteúdo do card
-    inner = tk.Frame(card, bg=BG_CARD)
-    inner.pack(fill="both", expand=True, padx=2 if is_selected else 0, pady=2 if is_selected else 0)
-
-    # PERF-FIX-4: Menu contextual ÚNICO no card (propaga para todos filhos)
-    context_menu_handler = _create_context_menu_handler(project_path, cb)
-    card.bind("<Button-3>", context_menu_handler)
-
-    # Checkbox de seleção
-    if selection_mode:
-        chk_var = tk.BooleanVar(value=is_selected)
-        chk = tk.Checkbutton(
-            inner, variable=chk_var, bg=BG_CARD,
-            activebackground=BG_CARD, cursor="hand2",
-            command=lambda: cb["on_toggle_select"](project_path),
-        )
-        chk.place(x=4, y=4)
-
-    # PERF-FIX-4: Click handler compartilhado
-    def _open_modal(e=None):
-        cb["on_open_modal"](project_path)
-
-    # Capa
-    cover_frm = tk.Frame(inner, bg=BG_SECONDARY, width=CARD_W, height=COVER_H)
-    cover_frm.pack(fill="x")
-    cover_frm.pack_propagate(False)
-    cover_frm.bind("<Button-1>", _open_modal)
-
-    # Placeholder instantâneo
-    placeholder = tk.Label(cover_frm, text="📁", font=("Arial", 52),
-                           bg=BG_SECONDARY, fg=FG_TERTIARY, cursor="hand2")
-    placeholder.pack(expand=True)
-    placeholder.bind("<Button-1>", _open_modal)
-    
-    # F-05: Badge de status de análise
-    _create_analysis_badge(cover_frm, data)
-    
-    # Callback para thumbnail
-    def _on_thumb_loaded(path, photo):
-        try:
-            placeholder.config(image=photo, text="")
-            placeholder.image = photo
-        except tk.TclError:
-            pass
-    
-    # Agenda carregamento assíncrono
-    get_cover_async = cb.get("get_cover_image_async")
-    if get_cover_async:
-        get_cover_async(project_path, _on_thumb_loaded, placeholder)
-
-    # Info
-    info = tk.Frame(inner, bg=BG_CARD)
-    info.pack(fill="both", expand=True, padx=8, pady=6)
-
-    # Nome
-    name = data.get("name", "Sem nome")
-    nm = (name[:CARD_NAME_TRUNCATE_AT] + "...") if len(name) > CARD_NAME_MAX_LENGTH else name
-    nl = tk.Label(info, text=nm, font=("Arial", 10, "bold"),
-                  bg=BG_CARD, fg=FG_PRIMARY,
-                  wraplength=CARD_W - 20, justify="left", cursor="hand2")
-    nl.pack(anchor="w")
-    nl.bind("<Button-1>", _open_modal)
-
-    # Categorias
-    raw_cats = data.get("categories", []) or []
-    cats = [c for c in raw_cats if c and c.strip() and c.strip().lower() not in CARD_BANNED_STRINGS]
-    if cats:
-        cf = tk.Frame(info, bg=BG_CARD)
-        cf.pack(anchor="w", pady=(4, 0), fill="x")
-        for i, cat in enumerate(cats[:CARD_MAX_CATEGORIES]):
-            clr = CATEGORY_COLORS[i]
-            dark_clr = _darken(clr)
-            
-            b = tk.Button(cf, text=cat[:CARD_CATEGORY_MAX_LENGTH],
-                          command=lambda cc=cat: cb["on_set_category"]([cc]),
-                          bg=clr, fg="#000000", font=("Arial", 7, "bold"),
-                          relief="flat", cursor="hand2", padx=4, pady=2)
-            b.pack(side="left", padx=2, pady=1)
-            
-            # PERF-FIX-4: Closure eficiente (pre-computed dark color)
-            b.bind("<Enter>", lambda e, btn=b, dc=dark_clr: btn.config(bg=dc))
-            b.bind("<Leave>", lambda e, btn=b, lc=clr: btn.config(bg=lc))
-
-    # Tags
-    tags = data.get("tags", [])
-    if tags:
-        tf = tk.Frame(info, bg=BG_CARD)
-        tf.pack(anchor="w", pady=(3, 0), fill="x")
-        for tag in tags[:CARD_MAX_TAGS]:
-            disp = (tag[:CARD_TAG_TRUNCATE_AT] + "...") if len(tag) > CARD_TAG_MAX_LENGTH else tag
-            b = tk.Button(tf, text=disp, command=lambda t=tag: cb["on_set_tag"](t),
-                          bg="#3A3A3A", fg=FG_PRIMARY, font=("Arial", 7),
-                          relief="flat", cursor="hand2", padx=4, pady=1)
-            b.pack(side="left", padx=2, pady=1)
-            # PERF-FIX-4: Constantes inline
-            b.bind("<Enter>", lambda e, w=b: w.config(bg=ACCENT_RED))
-            b.bind("<Leave>", lambda e, w=b: w.config(bg="#3A3A3A"))
-
-    # Origem
-    origin = data.get("origin", "Desconhecido")
-    origin_clr = ORIGIN_COLORS.get(origin, ORIGIN_COLORS["default"])
-    tk.Button(info, text=origin, font=("Arial", 7),
-              bg=origin_clr, fg=FG_PRIMARY, padx=4, pady=2,
-              relief="flat", cursor="hand2",
-              command=lambda o=origin: cb["on_set_origin"](o)
-              ).pack(anchor="w", pady=(4, 0))
-
-    # F-08: Coleções (ABAIXO da origem) - SEM 📁
-    get_project_collections = cb.get("get_project_collections")
-    if get_project_collections:
-        project_collections = get_project_collections(project_path)
-        if project_collections:
-            collections_frame = tk.Frame(info, bg=BG_CARD)
-            collections_frame.pack(anchor="w", pady=(3, 0), fill="x")
-            
-            visible_cols = project_collections[:CARD_MAX_COLLECTIONS]
-            dark_col = _darken(COLLECTION_COLOR)  # PERF-FIX-4: Pre-compute
-            
-            for col_name in visible_cols:
-                display_name = (col_name[:12] + "...") if len(col_name) > 15 else col_name
-                
-                b = tk.Button(
-                    collections_frame,
-                    text=display_name,
-                    command=lambda c=col_name: cb.get("on_set_collection", lambda x: None)(c),
-                    bg=COLLECTION_COLOR,
-                    fg="#FFFFFF",
-                    font=("Arial", 7, "bold"),
-                    relief="flat",
-                    cursor="hand2",
-                    padx=4,
-                    pady=2
-                )
-                b.pack(side="left", padx=2, pady=1)
-                
-                # PERF-FIX-4: Usa dark_col pre-computed
-                b.bind("<Enter>", lambda e, bt=b, dc=dark_col: bt.config(bg=dc))
-                b.bind("<Leave>", lambda e, bt=b: bt.config(bg=COLLECTION_COLOR))
-            
-            if len(project_collections) > CARD_MAX_COLLECTIONS:
-                remaining = len(project_collections) - CARD_MAX_COLLECTIONS
-                tk.Label(
-                    collections_frame,
-                    text=f"+{remaining}",
-                    bg=BG_CARD,
-                    fg="#888888",
-                    font=("Arial", 7),
-                    padx=4
-                ).pack(side="left")
-
-    # Ações (ocultas no modo seleção)
-    if not selection_mode:
-        af = tk.Frame(info, bg=BG_CARD)
-        af.pack(fill="x", pady=(6, 0))
-        
-        # PERF-FIX-4: Botões sem lambda quando possível
-        tk.Button(af, text="📂", font=("Arial", 12),
-                  command=lambda: cb["on_open_folder"](project_path),
-                  bg=BG_CARD, fg=ACCENT_GOLD, relief="flat", cursor="hand2"
-                  ).pack(side="left", padx=1)
-        
-        # Favorito
-        btn_fav = tk.Button(af, font=("Arial", 12), bg=BG_CARD, relief="flat", cursor="hand2")
-        btn_fav.config(
-            text="⭐" if data.get("favorite") else "☆",
-            fg=ACCENT_GOLD if data.get("favorite") else FG_TERTIARY,
-            command=lambda b=btn_fav: cb["on_toggle_favorite"](project_path, b))
-        btn_fav.pack(side="left", padx=1)
-        
-        # Done
-        btn_done = tk.Button(af, font=("Arial", 12), bg=BG_CARD, relief="flat", cursor="hand2")
-        btn_done.config(
-            text="✓" if data.get("done") else "○",
-            fg="#00FF00" if data.get("done") else FG_TERTIARY,
-            command=lambda b=btn_done: cb["on_toggle_done"](project_path, b))
-        btn_done.pack(side="left", padx=1)
-        
-        # Good
-        btn_good = tk.Button(af, font=("Arial", 12), bg=BG_CARD, relief="flat", cursor="hand2")
-        btn_good.config(
-            text="👍",
-            fg="#00FF00" if data.get("good") else FG_TERTIARY,
-            command=lambda b=btn_good: cb["on_toggle_good"](project_path, b))
-        btn_good.pack(side="left", padx=1)
-        
-        # Bad
-        btn_bad = tk.Button(af, font=("Arial", 12), bg=BG_CARD, relief="flat", cursor="hand2")
-        btn_bad.config(
-            text="👎",
-            fg="#FF0000" if data.get("bad") else FG_TERTIARY,
-            command=lambda b=btn_bad: cb["on_toggle_bad"](project_path, b))
-        btn_bad.pack(side="left", padx=1)
-        
-        # Analyze (se não analisado)
-        if not data.get("analyzed"):
-            tk.Button(af, text="🤖", font=("Arial", 12),
-                      command=lambda: cb["on_analyze_single"](project_path),
-                      bg=BG_CARD, fg=ACCENT_GREEN, relief="flat", cursor="hand2"
-                      ).pack(side="left", padx=1)
-    
-    return card
+    card = ProjectCard(parent, cb)
+    card.update(project_path, data)
+    if row is not None:
+        card.frame.grid(row=row, column=col, padx=pad, pady=pad, sticky="n")
+    return card.frame
@@ -16,6 +16,8 @@ from config.ui_constants import (
     ORIGIN_COLORS,
     SCROLL_SPEED,
 )
+from config.settings import MODAL_RESAMPLE
+from ui.managers.modal_cover_renderer import ModalCoverRenderer
 from utils.platform_utils import open_file, open_folder
 
 
@@ -31,6 +33,7 @@ class ProjectModal:
         on_set_tag(tag)
         on_remove(path)             — remove projeto do banco (F-02)
         get_project_collections(path) — F-08: obtém coleções do projeto
+        on_prefetch_neighbors(paths)  — (opcional) aquece thumbs de ◄ ►
     """
 
     _BG       = "#0F0F0F"
@@ -46,14 +49,18 @@ class ProjectModal:
     _F_BODY   = ("Arial", 11)
     _F_SMALL  = ("Arial", 9)
 
-    def __init__(self, root, project_path, database, cb, cache, scanner):
+    def __init__(self, root, project_path, database, cb, cache, scanner, cover_images,
+                 structures=None):
         self._root     = root
         self._path     = project_path
         self._database = database
         self._cb       = cb
         self._cache    = cache
         self._scanner  = scanner
+        self._structures = structures  # StructureResolver (resumo cacheado no registro)
         self._modal    = None
+        self._neighbors = []
+        self._images   = cover_images  # CoverImageCache do main_window (encerrado no _on_close)
 
     def open(self) -> None:
         data      = self._database.get(self._path, {})
@@ -61,6 +68,10 @@ class ProjectModal:
         try:    nav_idx = all_paths.index(self._path)
         except: nav_idx = 0
         nav_tot = len(all_paths)
+        self._neighbors = [all_paths[i] for i in (nav_idx + 1, nav_idx - 1) if 0 <= i < nav_tot]
+        prefetch = self._cb.get("on_prefetch_neighbors")
+        if prefetch:
+            prefetch(self._neighbors)
 
         modal = tk.Toplevel(self._root)
         modal.title("Laserflix — Detalhes")
@@ -228,7 +239,8 @@ class ProjectModal:
 
         # Arquivos
         _sep(); _section("Arquivos")
-        struct = (data.get("structure")
+        struct = ((self._structures and self._structures.resolve(self._path))
+                  or data.get("structure")
                   or self._scanner.analyze_project_structure(self._path))
         fmt_row = tk.Frame(lp, bg=BG)
         fmt_row.pack(anchor="w", padx=P, pady=(0, 4))
@@ -353,9 +365,7 @@ class ProjectModal:
         def _toggle(ev=None):
             nv = not self._database.get(self._path, {}).get(key, False)
             if self._path in self._database:
-                if key == "good" and nv: self._database[self._path]["bad"]  = False
-                if key == "bad"  and nv: self._database[self._path]["good"] = False
-                self._cb["on_toggle"](self._path, key, nv)
+                self._cb["on_toggle"](self._path, key, nv)  # good/bad exclusivos lá
                 il.config(fg=active_fg if nv else FT)
                 tl.config(fg=FS if nv else FT)
 
@@ -385,26 +395,15 @@ class ProjectModal:
         cover_lbl = tk.Label(right_outer, bg="#0A0A0A", cursor="hand2", bd=0)
         cover_lbl.place(x=0, y=0, relwidth=1, relheight=1)
         cover_lbl.bind("<Button-1>", lambda e: open_file(cover_path))
-        _last_size = [0, 0]
-
-        def _redraw(event=None):
-            from PIL import Image, ImageTk
-            cw = right_outer.winfo_width()
-            ch = right_outer.winfo_height()
-            if cw < 10 or ch < 10 or [cw, ch] == _last_size:
-                return
-            _last_size[0], _last_size[1] = cw, ch
-            try:
-                img   = Image.open(cover_path).convert("RGB")
-                ratio = min(cw / img.width, ch / img.height)
-                new_w = max(1, int(img.width  * ratio))
-                new_h = max(1, int(img.height * ratio))
-                img   = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-                photo = ImageTk.PhotoImage(img)
-                cover_lbl.config(image=photo)
-                cover_lbl.image = photo
-            except Exception:
-                pass
-
-        right_outer.bind("<Configure>", lambda e: _redraw())
-        modal.after(80, _redraw)
+
+        # Decode/resize no worker (prévia + passada final); ◄ ► pré-gerados
+        renderer = ModalCoverRenderer(right_outer, cover_lbl, cover_path, self._images)
+        renderer.on_rendered = self._prefetch_neighbor_covers
+        renderer.schedule(80)
+
+    def _prefetch_neighbor_covers(self, box) -> None:
+        """Capas de ◄ ► já no tamanho atual: navegação sem esperar decode."""
+        neighbors, find_cover, images = self._neighbors, self._cache.find_first_image, self._images
+        if neighbors:
+            images.submit(lambda: images.prefetch(
+                [find_cover(p) for p in neighbors], box, MODAL_RESAMPLE))
@@ -2,7 +2,19 @@
 recursive_import_integration.py — Orquestra o fluxo completo de importação.
 Tkinter puro — sem customtkinter.
 
-FLUXO (todos os modos):
+FLUXO STREAMING (IMPORT_STREAMING = True):
+  1. ImportModeDialog  → usuário escolhe modo e pasta
+  2. ImportPipeline (core/import_pipeline.py) em thread:
+       scan → dedup → registros em lotes (I/O fora da thread principal)
+     - cada lote é gravado na thread principal (UIScheduler): add_project +
+       commit, aquecimento de thumbnails/estrutura, fila de análise — os
+       listeners do banco (índices, facetas) nunca concorrem com o render
+     - o grid é atualizado a cada lote (no máximo a cada IMPORT_UI_REFRESH_MS)
+     - ⏹ cancela no meio do scan; o que já foi inserido é mantido
+     - conflitos de nome (HOT-10) ficam retidos e vão ao diálogo no fim
+  3. AUTO-ANALYSIS     → pergunta no fim (apenas os recém-importados)
+
+FLUXO COM PREVIEW (IMPORT_STREAMING = False):
   1. ImportModeDialog  → usuário escolhe modo e pasta
   2. Scan              → escaneia produtos
   3. DuplicateDetector → detecta duplicatas por nome (CONTRA DATABASE EXISTENTE!)
@@ -16,74 +28,76 @@ Modos:
   'pure'    — recursivo, apenas folder.jpg
   'simple'  — 1 nível, qualquer subpasta direta (com dedup)
 
-HOT-10: FIX duplicatas entre métodos
-  - Agora compara produtos escaneados com database existente
-  - Evita duplicatas ao usar métodos diferentes na mesma pasta
-  - Hybrid → Pure → Simple na mesma pasta = SEM duplicatas!
-
-HOT-10b: FIX dialog duplicatas
-  - Adiciona normalized_name e name no formato esperado pelo dialog
-
-FEATURE: Análise automática SEQUENCIAL pós-importação
-  - Após importação bem-sucedida, pergunta se quer analisar
-  - Se sim, executa SEQUENCIALMENTE:
-    1. Categorias + Tags (analysis_manager)
-    2. Descrições (text_generator)
-  - Apenas para produtos recém-importados
-
-USO:
-    from ui.recursive_import_integration import RecursiveImportManager
-    manager = RecursiveImportManager(
-        parent, database, 
-        analysis_manager=analysis_manager,  # ← Necessário
-        text_generator=text_generator,      # ← Necessário
-        on_complete=callback
-    )
-    manager.start_import()
+HOT-10 / HOT-10b (duplicatas entre métodos): ver core/import_pipeline.py
+
+USO (main_window): RecursiveImportManager(parent, database, db_manager=...,
+    analysis_manager=..., text_generator=..., on_complete=...).start_import()
 """
 
 import os
-import threading
-from datetime import datetime
+import time
 from typing import List, Dict, Callable, Optional
 from tkinter import messagebox
+from config.settings import IMPORT_STREAMING, IMPORT_UI_REFRESH_MS, IMPORT_WARMUP_MAX
 from utils.logging_setup import LOGGER
 from utils.recursive_scanner import RecursiveScanner
 from utils.duplicate_detector import DuplicateDetector
+from core.import_pipeline import ImportPipeline
 from ui.import_mode_dialog import show_import_mode_dialog
 from ui.import_preview_dialog import ImportPreviewDialog
 from ui.duplicate_resolution_dialog import show_duplicate_resolution
+from ui.managers.import_analysis_manager import ImportAnalysisManager
+from ui.managers.ui_scheduler import PRIORITY_HIGH, PRIORITY_NORMAL
 
 
 class RecursiveImportManager:
     """
     Gerenciador unificado de importação — recursiva (hybrid/pure) e simples.
-    Todos os modos passam pelo mesmo pipeline de dedup + preview.
-    
-    HOT-10: Detecta duplicatas comparando com database existente!
-    FEATURE: Análise SEQUENCIAL pós-importação (categorias+tags → descrições)
+    Tk: diálogos, progresso e gravação dos lotes do ImportPipeline.
     """
 
     def __init__(
         self,
         parent,
         database,
+        db_manager=None,
         project_scanner=None,
         text_generator=None,
         analysis_manager=None,
         on_complete: Optional[Callable] = None,
+        scan_snapshot=None,
+        structure_resolver=None,
     ):
         self.parent          = parent
         self.database        = database
+        self.db_manager      = db_manager
         self.project_scanner = project_scanner
         self.text_generator  = text_generator
         self.analysis_manager = analysis_manager
+        self.structure_resolver = structure_resolver  # resumo de estrutura (aquecido no import)
         self.on_complete     = on_complete
         self.logger          = LOGGER
-        self.scanner         = RecursiveScanner()
+        self.scanner         = RecursiveScanner(snapshot=scan_snapshot)
         self.duplicate_detector = DuplicateDetector()
-        self.import_thread   = None
+        self.pipeline        = ImportPipeline(self.scanner, self.duplicate_detector)
+        self.pipeline.on_progress = self._on_progress
+        self.pipeline.on_batch = lambda batch: self._ui(self._insert_batch, batch)
         self.imported_paths  = []
+        self.post_import     = ImportAnalysisManager(
+            parent, analysis_manager, text_generator, database,
+            save=self._update_project, commit=self._commit, ui=self._ui)
+
+        # Agendador da thread principal (UIScheduler); sem ele, parent.after()
+        self.scheduler = None
+
+        # Callbacks de UI (conectados pelo main_window)
+        # *_progress: chamados da thread do pipeline (ProgressUIManager
+        # com scheduler é thread-safe)
+        self.on_show_progress: Optional[Callable] = None
+        self.on_hide_progress: Optional[Callable] = None
+        self.on_update_progress: Optional[Callable] = None
+        self.on_batch_imported: Optional[Callable] = None   # refresh do grid
+        self.on_warm_thumbnails: Optional[Callable] = None  # fn(paths)
 
     # ================================================================
     # MÉTODO PRINCIPAL
@@ -91,6 +105,11 @@ class RecursiveImportManager:
 
     def start_import(self):
         """Inicia o fluxo unificado de importação."""
+        if self.is_importing():
+            messagebox.showinfo("ℹ️ Importação",
+                                "Já existe uma importação em andamento.",
+                                parent=self.parent)
+            return
         self.logger.info("=== INICIANDO IMPORTAÇÃO ===")
         self.imported_paths = []  # Reset
 
@@ -102,8 +121,30 @@ class RecursiveImportManager:
         mode, base_path = result
         self.logger.info("Modo: %s | Pasta: %s", mode, base_path)
 
+        if IMPORT_STREAMING:
+            self._start_streaming(mode, base_path)
+        else:
+            self._start_preview_import(mode, base_path)
+
+    def is_importing(self) -> bool:
+        return self.pipeline.is_running()
+
+    def cancel(self) -> None:
+        """Cancela a importação em andamento — o que já foi inserido é mantido."""
+        if not self.is_importing():
+            return
+        self.logger.info("⏹ Cancelando importação...")
+        self.pipeline.cancel()
+
+    def _start_preview_import(self, mode: str, base_path: str):
+        """Fluxo antigo: scan completo → duplicatas → preview → importação."""
         # 2 ─ Scan (os três modos)
-        all_products = self._scan_products(base_path, mode)
+        try:
+            all_products = self.pipeline.scan_all(base_path, mode)
+        except Exception as e:
+            self.logger.error("Erro ao escanear: %s", e, exc_info=True)
+            messagebox.showerror("❌ Erro", f"Erro ao escanear:\n{e}", parent=self.parent)
+            all_products = []
         if not all_products:
             messagebox.showwarning(
                 "⚠️ Nenhum Produto",
@@ -113,72 +154,8 @@ class RecursiveImportManager:
             return
         self.logger.info("Encontrados: %d produtos", len(all_products))
 
-        # ═══════════════════════════════════════════════════════════════
         # 3 ─ DUPLICATAS (HOT-10: COMPARA COM DATABASE EXISTENTE!)
-        # ═══════════════════════════════════════════════════════════════
-        
-        # 3.1 - Cria dict dos produtos escaneados
-        scanned_db = {p["path"]: {"name": p["name"]} for p in all_products}
-        
-        # 3.2 - COMBINA com database existente (CRUCIAL!)
-        combined_db = {**self.database, **scanned_db}
-        
-        # 3.3 - Detecta duplicatas no conjunto COMPLETO
-        duplicates_result = self.duplicate_detector.find_duplicates(combined_db)
-        
-        self.logger.info(
-            f"🔍 Verificação: {len(self.database)} existentes + "
-            f"{len(scanned_db)} escaneados = {len(combined_db)} total"
-        )
-        
-        # 3.4 - Filtra apenas duplicatas envolvendo produtos NOVOS
-        duplicates = []
-        scanned_paths = set(scanned_db.keys())
-        existing_paths = set(self.database.keys())
-        
-        if duplicates_result:
-            for norm_name, paths in duplicates_result.items():
-                if len(paths) < 2:
-                    continue
-                
-                # Separa existentes vs novos
-                existing_in_group = [p for p in paths if p in existing_paths]
-                new_in_group = [p for p in paths if p in scanned_paths]
-                
-                # Só reporta se tem NOVOS duplicando algo
-                if new_in_group:
-                    # Se tem existente, compara novo vs existente
-                    if existing_in_group:
-                        for new_path in new_in_group:
-                            duplicates.append({
-                                "normalized_name": norm_name,
-                                "name": os.path.basename(new_path),
-                                "existing": {
-                                    "path": existing_in_group[0],
-                                    "name": os.path.basename(existing_in_group[0]),
-                                },
-                                "new": {
-                                    "path": new_path,
-                                    "name": os.path.basename(new_path),
-                                },
-                            })
-                    # Se não tem existente, compara novos entre si
-                    elif len(new_in_group) >= 2:
-                        first_new = new_in_group[0]
-                        for other_new in new_in_group[1:]:
-                            duplicates.append({
-                                "normalized_name": norm_name,
-                                "name": os.path.basename(first_new),
-                                "existing": {
-                                    "path": first_new,
-                                    "name": os.path.basename(first_new),
-                                },
-                                "new": {
-                                    "path": other_new,
-                                    "name": os.path.basename(other_new),
-                                },
-                            })
-        
+        duplicates = self.pipeline.find_conflicts(all_products, self.database)
         products_to_import = all_products
 
         if duplicates:
@@ -190,21 +167,8 @@ class RecursiveImportManager:
                 self.logger.info("Importação cancelada (resolução duplicatas)")
                 return
             
-            # HOT-10b: Processa escolhas por normalized_name
-            skip_paths = set()
-            for dup in duplicates:
-                norm_name = dup["normalized_name"]
-                choice = choices.get(norm_name, "skip")
-                
-                if choice == "skip":  # Pula novo
-                    skip_paths.add(dup["new"]["path"])
-                elif choice == "replace":  # Remove existente + importa novo
-                    existing_path = dup["existing"]["path"]
-                    if existing_path in self.database:
-                        self.logger.info(f"🔄 Substituindo: {os.path.basename(existing_path)}")
-                        self.database.pop(existing_path)
-                # merge: importa ambos (não adiciona a skip_paths)
-            
+            skip_paths, replace_paths = self.pipeline.plan_choices(duplicates, choices)
+            self._replace_existing(replace_paths)
             products_to_import = [
                 p for p in all_products
                 if p["path"] not in skip_paths
@@ -220,7 +184,9 @@ class RecursiveImportManager:
             return
 
         # 4 ─ Existentes por path exato (redundante mas mantido por segurança)
-        new_products, existing_products = self._check_existing(products_to_import)
+        existing_paths = set(self.database)
+        new_products = [p for p in products_to_import if p["path"] not in existing_paths]
+        existing_products = [p for p in products_to_import if p["path"] in existing_paths]
         self.logger.info("Novos: %d | Existentes: %d",
                          len(new_products), len(existing_products))
 
@@ -242,246 +208,166 @@ class RecursiveImportManager:
                                 parent=self.parent)
 
     # ================================================================
-    # SCAN — os três modos
+    # PIPELINE STREAMING
     # ================================================================
 
-    def _scan_products(self, base_path: str, mode: str) -> List[Dict]:
-        """Escaneia e retorna lista de produtos no formato padronizado."""
-        try:
-            if mode == "pure":
-                products = self.scanner.scan_folders_pure(base_path)
-
-            elif mode == "hybrid":
-                products = self.scanner.scan_folders_hybrid(base_path)
-
-            else:  # 'simple' ─ 1 nível, qualquer subpasta direta
-                products = self._scan_simple(base_path)
-
-            stats = self.scanner.get_stats()
-            self.logger.info(
-                "Scan '%s': %d produtos | pastas escaneadas: %d",
-                mode, len(products), stats.get("total_scanned", len(products)),
-            )
-            return products
-
-        except Exception as e:
-            self.logger.error("Erro ao escanear: %s", e, exc_info=True)
-            messagebox.showerror("❌ Erro", f"Erro ao escanear:\n{e}",
-                                 parent=self.parent)
-            return []
-
-    def _scan_simple(self, base_path: str) -> List[Dict]:
+    def _start_streaming(self, mode: str, base_path: str):
+        self._reset_batches()
+        if self.on_show_progress:
+            self.on_show_progress()
+        # list(database): cópia das chaves, na thread principal
+        self.pipeline.start(mode, base_path, list(self.database), self._on_stream_finished)
+
+    def _on_progress(self, imported: int, found: int, text: str):
+        if self.on_update_progress:
+            self.on_update_progress(imported, found, text)
+
+    def _on_stream_finished(self, stats: dict, held: list, cancelled: bool):
+        """Thread do pipeline: esconde o progresso e agenda o encerramento."""
+        if self.on_hide_progress:
+            self.on_hide_progress()
+        if "error" in stats:
+            self._ui(messagebox.showerror, "❌ Erro",
+                     f"Erro na importação:\n{stats['error']}", priority=PRIORITY_HIGH)
+        # Mesma prioridade dos lotes: roda depois do último (FIFO)
+        self._ui(self._finish_streaming, stats, held, cancelled)
+
+    def _reset_batches(self):
+        self._warm_budget = IMPORT_WARMUP_MAX
+        self._last_refresh = 0.0
+
+    def _insert_batch(self, batch: List[tuple]):
         """
-        Modo Simples: lista apenas as subpastas diretas de base_path.
-        Retorna a mesma estrutura de dict que o RecursiveScanner.
+        Thread principal: grava o lote (add_project + commit), aquece capas e
+        estrutura e enfileira para a análise. Os listeners do banco (índices,
+        facetas, ordenação) rodam aqui — nunca em paralelo com o render.
         """
-        products = []
-        try:
-            for item in os.listdir(base_path):
-                item_path = os.path.join(base_path, item)
-                if not os.path.isdir(item_path):
-                    continue
-                products.append({
-                    "path":             item_path,
-                    "name":             item,
-                    "unique_id":        self.scanner.generate_unique_id(
-                                            item_path, base_path),
-                    "has_folder_jpg":   os.path.isfile(
-                                            os.path.join(item_path, "folder.jpg")),
-                    "detection_method": "simple",
-                })
-            self.logger.info("[SCAN SIMPLES] %d pastas encontradas em %s",
-                             len(products), base_path)
-        except PermissionError:
-            self.logger.warning("Sem permissão para acessar: %s", base_path)
-        except Exception as e:
-            self.logger.error("Erro no scan simples: %s", e, exc_info=True)
-        return products
+        paths = []
+        for path, record in batch:
+            if path in self.database:
+                continue  # chegou por outro caminho enquanto o lote esperava
+            self._add_project(path, record)
+            paths.append(path)
+        if not paths:
+            return
+        self._commit()
+        self.imported_paths.extend(paths)  # fila da análise (confirmada no fim)
+
+        if self.structure_resolver:
+            self.structure_resolver.warm(paths)
+        if self._warm_budget > 0 and self.on_warm_thumbnails:
+            self.on_warm_thumbnails(paths[:self._warm_budget])
+            self._warm_budget -= min(self._warm_budget, len(paths))
+
+        now = time.perf_counter()
+        if self.on_batch_imported and now - self._last_refresh >= IMPORT_UI_REFRESH_MS / 1000.0:
+            self._last_refresh = now
+            self.on_batch_imported()
+
+    def _finish_streaming(self, stats: dict, held: list, cancelled: bool):
+        """Thread principal: resolve conflitos retidos e encerra a importação."""
+        if held and cancelled:
+            self.logger.info("⏭️ %d conflito(s) de nome ignorado(s) (cancelado)", len(held))
+        elif held:
+            self._resolve_held(held, stats)
+
+        skipped = stats["existing"] + stats["failed"] + len(held) - stats.pop("resolved", 0)
+        if not stats["found"] and not cancelled:
+            messagebox.showwarning(
+                "⚠️ Nenhum Produto",
+                "Nenhum produto encontrado na pasta selecionada.",
+                parent=self.parent,
+            )
+            return
+        self._complete_import(len(self.imported_paths), skipped, cancelled)
+
+    def _resolve_held(self, held: list, stats: dict):
+        """Diálogo de duplicatas para os conflitos retidos pelo estágio de dedup."""
+        self.logger.warning("⚠️ %d duplicatas encontradas (retidas durante a importação)",
+                            len(held))
+        choices = show_duplicate_resolution(self.parent, [dup for dup, _ in held])
+        if choices is None:
+            self.logger.info("Resolução de duplicatas cancelada — conflitos pulados")
+            return
+
+        skip_paths, replace_paths = self.pipeline.plan_choices([d for d, _ in held], choices)
+        self._replace_existing(replace_paths)
+        resolved = 0
+        for _dup, product in held:
+            if product["path"] not in skip_paths and self._insert_product(product):
+                self.imported_paths.append(product["path"])
+                resolved += 1
+        stats["resolved"] = resolved
+        self._commit()
 
     # ================================================================
     # HELPERS
     # ================================================================
 
-    def _check_existing(self, products: List[Dict]):
-        """Separa produtos novos dos que já existem no database (por path)."""
-        try:
-            existing_paths = set(self.database.keys())
-            new, existing  = [], []
-            for p in products:
-                (existing if p["path"] in existing_paths else new).append(p)
-            return new, existing
-        except Exception as e:
-            self.logger.error("Erro ao verificar existentes: %s", e, exc_info=True)
-            return products, []
+    def _replace_existing(self, paths: List[str]):
+        """Remove os existentes substituídos por produtos novos (escolha "replace")."""
+        for existing_path in paths:
+            if existing_path in self.database:
+                self.logger.info(f"🔄 Substituindo: {os.path.basename(existing_path)}")
+                self._remove_project(existing_path)
+                if existing_path in self.imported_paths:
+                    self.imported_paths.remove(existing_path)
 
     def _import_products(self, products: List[Dict]):
         self.logger.info("Iniciando import de %d produtos em thread", len(products))
-        self.import_thread = threading.Thread(
-            target=self._import_loop,
-            args=(products,),
-            daemon=True,
-        )
-        self.import_thread.start()
-
-    def _import_loop(self, products: List[Dict]):
-        total   = len(products)
-        success = 0
-        failed  = 0
-
-        for i, product in enumerate(products, 1):
-            try:
-                path = product["path"]
-                if path in self.database:
-                    self.logger.debug("Pulando (já existe por path): %s", product["name"])
-                    failed += 1
-                    continue
-
-                # Detecta origin pelo nome da pasta-pai (compatível com + Pastas)
-                origin = self._detect_origin(path, product.get("detection_method", ""))
-
-                self.database[path] = {
-                    "path":         path,
-                    "name":         product["name"],
-                    "origin":       origin,
-                    "cover_image":  product.get("cover_image", ""),
-                    "images":       product.get("images", []),
-                    "analyzed":     False,
-                    "favorite":     False,
-                    "done":         False,
-                    "good":         False,
-                    "bad":          False,
-                    "categories":   [],
-                    "tags":         [],
-                    "added_date":   datetime.now().isoformat(),
-                }
-                success += 1
-                self.imported_paths.append(path)
-                self.logger.debug("[%d/%d] Importado: %s", i, total, product["name"])
-
-            except Exception as e:
-                self.logger.error("Erro ao importar %s: %s",
-                                  product.get("name"), e)
-                failed += 1
-
-        self.logger.info("Import concluído: %d ok | %d falha", success, failed)
-
-        # ══════════════════════════════════════════════════════════════════
-        # ANÁLISE AUTOMÁTICA SEQUENCIAL: categorias+tags → descrições
-        # ══════════════════════════════════════════════════════════════════
-        if success > 0 and self.analysis_manager and self.text_generator:
-            try:
-                self.parent.after(0, lambda: self._ask_auto_analysis(success))
-            except RuntimeError:
-                # Main loop encerrado
-                self.logger.warning("⚠️ Main loop encerrado, pulando auto-analysis")
+        self._reset_batches()
+        self.pipeline.start_products(products, list(self.database), self._on_loop_finished)
+
+    def _on_loop_finished(self, stats: dict, held: list, cancelled: bool):
+        self._ui(self._complete_import, stats["imported"],
+                 stats["existing"] + stats["failed"], cancelled)
+
+    def _insert_product(self, product: Dict) -> bool:
+        """Thread principal: monta o registro e grava no banco. False em caso de erro."""
+        record = self.pipeline.build_record(product)
+        if record is None:
+            return False
+        self._add_project(product["path"], record)
+        return True
+
+    def _complete_import(self, success: int, failed: int, cancelled: bool = False):
+        """Thread principal: oferece análise dos importados ou encerra."""
+        self.post_import.finish(list(self.imported_paths), success, failed,
+                                cancelled, self.on_complete)
+
+    def _ui(self, callback: Optional[Callable], *args,
+            priority: int = PRIORITY_NORMAL, key=None) -> None:
+        """Executa callback de UI na thread principal (via scheduler, se houver)."""
+        if callback is None:
+            return
+        if self.scheduler:
+            self.scheduler.post(callback, *args, priority=priority, key=key)
+            return
+        try:
+            self.parent.after(0, lambda: callback(*args))
+        except RuntimeError:
+            # Main loop encerrado
+            self.logger.warning("⚠️ Main loop encerrado, callback de UI ignorado")
+
+    def _commit(self):
+        if self.db_manager:
+            self.db_manager.commit()
+
+    # Mutações via DatabaseManager (journal + índices), com fallback no dict
+    def _add_project(self, path: str, data: dict):
+        if self.db_manager:
+            self.db_manager.add_project(path, data)
         else:
-            # Callback normal sem análise
-            if self.on_complete:
-                self.parent.after(0, self.on_complete)
-            
-            self.parent.after(0, lambda: messagebox.showinfo(
-                "✅ Importação Concluída",
-                f"Importados: {success} produto(s)\nPulados/erros: {failed}",
-                parent=self.parent,
-            ))
+            self.database[path] = data
 
-    def _ask_auto_analysis(self, success_count: int):
-        """
-        Pergunta se quer analisar automaticamente.
-        Se sim, executa SEQUENCIALMENTE:
-          1. Categorias + Tags (analysis_manager)
-          2. Descrições (text_generator)
-        """
-        response = messagebox.askyesno(
-            "🤖 Análise Automática",
-            f"✅ {success_count} produto(s) importado(s)!\n\n"
-            f"🤔 Deseja analisar AGORA?\n\n"
-            f"SEQUENCIAL:\n"
-            f"1️⃣ Categorias + Tags (IA)\n"
-            f"2️⃣ Descrições (IA)\n\n"
-            f"Isso pode levar alguns minutos.",
-            parent=self.parent,
-        )
-        
-        if response:
-            self.logger.info("🤖 Iniciando análise SEQUENCIAL de %d produtos", len(self.imported_paths))
-            self._run_sequential_analysis()
+    def _remove_project(self, path: str):
+        if self.db_manager:
+            self.db_manager.remove_project(path)
         else:
-            self.logger.info("⏭️ Usuário optou por NÃO analisar")
-            if self.on_complete:
-                self.on_complete()
+            self.database.pop(path, None)
 
-    def _run_sequential_analysis(self):
-        """
-        Executa análise SEQUENCIAL:
-        1. Categorias + Tags para todos
-        2. Aguarda conclusão
-        3. Descrições para todos
-        """
-        def _worker():
-            try:
-                # ETAPA 1: Categorias + Tags
-                self.logger.info("📊 ETAPA 1/2: Analisando categorias e tags...")
-                
-                # Aguarda análise de categorias/tags terminar
-                self._wait_for_analysis_manager()
-                
-                # ETAPA 2: Descrições
-                self.logger.info("📝 ETAPA 2/2: Gerando descrições...")
-                self._generate_descriptions_batch()
-                
-                self.logger.info("✅ Análise sequencial concluída!")
-                
-            except Exception as e:
-                self.logger.error("Erro na análise sequencial: %s", e, exc_info=True)
-            finally:
-                # Callback final
-                if self.on_complete:
-                    self.parent.after(0, self.on_complete)
-        
-        threading.Thread(target=_worker, daemon=True).start()
-        
-        # Inicia análise de categorias/tags (não bloqueia)
-        self.analysis_manager.analyze_batch(self.imported_paths, self.database)
-    
-    def _wait_for_analysis_manager(self):
-        """Aguarda analysis_manager terminar."""
-        import time
-        while self.analysis_manager.is_analyzing:
-            time.sleep(0.5)
-        self.logger.info("✅ Categorias e tags finalizadas")
-    
-    def _generate_descriptions_batch(self):
-        """Gera descrições para os produtos recém-importados."""
-        done = 0
-        for path in self.imported_paths:
-            if not os.path.isdir(path):
-                continue
-            try:
-                desc = self.text_generator.generate_description(path, self.database[path])
-                self.database[path]["ai_description"] = desc
-                done += 1
-                self.logger.debug(f"📝 [{done}/{len(self.imported_paths)}] {os.path.basename(path)}")
-            except Exception as e:
-                self.logger.error(f"Erro ao gerar descrição para {path}: {e}")
-        
-        self.logger.info(f"📝 {done} descrições geradas")
-
-    def _detect_origin(self, product_path: str, detection_method: str) -> str:
-        """
-        Detecta a origem pelo nome da pasta-pai — mesma lógica do ProjectScanner.
-        Modo recursivo usa 'Importação Recursiva' como fallback.
-        """
-        try:
-            parent_folder = os.path.basename(os.path.dirname(product_path))
-            upper = parent_folder.upper()
-            if "CREATIVE" in upper or "FABRICA" in upper:
-                return "Creative Fabrica"
-            elif "ETSY" in upper:
-                return "Etsy"
-            elif detection_method == "simple":
-                return parent_folder or "Importação Simples"
-            else:
-                return parent_folder or "Importação Recursiva"
-        except Exception:
-            return "Desconhecido"
+    def _update_project(self, path: str, **fields):
+        if self.db_manager:
+            self.db_manager.update_project(path, **fields)
+        else:
+            self.database[path].update(fields)
@@ -0,0 +1,88 @@
+"""
+utils/image_decode.py — Decodificação reduzida de imagens para thumbnails.
+
+JPEG: Image.draft() faz o decoder DCT entregar a imagem já em 1/2, 1/4 ou
+1/8 da resolução (a menor escala que ainda cobre o alvo) — um mockup de
+4000px vira ~500px sem decodificar os pixels completos.
+PNG/WebP/outros: não têm draft; Image.reduce() (média de blocos inteiros,
+barata) leva até perto do alvo antes do resample final.
+
+FILTROS (configuráveis em settings):
+    grid  → THUMBNAIL_RESAMPLE (bilinear: rápido, suficiente em 220px)
+    modal → MODAL_RESAMPLE     (lanczos: qualidade na capa grande)
+"""
+from typing import Tuple
+
+from PIL import Image
+
+
+RESAMPLE_FILTERS = {
+    "nearest":  Image.Resampling.NEAREST,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic":  Image.Resampling.BICUBIC,
+    "lanczos":  Image.Resampling.LANCZOS,
+}
+
+
+def resample_filter(name: str) -> Image.Resampling:
+    """Nome do filtro (settings) → constante do Pillow. Padrão: LANCZOS."""
+    return RESAMPLE_FILTERS.get((name or "").lower(), Image.Resampling.LANCZOS)
+
+
+def _fit(src: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """Tamanho de src encaixado em box mantendo proporção (pode ampliar)."""
+    ratio = min(box[0] / src[0], box[1] / src[1])
+    return max(1, int(src[0] * ratio)), max(1, int(src[1] * ratio))
+
+
+def _reduced(img: Image.Image, target: Tuple[int, int], reducing_gap: float) -> Image.Image:
+    """
+    Decodifica `img` (recém-aberta) na menor escala >= target * reducing_gap.
+    """
+    want = (int(target[0] * reducing_gap), int(target[1] * reducing_gap))
+    if img.format == "JPEG":
+        img.draft("L" if img.mode == "L" else "RGB", want)
+    img.load()
+    if img.mode == "P":
+        img = img.convert("RGBA")
+
+    factor = min(img.width // max(1, want[0]), img.height // max(1, want[1]))
+    if factor >= 2:
+        img = img.reduce(factor)
+    return img
+
+
+def decode_thumbnail(
+    path: str,
+    size: Tuple[int, int],
+    resample: str = "bilinear",
+    reducing_gap: float = 1.5,
+) -> Image.Image:
+    """
+    Thumbnail que cabe em `size` (nunca amplia), via decodificação reduzida.
+
+    Args:
+        path: Arquivo de imagem
+        size: Caixa máxima (largura, altura)
+        resample: Nome do filtro final (ver RESAMPLE_FILTERS)
+        reducing_gap: Folga da decodificação reduzida sobre o alvo
+                      (1.0 = mais rápido; maior = mais qualidade)
+    """
+    img = Image.open(path)
+    target = _fit(img.size, size)
+    if target[0] >= img.width or target[1] >= img.height:
+        img.load()
+        return img
+
+    img = _reduced(img, target, reducing_gap)
+    if img.size != target:
+        img = img.resize(target, resample_filter(resample))
+    return img
+
+
+def resize_fit(img: Image.Image, box: Tuple[int, int], resample: str = "lanczos") -> Image.Image:
+    """`img` (já decodificada) encaixada em `box` (amplia se menor)."""
+    target = _fit(img.size, box)
+    if img.size == target:
+        return img
+    return img.resize(target, resample_filter(resample))
@@ -7,12 +7,33 @@ FUNCIONALIDADES:
   3. Geração de ID único baseado em hash do caminho relativo
   4. Detecção de subpastas técnicas (cdr, svg, jpg, imagens, vetores)
   5. Validação de arquivos de projeto válidos
+
+MOTOR (PERF):
+  - os.scandir: tipo de cada entrada vem do DirEntry (sem isfile/isdir
+    por item — em NAS cada stat é uma ida e volta na rede)
+  - Subárvores irmãs percorridas em paralelo (SCAN_MAX_WORKERS threads)
+  - Streaming: on_product(produto) a cada produto achado, ou iter_scan()
+  - Lista final na mesma ordem do percurso sequencial (profundidade,
+    ordem do scandir) — independente de qual thread terminou antes
+
+RESCAN INCREMENTAL (com snapshot=ScanSnapshot):
+  - Produtos com mtime igual ao do scan anterior não são relistados nem
+    abertos — o mtime vem do DirEntry da pasta pai (ver utils/scan_snapshot.py)
+  - last_delta = {'added', 'removed', 'changed'} em relação ao scan anterior
+    do mesmo modo e pasta base
 """
 
 import os
 import hashlib
-from typing import List, Dict, Set
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from config.settings import SCAN_MAX_WORKERS
 from utils.logging_setup import LOGGER
+from utils.scan_snapshot import ScanSnapshot
 
 
 # Extensões válidas de arquivos de projeto
@@ -28,6 +49,8 @@ TECHNICAL_SUBFOLDERS = {
     'backup', 'temp', 'cache', '.git', '__pycache__'
 }
 
+_DONE = object()  # fim do stream em iter_scan()
+
 
 class RecursiveScanner:
     """
@@ -36,18 +59,32 @@ class RecursiveScanner:
     Suporta dois modos:
     - PURO: Apenas pastas com folder.jpg (rígido, controle total)
     - HÍBRIDO: folder.jpg + fallback inteligente (flexível, pega mais)
+
+    on_product(produto): chamado (na thread do scan) a cada produto
+    encontrado, antes do fim do percurso.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = SCAN_MAX_WORKERS,
+                 snapshot: Optional[ScanSnapshot] = None):
         self.logger = LOGGER
+        self.max_workers = max(1, max_workers)
+        self.snapshot = snapshot
         self.found_products = []
         self.skipped_folders = []
+        self.last_delta: Optional[Dict[str, List[str]]] = None
+        self.on_product: Optional[Callable[[Dict], None]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._previous_dirs: Optional[Dict[str, list]] = None
+        self._current_dirs: Optional[Dict[str, list]] = None
+        self._trusted_before = 0
         self.stats = {
             'total_scanned': 0,
             'products_found': 0,
             'with_folder_jpg': 0,
             'via_fallback': 0,
-            'technical_skipped': 0
+            'technical_skipped': 0,
+            'reused_products': 0
         }
 
     def scan_folders_pure(self, base_path: str) -> List[Dict]:
@@ -57,7 +94,7 @@ class RecursiveScanner:
         if not os.path.exists(base_path):
             self.logger.error("Pasta base não existe: %s", base_path)
             return []
-        self._scan_recursive(base_path, base_path, mode='pure')
+        self._scan_tree(base_path, mode='pure')
         self.logger.info(
             "[SCAN PURO] Concluído: %d produtos, %d pastas escaneadas",
             self.stats['products_found'], self.stats['total_scanned']
@@ -71,7 +108,7 @@ class RecursiveScanner:
         if not os.path.exists(base_path):
             self.logger.error("Pasta base não existe: %s", base_path)
             return []
-        self._scan_recursive(base_path, base_path, mode='hybrid')
+        self._scan_tree(base_path, mode='hybrid')
         self.logger.info(
             "[SCAN HÍBRIDO] Concluído: %d produtos (%d folder.jpg, %d fallback)",
             self.stats['products_found'],
@@ -80,9 +117,49 @@ class RecursiveScanner:
         )
         return self.found_products
 
+    def iter_scan(self, base_path: str, mode: str = 'hybrid') -> Iterator[Dict]:
+        """
+        Streaming: produz cada produto assim que é encontrado (ordem de
+        descoberta). O scan roda em thread própria; interromper a iteração
+        não para o scan — use stop().
+        """
+        results: "queue.Queue" = queue.Queue()
+        previous = self.on_product
+
+        def _emit(product: Dict) -> None:
+            results.put(product)
+            if previous:
+                previous(product)
+
+        def _run() -> None:
+            self.on_product = _emit
+            try:
+                if mode == 'pure':
+                    self.scan_folders_pure(base_path)
+                else:
+                    self.scan_folders_hybrid(base_path)
+            finally:
+                self.on_product = previous
+                results.put(_DONE)
+
+        threading.Thread(target=_run, daemon=True, name="RecursiveScan").start()
+        while True:
+            product = results.get()
+            if product is _DONE:
+                return
+            yield product
+
+    def stop(self) -> None:
+        """Interrompe o scan em andamento (produtos já achados são mantidos)."""
+        self._stop.set()
+
     def generate_unique_id(self, product_path: str, base_path: str) -> str:
         try:
-            relative = os.path.relpath(product_path, base_path)
+            prefix = base_path.rstrip('\\/') + os.sep
+            if product_path.startswith(prefix):  # caso comum: sem relpath (lento)
+                relative = product_path[len(prefix):]
+            else:
+                relative = os.path.relpath(product_path, base_path)
             normalized = relative.lower().replace('\\', '/')
             return hashlib.md5(normalized.encode('utf-8')).hexdigest()
         except Exception as e:
@@ -90,80 +167,224 @@ class RecursiveScanner:
             return hashlib.md5(product_path.encode('utf-8')).hexdigest()
 
     def get_stats(self) -> Dict:
-        return self.stats.copy()
+        with self._lock:
+            return self.stats.copy()
 
     def _reset_stats(self):
+        self._stop.clear()
         self.found_products = []
         self.skipped_folders = []
+        self.last_delta = None
         self.stats = {
             'total_scanned': 0,
             'products_found': 0,
             'with_folder_jpg': 0,
             'via_fallback': 0,
-            'technical_skipped': 0
+            'technical_skipped': 0,
+            'reused_products': 0
         }
 
-    def _scan_recursive(self, current_path: str, base_path: str, mode: str):
-        try:
-            try:
-                items = os.listdir(current_path)
-            except PermissionError:
-                self.logger.warning("Sem permissão: %s", current_path)
-                return
+    # ------------------------------------------------------------------
+    # Motor
+    # ------------------------------------------------------------------
+
+    def _scan_tree(self, base_path: str, mode: str) -> None:
+        """
+        Percorre base_path com um pool limitado. Cada tarefa desce na própria
+        subárvore (pilha local) e repassa o fundo da pilha ao pool sempre que
+        houver worker ocioso (submit por pasta custaria mais que o scandir).
+        Cada produto carrega a posição no percurso (índices das entradas ao
+        longo do caminho) para a lista final sair na ordem sequencial.
+        """
+        if self.snapshot is not None:
+            key = ScanSnapshot.key(mode, base_path)
+            self._trusted_before, self._previous_dirs = self.snapshot.get(key)
+            self._current_dirs = {}
+            started = time.time_ns()
+
+        found: List[Tuple[Tuple[int, ...], Dict]] = []
+        outstanding = [1]
+        all_done = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix="RecursiveScan") as pool:
 
-            files = []
-            subdirs = []
-            for item in items:
-                item_path = os.path.join(current_path, item)
-                if os.path.isfile(item_path):
-                    files.append(item)
-                elif os.path.isdir(item_path):
-                    subdirs.append(item)
+            def _task(path: str, order: Tuple[int, ...], mtime: Optional[int]) -> None:
+                try:
+                    stack = deque([(path, order, mtime)])
+                    while stack and not self._stop.is_set():
+                        # Worker ocioso leva o fundo da pilha (subárvores maiores)
+                        while len(stack) > 1:
+                            with self._lock:
+                                share = outstanding[0] < self.max_workers
+                                if share:
+                                    outstanding[0] += 1
+                            if not share:
+                                break
+                            pool.submit(_task, *stack.popleft())
+                        path, order, mtime = stack.pop()
+                        for child, child_order, child_mtime, product in self._visit(
+                                path, order, mtime, base_path, mode):
+                            if product is not None:
+                                with self._lock:
+                                    found.append((order, product))
+                                continue
+                            stack.append((child, child_order, child_mtime))
+                finally:
+                    with self._lock:
+                        outstanding[0] -= 1
+                        finished = outstanding[0] == 0
+                    if finished:
+                        all_done.set()
 
-            self.stats['total_scanned'] += 1
+            pool.submit(_task, base_path, (), None)
+            all_done.wait()
 
-            folder_name = os.path.basename(current_path).lower()
-            if self._is_technical_subfolder(folder_name):
-                self.stats['technical_skipped'] += 1
+        found.sort(key=lambda item: item[0])
+        self.found_products = [product for _order, product in found]
+
+        if self.snapshot is not None:
+            if not self._stop.is_set():  # scan interrompido não vira referência
+                self.last_delta = self._delta()
+                unchanged = (not any(self.last_delta.values())
+                             and self.stats['reused_products'] == len(self._current_dirs)
+                             == len(self._previous_dirs))
+                if not unchanged:  # nada relistado: snapshot em disco continua válido
+                    self.snapshot.put(key, started, self._current_dirs)
+                self.logger.info(
+                    "[SCAN] Delta: +%d / -%d / ~%d produtos (%d sem relistar)",
+                    len(self.last_delta['added']), len(self.last_delta['removed']),
+                    len(self.last_delta['changed']), self.stats['reused_products']
+                )
+            self._previous_dirs = self._current_dirs = None
+
+    def _visit(self, current_path: str, order: Tuple[int, ...], mtime: Optional[int],
+               base_path: str, mode: str):
+        """
+        Examina uma pasta. Produz (None, None, None, produto) se ela for
+        produto, senão (subpasta, ordem, mtime, None) para cada subpasta a
+        percorrer (mtime só com snapshot, vindo do DirEntry).
+        """
+        try:
+            name = os.path.basename(current_path)
+            technical = self._is_technical_subfolder(name.lower())
+            listing = self._listing(current_path, mtime, mode, technical)
+            if listing is None:
                 return
+            has_folder_jpg, files_are_project, subdirs = listing
 
             is_product = False
             detection_method = None
-            has_folder_jpg = 'folder.jpg' in [f.lower() for f in files]
-
-            if has_folder_jpg:
-                is_product = True
-                detection_method = 'folder_jpg'
-                self.stats['with_folder_jpg'] += 1
-            elif mode == 'hybrid':
-                if self._has_project_files(files):
+            if not technical:
+                if has_folder_jpg:
+                    is_product = True
+                    detection_method = 'folder_jpg'
+                elif mode == 'hybrid' and files_are_project:
                     is_product = True
                     detection_method = 'fallback'
-                    self.stats['via_fallback'] += 1
+
+            with self._lock:
+                self.stats['total_scanned'] += 1
+                if technical:
+                    self.stats['technical_skipped'] += 1
+                elif is_product:
+                    key = 'with_folder_jpg' if detection_method == 'folder_jpg' else 'via_fallback'
+                    self.stats[key] += 1
+                    self.stats['products_found'] += 1
+            if technical:
+                return
 
             if is_product:
-                self.found_products.append({
+                product = {
                     'path': current_path,
-                    'name': os.path.basename(current_path),
+                    'name': name,
                     'unique_id': self.generate_unique_id(current_path, base_path),
                     'has_folder_jpg': has_folder_jpg,
                     'detection_method': detection_method
-                })
-                self.stats['products_found'] += 1
+                }
+                if self.on_product:
+                    try:
+                        self.on_product(product)
+                    except Exception as e:
+                        self.logger.error("Erro no callback de produto (%s): %s", current_path, e)
+                yield None, None, None, product
                 return
 
-            for subdir in subdirs:
-                self._scan_recursive(os.path.join(current_path, subdir), base_path, mode)
+            for index, subdir, subdir_mtime in subdirs:
+                yield subdir, order + (index,), subdir_mtime, None
 
         except Exception as e:
             self.logger.error("Erro ao escanear %s: %s", current_path, e)
 
+    def _listing(self, current_path: str, mtime: Optional[int], mode: str, technical: bool):
+        """
+        (tem folder.jpg, tem arquivos de projeto, [(índice, subpasta, mtime)])
+        da pasta, ou None sem permissão.
+
+        Com snapshot: produto do scan anterior com o mesmo mtime (lido do
+        DirEntry da pasta pai) é reaproveitado sem tocar na pasta.
+        """
+        if self._current_dirs is None:
+            return self._scandir(current_path, False)
+
+        if technical:
+            return False, False, []  # descartada pelo nome, nada a listar
+
+        cached = self._previous_dirs.get(current_path)
+        if cached is not None and cached[0] == mtime and mtime < self._trusted_before:
+            with self._lock:
+                self.stats['reused_products'] += 1
+                self._current_dirs[current_path] = cached
+            return cached[1], cached[2], []
+
+        if mtime is None:  # pasta base: sem DirEntry do pai
+            mtime = os.stat(current_path).st_mtime_ns
+        listing = self._scandir(current_path, True)
+        if listing is None:
+            return None
+        has_folder_jpg, files_are_project, _subdirs = listing
+        if has_folder_jpg or (mode == 'hybrid' and files_are_project):
+            with self._lock:
+                self._current_dirs[current_path] = [mtime, has_folder_jpg, files_are_project]
+        return listing
+
+    def _scandir(self, current_path: str, with_mtime: bool):
+        files_are_project = False
+        has_folder_jpg = False
+        subdirs = []
+        try:
+            with os.scandir(current_path) as entries:
+                for index, entry in enumerate(entries):
+                    try:
+                        if entry.is_file():
+                            name = entry.name.lower()
+                            if name == 'folder.jpg':
+                                has_folder_jpg = True
+                            elif not files_are_project:
+                                files_are_project = os.path.splitext(name)[1] in VALID_EXTENSIONS
+                        elif entry.is_dir():
+                            # No Windows o stat do DirEntry vem da própria listagem
+                            mtime = entry.stat().st_mtime_ns if with_mtime else None
+                            subdirs.append((index, entry.path, mtime))
+                    except OSError:
+                        continue
+        except PermissionError:
+            self.logger.warning("Sem permissão: %s", current_path)
+            return None
+        return has_folder_jpg, files_are_project, subdirs
+
+    def _delta(self) -> Dict[str, List[str]]:
+        """Produtos adicionados/removidos/alterados desde o scan anterior."""
+        before = self._previous_dirs
+        after = self._current_dirs
+        return {
+            'added': sorted(after.keys() - before.keys()),
+            'removed': sorted(before.keys() - after.keys()),
+            'changed': sorted(
+                path for path in after.keys() & before.keys()
+                if after[path] != before[path]
+            ),
+        }
+
     def _is_technical_subfolder(self, folder_name: str) -> bool:
         return folder_name in TECHNICAL_SUBFOLDERS
-
-    def _has_project_files(self, files: List[str]) -> bool:
-        for file in files:
-            ext = os.path.splitext(file.lower())[1]
-            if ext in VALID_EXTENSIONS:
-                return True
-        return False
@@ -0,0 +1,95 @@
+"""
+scan_snapshot.py — Snapshot persistente de pastas escaneadas (rescan incremental).
+
+Usado pelo RecursiveScanner (importação). Guarda, por (modo, pasta base),
+o mtime das pastas cujo conteúdo direto decide o resultado:
+
+    dirs[produto] = [mtime_ns, tem_folder_jpg, tem_arquivos_de_projeto]
+
+O mtime de uma pasta muda quando entradas DENTRO dela são criadas,
+removidas ou renomeadas — não quando algo mais fundo muda. Por isso pular
+subárvores inteiras perderia produtos novos em níveis profundos: pastas
+intermediárias são sempre relistadas, e o que se economiza é abrir cada
+produto (a maioria das pastas). O mtime do produto vem do DirEntry da
+listagem do pai — no Windows/SMB sem nenhuma chamada extra.
+
+CORRIDA (racy mtime): pastas com mtime a menos de SCAN_SNAPSHOT_RACY_S do
+início do scan anterior são relistadas — podem ter mudado no mesmo "tick"
+do sistema de arquivos.
+
+Uma entrada por (modo, pasta base); gravação atômica (tmp + rename).
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Tuple
+
+from config.settings import SCAN_SNAPSHOT_FILE, SCAN_SNAPSHOT_RACY_S
+from utils.logging_setup import LOGGER
+
+
+class ScanSnapshot:
+    """
+    Armazena snapshots de scans por chave (ver key()).
+    """
+
+    def __init__(self, filepath: str = SCAN_SNAPSHOT_FILE):
+        self.filepath = filepath
+        self.logger = LOGGER
+        self._lock = threading.Lock()
+        self._data = None  # carregado sob demanda
+
+    @staticmethod
+    def key(mode: str, base_path: str) -> str:
+        return f"{mode}|{os.path.normcase(os.path.abspath(base_path))}"
+
+    def get(self, key: str) -> Tuple[int, Dict[str, list]]:
+        """
+        Returns:
+            (trusted_before_ns, dirs): entradas com mtime >= trusted_before_ns
+            não são confiáveis; (0, {}) se não houver snapshot
+        """
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry:
+            return 0, {}
+        trusted_before = entry["scanned_at"] - int(SCAN_SNAPSHOT_RACY_S * 1e9)
+        return trusted_before, entry["dirs"]
+
+    def put(self, key: str, scanned_at_ns: int, dirs: Dict[str, list]) -> None:
+        """Substitui o snapshot da chave e grava em disco."""
+        with self._lock:
+            self._load()[key] = {"scanned_at": scanned_at_ns, "dirs": dirs}
+            self._save()
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._save()
+
+    def _load(self) -> dict:
+        if self._data is None:
+            self._data = {}
+            if os.path.exists(self.filepath):
+                try:
+                    with open(self.filepath, "r", encoding="utf-8") as f:
+                        self._data = json.load(f)
+                except (OSError, ValueError) as e:
+                    self.logger.warning("Snapshot de scan ilegível (%s): %s — scan completo",
+                                        self.filepath, e)
+        return self._data
+
+    def _save(self) -> None:
+        tmp_file = self.filepath + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_file, self.filepath)
+        except OSError as e:
+            self.logger.error("Falha ao salvar snapshot de scan em %s: %s", self.filepath, e)
+            try:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+            except OSError:
+                pass